@@ -688,11 +688,13 @@ def scheduler_run_once(verbose: bool, log_level: Optional[str], force: bool, log
             from datetime import datetime, timedelta
             
             # 모든 스케줄의 다음 실행 시간을 과거로 설정
-            for schedule_id in orchestrator.scheduler.schedules:
+            for schedule_id in list(orchestrator.scheduler.schedules):
                 schedule = orchestrator.scheduler.get_schedule(schedule_id)
                 if schedule and schedule.enabled:
-                    # 현재 시간보다 1분 전으로 설정하여 즉시 실행되도록 함
-                    schedule.next_run = datetime.now() - timedelta(minutes=1)
+                    # 현재 시간보다 1분 전으로 설정하여 즉시 실행되도록 함 (스케줄러 실행 대기열에도 반영)
+                    orchestrator.scheduler.update_schedule(
+                        schedule_id, next_run=datetime.now() - timedelta(minutes=1)
+                    )
         
         # 스케줄러 한 번 실행
         console.print("[bold blue]스케줄 실행 시작...[/]")
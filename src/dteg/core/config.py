@@ -10,6 +10,9 @@ from typing import Any, Dict, List, Optional, Union
 import yaml
 from pydantic import BaseModel, Field, ValidationError
 
+# libyaml C 바인딩이 있으면 사용 (순수 파이썬 로더보다 파싱이 훨씬 빠름)
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 class ConfigValidationError(Exception):
     """설정 파일 검증 오류"""
@@ -309,7 +312,7 @@ def load_config(config_path: str, runtime_variables: Optional[Dict[str, Any]] =
     """
     try:
         with open(config_path, "r", encoding="utf-8") as f:
-            config_dict = yaml.safe_load(f)
+            config_dict = yaml.load(f, Loader=_YAML_LOADER)
     except FileNotFoundError:
         raise FileNotFoundError(f"설정 파일을 찾을 수 없습니다: {config_path}")
     except yaml.YAMLError as e:
@@ -21,7 +21,7 @@ class ExecutionStatus(Enum):
 
 @dataclass
 class MetricsTracker:
-    """성능 및 데이터 관련 지표 추적"""
+    """성능 및 데이터 관련 지표 추적 (시작/종료 시각은 시계 변경의 영향을 받지 않는 time.monotonic 기준)"""
     start_time: Optional[float] = None
     end_time: Optional[float] = None
     rows_processed: int = 0
@@ -31,11 +31,11 @@ class MetricsTracker:
     
     def start(self) -> None:
         """측정 시작"""
-        self.start_time = time.time()
+        self.start_time = time.monotonic()
     
     def stop(self) -> None:
         """측정 종료"""
-        self.end_time = time.time()
+        self.end_time = time.monotonic()
     
     def get_execution_time(self) -> Optional[float]:
         """실행 시간(초) 계산
@@ -1,15 +1,91 @@
 """
 데이터를 MySQL 데이터베이스에 저장하기 위한 Loader 구현
 """
+import atexit
+import threading
 import time
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import pandas as pd
 import pymysql
 from pymysql.cursors import DictCursor
 from sqlalchemy import create_engine, inspect
+from sqlalchemy.engine import Engine
 
 from dteg.loaders.base import Loader, IfExists
+from dteg.utils import arrow_shm
+
+# mysqlclient(C 확장) 드라이버를 선택적으로 가져오기 (설치되어 있으면)
+try:
+    import MySQLdb
+    from MySQLdb.cursors import DictCursor as MySQLdbDictCursor
+    MYSQLCLIENT_AVAILABLE = True
+except ImportError:
+    MYSQLCLIENT_AVAILABLE = False
+
+# 드라이버 이름별 SQLAlchemy 방언
+_DIALECTS = {
+    "mysqlclient": "mysql+mysqldb",
+    "pymysql": "mysql+pymysql",
+}
+
+# 연결 정보별로 공유하는 SQLAlchemy 엔진 (방언 로딩/커넥션 풀 생성 비용 절감)
+_ENGINES: Dict[Tuple[Any, ...], Engine] = {}
+_ENGINES_LOCK = threading.Lock()
+
+
+def _q(identifier: str) -> str:
+    """MySQL 식별자(컬럼, 인덱스 이름)를 백틱으로 인용
+
+    Args:
+        identifier: 식별자
+
+    Returns:
+        인용된 식별자 (예: `col`)
+    """
+    return "`" + str(identifier).replace("`", "``") + "`"
+
+
+def _q_table(table: str) -> str:
+    """테이블 이름 인용 (database.table 형식 지원)
+
+    Args:
+        table: 테이블 이름
+
+    Returns:
+        인용된 테이블 이름 (예: `db`.`table`)
+    """
+    return ".".join(_q(part) for part in table.split("."))
+
+
+def _get_or_create_engine(connection_string: str, connect_args: Dict[str, Any]) -> Engine:
+    """연결 정보에 해당하는 공유 엔진을 반환하고, 없으면 생성
+
+    Args:
+        connection_string: SQLAlchemy 연결 문자열
+        connect_args: DBAPI 연결 옵션
+
+    Returns:
+        SQLAlchemy 엔진
+    """
+    key = (connection_string, tuple(sorted(connect_args.items())))
+    engine = _ENGINES.get(key)
+    if engine is None:
+        with _ENGINES_LOCK:
+            engine = _ENGINES.get(key)
+            if engine is None:
+                engine = create_engine(connection_string, connect_args=connect_args)
+                _ENGINES[key] = engine
+    return engine
+
+
+@atexit.register
+def _dispose_engines() -> None:
+    """프로세스 종료 시 공유 엔진의 커넥션 풀 정리"""
+    with _ENGINES_LOCK:
+        for engine in _ENGINES.values():
+            engine.dispose()
+        _ENGINES.clear()
 
 
 class MySQLLoader(Loader):
@@ -35,11 +111,38 @@ class MySQLLoader(Loader):
         charset: 문자셋 (기본값: "utf8mb4")
         retry_count: 연결 재시도 횟수 (기본값: 3)
         connect_timeout: 연결 타임아웃 (초, 기본값: 10)
+        read_timeout: 읽기 타임아웃 (초, 기본값: 없음)
+        write_timeout: 쓰기 타임아웃 (초, 기본값: 없음)
+        max_allowed_packet: 클라이언트 최대 패킷 크기 (바이트, 기본값: 1GB)
+        bulk_insert_buffer_size: 세션 bulk_insert_buffer_size (바이트, 기본값: 256MB)
+        defer_checks: 기존 테이블에 대량 적재(batch_size 초과) 시 unique/foreign key 검사를 적재 후로 미룸 (기본값: True)
+        disable_keys: 검사를 미룰 때 ALTER TABLE ... DISABLE KEYS로 비고유 인덱스 갱신도 미룸
+            (MyISAM 전용, ALTER 권한 필요, 기본값: False)
+        driver: MySQL 드라이버 (기본값: "auto")
+            - auto: mysqlclient가 설치되어 있으면 사용, 없으면 pymysql
+            - mysqlclient: libmysqlclient 기반 C 확장 드라이버
+            - pymysql: 순수 파이썬 드라이버
+        compress: 프로토콜 압축 사용 여부 (mysqlclient 전용, 기본값: False)
+        truncate_even_if_empty: truncate 모드에서 빈 데이터여도 테이블을 비울지 여부 (기본값: False)
     """
 
     # 플러그인 등록용 타입 식별자
     TYPE = "mysql"
 
+    # 대용량 INSERT 배치를 위한 기본 세션/패킷 설정
+    DEFAULT_MAX_ALLOWED_PACKET = 1024 * 1024 * 1024
+    DEFAULT_BULK_INSERT_BUFFER_SIZE = 256 * 1024 * 1024
+
+    # 대량 적재 전후로 실행할 세션 설정 (적재 중 검사 지연)
+    _DEFER_CHECKS_SQL = (
+        "SET SESSION unique_checks = 0",
+        "SET SESSION foreign_key_checks = 0",
+    )
+    _RESTORE_CHECKS_SQL = (
+        "SET SESSION foreign_key_checks = 1",
+        "SET SESSION unique_checks = 1",
+    )
+
     def __init__(self, config: Dict[str, Any]) -> None:
         """
         Args:
@@ -68,6 +171,14 @@ class MySQLLoader(Loader):
                     f"잘못된 if_exists 값: {if_exists}. 유효한 값: {valid_options}"
                 )
 
+        # driver 값 검증
+        driver = self.config.get("driver", "auto")
+        valid_drivers = ["auto"] + list(_DIALECTS)
+        if driver not in valid_drivers:
+            raise ValueError(f"잘못된 driver 값: {driver}. 유효한 값: {valid_drivers}")
+        if driver == "mysqlclient" and not MYSQLCLIENT_AVAILABLE:
+            raise ValueError("mysqlclient 드라이버가 설치되어 있지 않습니다")
+
     def _setup(self) -> None:
         """MySQL 연결 및 엔진 설정"""
         # 초기화
@@ -83,19 +194,55 @@ class MySQLLoader(Loader):
         self.table = self.config["table"]
         self.charset = self.config.get("charset", "utf8mb4")
 
-        # SQLAlchemy 엔진 생성
+        # 드라이버 결정 (auto인 경우 C 확장 드라이버 우선)
+        driver = self.config.get("driver", "auto")
+        if driver == "auto":
+            driver = "mysqlclient" if MYSQLCLIENT_AVAILABLE else "pymysql"
+        self.driver = driver
+
+        # SQLAlchemy 엔진 (같은 연결 정보의 Loader끼리 공유)
         connection_string = (
-            f"mysql+pymysql://{self.user}:{self.password}"
+            f"{_DIALECTS[self.driver]}://{self.user}:{self.password}"
             f"@{self.host}:{self.port}/{self.database}"
             f"?charset={self.charset}"
         )
-        self.engine = create_engine(connection_string)
+        self.engine = _get_or_create_engine(connection_string, self._connect_args())
+
+    def _connect_args(self) -> Dict[str, Any]:
+        """DBAPI 연결과 SQLAlchemy 엔진에 공통으로 전달할 연결 옵션
 
-    def _get_connection(self) -> pymysql.Connection:
+        연결 직후 init_command로 세션 버퍼 크기를 설정합니다.
+        pymysql은 클라이언트 측 max_allowed_packet을 키워 큰 INSERT 배치를
+        한 번에 보내고, mysqlclient는 설정 시 프로토콜 압축을 사용합니다.
+        (pymysql은 프로토콜 압축을 지원하지 않음)
+
+        Returns:
+            연결 옵션 딕셔너리
+        """
+        bulk_insert_buffer_size = self.config.get(
+            "bulk_insert_buffer_size", self.DEFAULT_BULK_INSERT_BUFFER_SIZE
+        )
+        connect_args: Dict[str, Any] = {
+            "init_command": (
+                f"SET SESSION bulk_insert_buffer_size = {int(bulk_insert_buffer_size)}"
+            ),
+        }
+        if self.driver == "pymysql":
+            connect_args["max_allowed_packet"] = self.config.get(
+                "max_allowed_packet", self.DEFAULT_MAX_ALLOWED_PACKET
+            )
+        elif self.config.get("compress", False):
+            connect_args["compress"] = True
+        for key in ("read_timeout", "write_timeout"):
+            if key in self.config:
+                connect_args[key] = self.config[key]
+        return connect_args
+
+    def _get_connection(self) -> Any:
         """MySQL 데이터베이스 연결 생성 또는 재사용
 
         Returns:
-            MySQL 연결 객체
+            MySQL 연결 객체 (pymysql 또는 mysqlclient)
 
         Raises:
             RuntimeError: 연결 실패 시
@@ -104,10 +251,17 @@ class MySQLLoader(Loader):
         max_retries = self.config.get("retry_count", 3)
         last_error = None
 
+        if self.driver == "mysqlclient":
+            connect, cursorclass = MySQLdb.connect, MySQLdbDictCursor
+            errors: Tuple[type, ...] = (MySQLdb.MySQLError,)
+        else:
+            connect, cursorclass = pymysql.connect, DictCursor
+            errors = (pymysql.MySQLError, pymysql.Error)
+
         while retry_count <= max_retries:
             try:
                 if self.connection is None or not self.connection.open:
-                    self.connection = pymysql.connect(
+                    self.connection = connect(
                         host=self.config["host"],
                         port=self.config.get("port", 3306),
                         user=self.config["user"],
@@ -115,10 +269,11 @@ class MySQLLoader(Loader):
                         database=self.config["database"],
                         charset=self.config.get("charset", "utf8mb4"),
                         connect_timeout=self.config.get("connect_timeout", 10),
-                        cursorclass=DictCursor  # 딕셔너리 형태로 결과 반환
+                        cursorclass=cursorclass,  # 딕셔너리 형태로 결과 반환
+                        **self._connect_args()
                     )
                 return self.connection
-            except (pymysql.MySQLError, pymysql.Error) as e:
+            except errors as e:
                 retry_count += 1
                 last_error = e
 
@@ -131,11 +286,11 @@ class MySQLLoader(Loader):
         # 모든 재시도 실패
         raise RuntimeError(f"MySQL 연결 실패 (최대 재시도 횟수 초과): {last_error}")
 
-    def load(self, data: pd.DataFrame) -> int:
+    def load(self, data: Union[pd.DataFrame, arrow_shm.SharedFrameHandle]) -> int:
         """데이터를 MySQL 테이블에 저장
 
         Args:
-            data: 저장할 데이터
+            data: 저장할 데이터 (다른 프로세스가 공유 메모리에 기록한 핸들도 가능)
 
         Returns:
             저장된 행 수
@@ -144,18 +299,36 @@ class MySQLLoader(Loader):
             RuntimeError: 데이터 저장 중 오류 발생
         """
         try:
+            # 공유 메모리 핸들인 경우 pickle 없이 DataFrame으로 복원
+            if isinstance(data, arrow_shm.SharedFrameHandle):
+                data = arrow_shm.get(data)
+
             table = self.config["table"]
             if_exists = self.config.get("if_exists", IfExists.REPLACE.value)
             batch_size = self.config.get("batch_size", 10000)
 
+            # 빈 데이터는 연결 없이 바로 반환 (필요 시 truncate만 수행)
+            if data is None or data.empty:
+                if (
+                    if_exists == IfExists.TRUNCATE.value
+                    and self.config.get("truncate_even_if_empty", False)
+                ):
+                    self._truncate_table(table)
+                return 0
+
             # truncate 모드 처리
             if if_exists == IfExists.TRUNCATE.value:
-                connection = self._get_connection()
-                with connection.cursor() as cursor:
-                    cursor.execute(f"TRUNCATE TABLE {table}")
-                connection.commit()
+                self._truncate_table(table)
                 if_exists = IfExists.APPEND.value  # truncate 후 append로 처리
 
+            # 기존 테이블에 대량 적재하는 경우 검사를 미루고 한 트랜잭션으로 처리
+            if (
+                if_exists == IfExists.APPEND.value
+                and len(data) > batch_size
+                and self.config.get("defer_checks", True)
+            ):
+                return self._load_with_deferred_checks(data, table, batch_size)
+
             # SQLAlchemy를 통한 데이터 적재
             return self._load_with_sqlalchemy(
                 data, table, if_exists, batch_size
@@ -163,8 +336,89 @@ class MySQLLoader(Loader):
         except Exception as e:
             raise RuntimeError(f"MySQL 데이터 저장 중 오류 발생: {e}")
 
+    def _truncate_table(self, table: str) -> None:
+        """테이블의 모든 데이터 삭제
+
+        Args:
+            table: 테이블 이름
+        """
+        connection = self._get_connection()
+        with connection.cursor() as cursor:
+            cursor.execute(f"TRUNCATE TABLE {_q_table(table)}")
+        connection.commit()
+
+    def _load_with_deferred_checks(
+        self, data: pd.DataFrame, table: str, batch_size: int
+    ) -> int:
+        """unique/foreign key 검사를 미룬 채 데이터 적재
+
+        설정 변경, 데이터 적재, 설정 복원이 모두 같은 연결(세션)에서 실행되어야
+        하므로 엔진에서 연결 하나를 가져와 사용합니다. 데이터 적재는 하나의
+        트랜잭션으로 커밋되며, 실패하더라도 세션 설정과 키는 항상 복원됩니다.
+        테이블이 아직 없으면 to_sql이 생성하도록 검사를 미루지 않고 적재하며,
+        disable_keys 설정 시에만 비고유 인덱스 갱신도 미룹니다.
+        (DISABLE KEYS는 MyISAM 테이블에만 효과가 있고 InnoDB에서는 무시됨)
+
+        Args:
+            data: 저장할 데이터
+            table: 테이블 이름
+            batch_size: 배치 크기
+
+        Returns:
+            저장된 행 수
+        """
+        with self.engine.connect() as conn:
+            qualified_table = self._qualified_table(table)
+            checks_deferred = False
+            keys_disabled = False
+            try:
+                # 존재 여부 확인부터 적재까지 하나의 트랜잭션에서 처리
+                # (SQLAlchemy 2.x는 inspect 조회 시 트랜잭션을 자동 시작하므로 begin을 중첩하지 않음)
+                with conn.begin():
+                    # 테이블이 없으면 to_sql이 테이블을 생성하도록 검사 지연 없이 적재
+                    if inspect(conn).has_table(table, schema=self.config.get("schema")):
+                        for statement in self._DEFER_CHECKS_SQL:
+                            conn.exec_driver_sql(statement)
+                        checks_deferred = True
+                        if self.config.get("disable_keys", False):
+                            conn.exec_driver_sql(f"ALTER TABLE {qualified_table} DISABLE KEYS")
+                            keys_disabled = True
+                    return self._load_with_sqlalchemy(
+                        data, table, IfExists.APPEND.value, batch_size, con=conn
+                    )
+            finally:
+                # 키 복원이 실패하더라도 풀에 반환되는 연결의 세션 설정은 항상 복원
+                try:
+                    if keys_disabled:
+                        with conn.begin():
+                            conn.exec_driver_sql(f"ALTER TABLE {qualified_table} ENABLE KEYS")
+                finally:
+                    if checks_deferred:
+                        with conn.begin():
+                            for statement in self._RESTORE_CHECKS_SQL:
+                                conn.exec_driver_sql(statement)
+
+    def _qualified_table(self, table: str) -> str:
+        """설정된 스키마로 한정한 테이블 이름 인용 (to_sql과 같은 테이블을 가리키도록)
+
+        Args:
+            table: 테이블 이름
+
+        Returns:
+            인용된 테이블 이름 (예: `schema`.`table`)
+        """
+        schema = self.config.get("schema")
+        if schema:
+            return f"{_q(schema)}.{_q(table)}"
+        return _q_table(table)
+
     def _load_with_sqlalchemy(
-        self, data: pd.DataFrame, table: str, if_exists: str, batch_size: int
+        self,
+        data: pd.DataFrame,
+        table: str,
+        if_exists: str,
+        batch_size: int,
+        con: Optional[Any] = None,
     ) -> int:
         """SQLAlchemy를 사용하여 데이터 적재
 
@@ -173,6 +427,7 @@ class MySQLLoader(Loader):
             table: 테이블 이름
             if_exists: 테이블 존재 시 처리 방법
             batch_size: 배치 크기
+            con: 사용할 SQLAlchemy 연결 (기본값: 엔진)
 
         Returns:
             저장된 행 수
@@ -183,7 +438,7 @@ class MySQLLoader(Loader):
         # 데이터 저장
         data.to_sql(
             name=table,
-            con=self.engine,
+            con=con if con is not None else self.engine,
             if_exists=if_exists,
             index=False,
             schema=self.config.get("schema"),
@@ -207,78 +462,154 @@ class MySQLLoader(Loader):
             RuntimeError: 테이블 생성 중 오류 발생
         """
         try:
-            # SQLAlchemy의 inspect를 사용하여 테이블 존재 여부 확인
-            inspector = inspect(self.engine)
-            schema = self.config.get("schema")
-            if inspector.has_table(self.table, schema=schema):
-                return False  # 이미 존재함
-
-            # 테이블 생성
-            self._create_table_from_dataframe(data)
+            # 존재 여부 확인과 테이블 생성을 같은 연결/트랜잭션에서 처리
+            with self.engine.begin() as conn:
+                # SQLAlchemy의 inspect를 사용하여 테이블 존재 여부 확인
+                inspector = inspect(conn)
+                schema = self.config.get("schema")
+                if inspector.has_table(self.table, schema=schema):
+                    return False  # 이미 존재함
+
+                # 테이블 생성
+                self._create_table_from_dataframe(data, conn)
             return True
         except Exception as e:
             raise RuntimeError(f"MySQL 테이블 생성 중 오류 발생: {e}")
 
-    def _create_table_from_dataframe(self, df: pd.DataFrame) -> None:
+    def _create_table_from_dataframe(self, df: pd.DataFrame, conn: Optional[Any] = None) -> None:
         """데이터프레임에서 테이블 생성
 
+        컬럼, 기본 키, 인덱스를 하나의 CREATE TABLE 문으로 만들어
+        한 번의 왕복으로 테이블을 생성합니다.
+
         Args:
             df: 스키마 추론용 데이터프레임
+            conn: 사용할 SQLAlchemy 연결 (없으면 엔진에서 새로 가져옴)
         """
         # 사용자 지정 데이터 타입이 있는 경우 사용, 없으면 자동 추론
-        dtype = self.config.get("dtype", {})
+        dtype = self.config.get("dtype") or {}
 
         # 기본 키와 인덱스 설정
         primary_key = self.config.get("create_table_primary_key")
         indexes = self.config.get("create_table_indexes", [])
 
-        # 빈 데이터프레임으로 테이블 생성
-        empty_df = pd.DataFrame(columns=df.columns)
+        primary_key_columns = self._split_columns(primary_key) if primary_key else []
+
+        # 인덱스 절 구성
+        index_specs = self._normalize_indexes(indexes, self.table)
+        index_clauses = [
+            f"KEY {_q(name)} ({', '.join(_q(c) for c in columns)})"
+            for name, columns in index_specs
+        ]
+        key_columns = set(primary_key_columns)
+        for _, columns in index_specs:
+            key_columns.update(columns)
+
+        # 컬럼 정의
+        definitions = [
+            f"{_q(column)} {self._column_type(column, df[column].dtype, dtype, key_columns)}"
+            for column in df.columns
+        ]
+        if primary_key_columns:
+            definitions.append(
+                f"PRIMARY KEY ({', '.join(_q(c) for c in primary_key_columns)})"
+            )
+        definitions.extend(index_clauses)
 
-        # 테이블 생성
-        empty_df.to_sql(
-            name=self.table,
-            con=self.engine,
-            if_exists="fail",
-            index=False,
-            dtype=dtype
+        ddl = (
+            f"CREATE TABLE {_q_table(self.table)} ({', '.join(definitions)}) "
+            f"ENGINE=InnoDB DEFAULT CHARSET={self.charset} ROW_FORMAT=DYNAMIC"
         )
 
-        # 기본 키와 인덱스 추가
-        connection = self._get_connection()
-        with connection.cursor() as cursor:
-            # 기본 키 추가
-            if primary_key:
-                if isinstance(primary_key, list):
-                    primary_key = ", ".join(primary_key)
-                cursor.execute(
-                    f"ALTER TABLE {self.table} ADD PRIMARY KEY ({primary_key})"
-                )
+        # 별도의 DBAPI 연결 없이 엔진 풀의 연결로 실행
+        if conn is not None:
+            conn.exec_driver_sql(ddl)
+        else:
+            with self.engine.begin() as conn:
+                conn.exec_driver_sql(ddl)
 
-            # 인덱스 추가
-            for index in indexes:
-                if isinstance(index, dict):
-                    # 인덱스 이름과 컬럼 지정 가능
-                    idx_name = index.get("name", f"idx_{self.table}")
-                    idx_columns = index.get("columns", [])
-                    if isinstance(idx_columns, list):
-                        idx_columns = ", ".join(idx_columns)
-                    query = f"CREATE INDEX {idx_name} ON {self.table}"
-                    query += f" ({idx_columns})"
-                    cursor.execute(query)
-                elif isinstance(index, list):
-                    # 컬럼만 지정하는 경우
-                    idx_columns = ", ".join(index)
-                    query = f"CREATE INDEX idx_{self.table} ON {self.table}"
-                    query += f" ({idx_columns})"
-                    cursor.execute(query)
-                elif isinstance(index, str):
-                    # 단일 컬럼 인덱스
-                    cursor.execute(
-                        f"CREATE INDEX idx_{self.table} ON {self.table} ({index})"
-                    )
+    @classmethod
+    def _normalize_indexes(cls, indexes: List[Any], table: str) -> List[Tuple[str, List[str]]]:
+        """인덱스 설정을 (인덱스 이름, 컬럼 목록) 쌍으로 정규화
 
-        connection.commit()
+        인덱스는 다음 형식으로 지정할 수 있습니다.
+            - dict: {"name": "idx_a", "columns": ["a", "b"]} (name 생략 가능)
+            - list: ["a", "b"]
+            - str: "a"
+        이름이 없는 인덱스는 idx_{table}_{컬럼} 형식으로 이름을 붙여
+        같은 CREATE TABLE 문 안에서 이름이 겹치지 않게 합니다.
+
+        Args:
+            indexes: 인덱스 설정 목록
+            table: 테이블 이름
+
+        Returns:
+            (인덱스 이름, 컬럼 목록) 리스트
+        """
+        specs = []
+        for index in indexes:
+            name = None
+            if isinstance(index, dict):
+                name = index.get("name")
+                columns = cls._split_columns(index.get("columns", []))
+            elif isinstance(index, (list, str)):
+                columns = cls._split_columns(index)
+            else:
+                continue
+            if not columns:
+                continue
+            specs.append((name or f"idx_{table}_{'_'.join(columns)}", columns))
+        return specs
+
+    @staticmethod
+    def _split_columns(columns: Any) -> List[str]:
+        """컬럼 목록 또는 쉼표로 구분된 컬럼 문자열을 리스트로 변환
+
+        Args:
+            columns: 컬럼 리스트 또는 "a, b" 형식의 문자열
+
+        Returns:
+            컬럼 이름 리스트
+        """
+        if isinstance(columns, str):
+            return [c.strip() for c in columns.split(",") if c.strip()]
+        return list(columns)
+
+    def _column_type(
+        self, column: str, series_dtype: Any, dtype: Dict[str, Any], key_columns: Any
+    ) -> str:
+        """컬럼의 MySQL 데이터 타입 결정
+
+        Args:
+            column: 컬럼 이름
+            series_dtype: 데이터프레임 컬럼의 pandas dtype
+            dtype: 사용자 지정 컬럼 타입
+            key_columns: 기본 키나 인덱스에 사용되는 컬럼 이름 집합
+
+        Returns:
+            MySQL 컬럼 타입 문자열
+        """
+        if column in dtype:
+            column_type = dtype[column]
+            if isinstance(column_type, str):
+                return column_type
+            # SQLAlchemy 타입 객체인 경우 MySQL 방언으로 컴파일
+            if isinstance(column_type, type):
+                column_type = column_type()
+            return column_type.compile(dialect=self.engine.dialect)
+
+        if pd.api.types.is_bool_dtype(series_dtype):
+            return "TINYINT(1)"
+        if pd.api.types.is_integer_dtype(series_dtype):
+            return "BIGINT"
+        if pd.api.types.is_float_dtype(series_dtype):
+            return "DOUBLE"
+        if pd.api.types.is_datetime64_any_dtype(series_dtype):
+            return "DATETIME"
+        if pd.api.types.is_timedelta64_dtype(series_dtype):
+            return "BIGINT"
+        # 문자열/객체 컬럼: TEXT는 키 길이 지정 없이 인덱싱할 수 없음
+        return "VARCHAR(255)" if column in key_columns else "TEXT"
 
     def get_current_schema(self) -> List[Dict[str, Any]]:
         """현재 테이블의 스키마 정보 조회
@@ -313,11 +644,13 @@ class MySQLLoader(Loader):
             raise RuntimeError(f"MySQL 스키마 조회 중 오류 발생: {e}")
 
     def close(self) -> None:
-        """MySQL 연결 종료"""
+        """MySQL 연결 종료
+
+        공유 엔진은 다른 Loader가 사용 중일 수 있으므로 dispose하지 않고
+        참조만 해제합니다. (프로세스 종료 시 일괄 정리)
+        """
         if self.connection and self.connection.open:
             self.connection.close()
             self.connection = None
-        
-        if self.engine:
-            self.engine.dispose()
-            self.engine = None 
\ No newline at end of file
+
+        self.engine = None 
\ No newline at end of file
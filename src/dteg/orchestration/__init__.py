@@ -6,9 +6,31 @@ dteg.orchestration 패키지
 
 __version__ = "0.1.0"
 
+import functools
+import logging
+import threading
+import types
+
 from dteg.orchestration.orchestrator import Orchestrator
 
+logger = logging.getLogger(__name__)
+
 _orchestrator = None
+_orchestrator_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=None)
+def _web_db_models():
+    """
+    웹 DB 세션 팩토리와 스케줄 모델을 한 번만 임포트하여 반환
+    
+    Returns:
+        tuple: (SessionLocal, WebSchedule)
+    """
+    from dteg.web.database import SessionLocal
+    from dteg.web.models.database_models import Schedule as WebSchedule
+    return SessionLocal, WebSchedule
+
 
 def get_orchestrator(config=None, use_celery=False, broker_url=None, result_backend=None):
     """
@@ -26,167 +48,200 @@ def get_orchestrator(config=None, use_celery=False, broker_url=None, result_back
         Orchestrator: 오케스트레이터 인스턴스
     """
     global _orchestrator
-    if _orchestrator is None:
-        from dteg.orchestration.orchestrator import Orchestrator
-        _orchestrator = Orchestrator(use_celery=use_celery, broker_url=broker_url, result_backend=result_backend)
+    if _orchestrator is not None:
+        return _orchestrator
+    
+    with _orchestrator_lock:
+        # 동시에 처음 호출된 경우 먼저 생성된 인스턴스 사용
+        if _orchestrator is not None:
+            return _orchestrator
+        
+        orchestrator = Orchestrator(use_celery=use_celery, broker_url=broker_url, result_backend=result_backend)
         
         # 환경 변수에서 스케줄러 간격 가져오기 (기본값: 30초)
         import os
         scheduler_interval = int(os.environ.get("DTEG_SCHEDULER_INTERVAL", "30"))
         
         # 스케줄러 시작 (지정된 간격으로, 즉시 실행하지 않도록 설정)
-        _orchestrator.start_scheduler(interval=scheduler_interval, no_immediate_run=True)
-        
-        # 웹 DB와 로컬 파일 통합을 위한 추가 기능
-        def sync_schedules_with_web_db(self):
-            """
-            웹 SQLite DB와 로컬 스케줄러 파일 동기화
-            """
-            try:
-                from dteg.web.database import SessionLocal
-                from dteg.web.models.database_models import Schedule as WebSchedule
-                
-                # SQLite DB에서 스케줄 목록 가져오기
-                db = SessionLocal()
-                try:
-                    web_schedules = db.query(WebSchedule).all()
-                    
-                    # 로컬 스케줄러의 스케줄 목록과 비교
-                    local_schedules = self.scheduler.get_all_schedules()
-                    local_schedule_ids = {s.id for s in local_schedules}
-                    web_schedule_ids = {s.id for s in web_schedules}
-                    
-                    # 웹 DB에만 있고 로컬에 없는 스케줄 추가
-                    for web_schedule in web_schedules:
-                        if web_schedule.id not in local_schedule_ids:
-                            if web_schedule.enabled:
-                                self.schedule_pipeline(
-                                    schedule_id=web_schedule.id,
-                                    pipeline_id=web_schedule.pipeline_id,
-                                    cron_expression=web_schedule.cron_expression,
-                                    parameters=web_schedule.params
-                                )
-                    
-                    # 로컬에만 있고 웹 DB에 없는 스케줄 제거
-                    for local_schedule in local_schedules:
-                        if local_schedule.id not in web_schedule_ids:
-                            self.scheduler.remove_schedule(local_schedule.id)
-                
-                finally:
-                    db.close()
-                    
-                return True
-            except Exception as e:
-                import logging
-                logger = logging.getLogger(__name__)
-                logger.error(f"웹 DB와 스케줄 동기화 실패: {str(e)}")
-                return False
-        
-        # 스케줄러 오버라이드하여 스케줄 등록/제거 시 DB 동기화
-        def schedule_pipeline(self, schedule_id, pipeline_id, cron_expression, parameters=None):
-            """
-            파이프라인 스케줄 등록
+        orchestrator.start_scheduler(interval=scheduler_interval, no_immediate_run=True)
+        
+        # 동적으로 메서드 추가
+        orchestrator.schedule_pipeline = types.MethodType(_schedule_pipeline, orchestrator)
+        orchestrator.remove_schedule = types.MethodType(_remove_schedule, orchestrator)
+        orchestrator.sync_schedules_with_web_db = types.MethodType(_sync_schedules_with_web_db, orchestrator)
+        
+        # 초기 동기화는 백그라운드 스레드에서 수행하여 호출자를 막지 않음
+        threading.Thread(
+            target=_initial_sync, args=(orchestrator,), daemon=True, name="dteg-initial-sync"
+        ).start()
+        
+        _orchestrator = orchestrator
+    
+    return _orchestrator
+
+
+# 웹 DB와 로컬 파일 통합을 위한 추가 기능
+def _sync_schedules_with_web_db(self):
+    """
+    웹 SQLite DB와 로컬 스케줄러 파일 동기화
+    """
+    try:
+        SessionLocal, WebSchedule = _web_db_models()
+        
+        # SQLite DB에서 스케줄 목록 가져오기
+        db = SessionLocal()
+        try:
+            # 필요한 컬럼만 한 번에 조회 (ORM 객체 생성 및 지연 로딩 방지)
+            rows = db.query(
+                WebSchedule.id,
+                WebSchedule.pipeline_id,
+                WebSchedule.cron_expression,
+                WebSchedule.enabled
+            ).all()
+            web_map = {row.id: row for row in rows}
             
-            Args:
-                schedule_id: 스케줄 ID
-                pipeline_id: 파이프라인 ID
-                cron_expression: Cron 표현식
-                parameters: 파이프라인 실행 매개변수
-                
-            Returns:
-                str: 스케줄 ID
-            """
-            import json
-            import os
-            from datetime import datetime
-            import uuid
-            import os
-            from pathlib import Path
-            import logging
-            import croniter
+            # 로컬 스케줄러의 스케줄 ID와 집합 차이로 비교
+            local_schedule_ids = set(self.scheduler.schedules)
             
-            logger = logging.getLogger(__name__)
+            # 웹 DB에만 있고 로컬에 없는 스케줄 추가
+            adds = []
+            for schedule_id in web_map.keys() - local_schedule_ids:
+                row = web_map[schedule_id]
+                if row.enabled:
+                    adds.append(_build_schedule_config(
+                        schedule_id=row.id,
+                        pipeline_id=row.pipeline_id,
+                        cron_expression=row.cron_expression
+                    ))
             
-            # 웹 API 호환 스케줄 파일 직접 생성
-            try:
-                # 기본 정보 설정
-                now = datetime.now()
-                
-                # 다음 실행 시간 계산
-                cron = croniter.croniter(cron_expression, now)
-                next_run = cron.get_next(ret_type=datetime)
-                
-                # 스케줄 데이터 준비
-                schedule_data = {
-                    "id": schedule_id or str(uuid.uuid4()),
-                    "name": f"Pipeline {pipeline_id[:8]}",
-                    "description": f"Pipeline {pipeline_id[:8]}",
-                    "pipeline_id": pipeline_id,
-                    "cron_expression": cron_expression,
-                    "enabled": True,
-                    "parameters": parameters or {},
-                    "params": parameters or {},
-                    "created_at": now.isoformat(),
-                    "updated_at": now.isoformat(),
-                    "next_run": next_run.isoformat(),
-                    "dependencies": [],
-                    "max_retries": 3,
-                    "retry_delay": 300
-                }
-                
-                # 스케줄 파일 저장
-                schedule_dir = self.scheduler.schedule_dir
-                schedule_file = os.path.join(schedule_dir, f"{schedule_id}.json")
-                
-                with open(schedule_file, 'w') as f:
-                    json.dump(schedule_data, f, indent=2)
-                
-                logger.info(f"스케줄 파일 생성됨: {schedule_file}")
-                
-                # 내부 스케줄러에 등록
-                from dteg.orchestration.scheduler import ScheduleConfig
-                
-                # 스케줄 설정 생성
-                schedule_config = ScheduleConfig(
-                    pipeline_config=pipeline_id,  # 파이프라인 ID 직접 전달
-                    cron_expression=cron_expression,
-                    enabled=True
-                )
-                
-                # ID를 직접 설정
-                schedule_config.id = schedule_id
-                
-                # 스케줄 등록 (내부적으로만 사용되며 파일은 덮어쓰지 않음)
-                return self.scheduler.add_schedule(schedule_config)
-                
-            except Exception as e:
-                logger.error(f"스케줄 등록 중 오류 발생: {str(e)}")
-                raise
-        
-        # 스케줄 삭제 메소드
-        def remove_schedule(self, schedule_id):
-            """
-            스케줄 제거
+            # 로컬에만 있고 웹 DB에 없는 스케줄 제거
+            removes = list(local_schedule_ids - web_map.keys())
             
-            Args:
-                schedule_id: 스케줄 ID
-                
-            Returns:
-                bool: 제거 성공 여부
-            """
-            return self.scheduler.remove_schedule(schedule_id)
+            # 스케줄 파일은 한 번에 저장
+            self.scheduler.bulk_apply(adds, removes)
         
-        # 동적으로 메서드 추가
-        import types
-        _orchestrator.schedule_pipeline = types.MethodType(schedule_pipeline, _orchestrator)
-        _orchestrator.remove_schedule = types.MethodType(remove_schedule, _orchestrator)
-        _orchestrator.sync_schedules_with_web_db = types.MethodType(sync_schedules_with_web_db, _orchestrator)
+        finally:
+            db.close()
+            
+        return True
+    except Exception as e:
+        logger.error(f"웹 DB와 스케줄 동기화 실패: {str(e)}")
+        return False
+
+
+# 스케줄러 오버라이드하여 스케줄 등록/제거 시 DB 동기화
+def _schedule_pipeline(self, schedule_id, pipeline_id, cron_expression, parameters=None):
+    """
+    파이프라인 스케줄 등록
+    
+    Args:
+        schedule_id: 스케줄 ID
+        pipeline_id: 파이프라인 ID
+        cron_expression: Cron 표현식
+        parameters: 파이프라인 실행 매개변수
         
-        # 초기 동기화 시도
-        try:
-            _orchestrator.sync_schedules_with_web_db()
-        except Exception as e:
-            import logging
-            logging.getLogger(__name__).error(f"초기 스케줄 동기화 실패: {str(e)}")
+    Returns:
+        str: 스케줄 ID
+    """
+    import os
+    from datetime import datetime
+    import uuid
+    from dteg.orchestration.scheduler import next_cron_run
+    from dteg.utils.fileio import atomic_write, dump_json
     
-    return _orchestrator 
\ No newline at end of file
+    # 웹 API 호환 스케줄 파일 직접 생성
+    try:
+        # 기본 정보 설정
+        now = datetime.now()
+        
+        # 다음 실행 시간 계산 (파싱된 Cron 표현식 재사용)
+        next_run = next_cron_run(cron_expression, now)
+        
+        # 스케줄 데이터 준비
+        schedule_data = {
+            "id": schedule_id or str(uuid.uuid4()),
+            "name": f"Pipeline {pipeline_id[:8]}",
+            "description": f"Pipeline {pipeline_id[:8]}",
+            "pipeline_id": pipeline_id,
+            "cron_expression": cron_expression,
+            "enabled": True,
+            "parameters": parameters or {},
+            "params": parameters or {},
+            "created_at": now.isoformat(),
+            "updated_at": now.isoformat(),
+            "next_run": next_run.isoformat(),
+            "dependencies": [],
+            "max_retries": 3,
+            "retry_delay": 300
+        }
+        
+        # 스케줄 파일 저장
+        schedule_dir = self.scheduler.schedule_dir
+        schedule_file = os.path.join(schedule_dir, f"{schedule_id}.json")
+        
+        atomic_write(schedule_file, dump_json(schedule_data))
+        
+        logger.info(f"스케줄 파일 생성됨: {schedule_file}")
+        
+        # 내부 스케줄러에 등록
+        schedule_config = _build_schedule_config(schedule_id, pipeline_id, cron_expression)
+        
+        # 스케줄 등록 (내부적으로만 사용되며 파일은 덮어쓰지 않음)
+        return self.scheduler.add_schedule(schedule_config)
+        
+    except Exception as e:
+        logger.error(f"스케줄 등록 중 오류 발생: {str(e)}")
+        raise
+
+
+def _build_schedule_config(schedule_id, pipeline_id, cron_expression):
+    """
+    웹 UI 등록 스케줄에 대한 내부 스케줄 설정 생성
+    
+    Args:
+        schedule_id: 스케줄 ID
+        pipeline_id: 파이프라인 ID
+        cron_expression: Cron 표현식
+        
+    Returns:
+        ScheduleConfig: 스케줄 설정 객체
+    """
+    from dteg.orchestration.scheduler import ScheduleConfig
+    
+    # 스케줄 설정 생성
+    schedule_config = ScheduleConfig(
+        pipeline_config=pipeline_id,  # 파이프라인 ID 직접 전달
+        cron_expression=cron_expression,
+        enabled=True
+    )
+    
+    # ID를 직접 설정
+    schedule_config.id = schedule_id
+    return schedule_config
+
+
+# 스케줄 삭제 메소드
+def _remove_schedule(self, schedule_id):
+    """
+    스케줄 제거
+    
+    Args:
+        schedule_id: 스케줄 ID
+        
+    Returns:
+        bool: 제거 성공 여부
+    """
+    return self.scheduler.remove_schedule(schedule_id)
+
+
+def _initial_sync(orchestrator):
+    """
+    초기 웹 DB 스케줄 동기화 (백그라운드 스레드에서 실행)
+    
+    Args:
+        orchestrator: 동기화할 오케스트레이터 인스턴스
+    """
+    try:
+        orchestrator.sync_schedules_with_web_db()
+    except Exception as e:
+        logger.error(f"초기 스케줄 동기화 실패: {str(e)}")
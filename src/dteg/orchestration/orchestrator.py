@@ -3,28 +3,91 @@
 
 스케줄러와 작업 큐를 통합하여 파이프라인 실행을 관리하는 모듈
 """
+from collections import OrderedDict
+import concurrent.futures
 import logging
 import threading
-import time
-from typing import Dict, List, Optional, Union, Any, Callable
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Tuple, Union, Any, Callable
 from pathlib import Path
 import uuid
-import sys
-import traceback
 import os
-import json
+import random
 
-from dteg.orchestration.scheduler import Scheduler, ScheduleConfig, ExecutionRecord
-from dteg.orchestration.worker import CeleryTaskManager, CeleryTaskQueue
+from dteg.orchestration.scheduler import (
+    Scheduler, ScheduleConfig, ExecutionRecord, _load_pipeline_config, _web_db_modules
+)
 from dteg.core.config import PipelineConfig
 from dteg.config import get_config
+from dteg.utils.fileio import dump_json, load_json
+
+if TYPE_CHECKING:
+    from dteg.orchestration.worker import CeleryTaskManager
 
 logger = logging.getLogger(__name__)
 
+# 의존성이 없는 스케줄에 대해 공유하는 빈 의존성 튜플
+_EMPTY_DEPS: Tuple[str, ...] = ()
+
+# 메모리에 유지할 완료 실행 상태 최대 개수 (초과 시 오래된 항목부터 제거)
+MAX_INDEXED_EXECUTIONS = 10000
+
 class OrchestratorError(Exception):
     """오케스트레이션 관련 오류 클래스"""
     pass
 
+
+def _record_to_payload(record: ExecutionRecord) -> Dict[str, Any]:
+    """
+    완료된 실행 기록을 상태 응답 사전으로 변환
+    
+    시각 문자열은 이 시점에 한 번만 생성되며 이후 조회에서는 재사용됩니다.
+    
+    Args:
+        record: 실행 기록
+        
+    Returns:
+        실행 상태 정보
+    """
+    return {
+        "execution_id": record.id,
+        "pipeline_id": record.pipeline_id,
+        "status": record.status,
+        "start_time": record.start_time.isoformat(),
+        "end_time": record.end_time.isoformat() if record.end_time else None,
+        "error_message": record.error_message
+    }
+
+
+def _new_execution_id() -> str:
+    """
+    실행 ID 생성
+    
+    암호학적 난수가 필요하지 않으므로 os.urandom 대신 프로세스 내 난수 생성기를 사용하며,
+    웹 DB 컬럼(String(36))과 호환되도록 UUID4 문자열 형식을 유지합니다.
+    
+    Returns:
+        실행 ID
+    """
+    return str(uuid.UUID(int=random.getrandbits(128), version=4))
+
+
+def _put_bounded(mapping: "OrderedDict[str, Any]", key: str, value: Any):
+    """
+    크기 제한이 있는 사전에 값 저장 (호출자가 인덱스 잠금 보유)
+    
+    MAX_INDEXED_EXECUTIONS를 넘으면 삽입 순서 기준으로 가장 오래된 항목부터 제거합니다.
+    
+    Args:
+        mapping: 대상 사전
+        key: 키
+        value: 값
+    """
+    mapping[key] = value
+    mapping.move_to_end(key)
+    while len(mapping) > MAX_INDEXED_EXECUTIONS:
+        mapping.popitem(last=False)
+
+
 class Orchestrator:
     """파이프라인 오케스트레이션 관리자 클래스"""
     
@@ -35,7 +98,9 @@ class Orchestrator:
                  broker_url: Optional[str] = None,
                  result_backend: Optional[str] = None,
                  use_celery: bool = True,
-                 on_execution_complete: Optional[Callable[[Dict[str, Any]], None]] = None):
+                 on_execution_complete: Optional[Callable[[Dict[str, Any]], None]] = None,
+                 max_workers: Optional[int] = None,
+                 max_history: Optional[int] = None):
         """
         오케스트레이션 관리자 초기화
         
@@ -47,33 +112,49 @@ class Orchestrator:
             result_backend: Celery result backend
             use_celery: Celery 작업 큐 사용 여부
             on_execution_complete: 실행 완료 시 호출될 콜백 함수
+            max_workers: 스케줄러가 동시에 실행할 최대 파이프라인 수 (기본값: min(32, CPU 수 + 4))
+            max_history: 스케줄러가 메모리에 유지할 최대 완료 실행 기록 수
         """
         self.use_celery = use_celery
         self.on_execution_complete = on_execution_complete
         
-        # 콜백 래퍼 함수 정의
-        def execution_callback(record: ExecutionRecord):
-            """스케줄러 실행 완료 콜백"""
-            if self.on_execution_complete:
+        # 인덱스 갱신 잠금 (완료 콜백은 스케줄러 풀 스레드에서 호출됨)
+        self._index_lock = threading.Lock()
+        
+        # 실행 ID 및 파이프라인 ID 기준 완료 상태 인덱스 (상태 조회 시 선형 탐색 및 재직렬화 방지)
+        self._payload_by_exec_id: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._latest_payload_by_pipeline: Dict[str, Dict[str, Any]] = {}
+        
+        # 실행 중인 작업의 상태 응답 캐시 (완료 시 제거)
+        self._running_payload_by_exec_id: Dict[str, Dict[str, Any]] = {}
+        
+        # Celery로 제출된 실행 ID와 작업 ID 매핑 (실행 ID 기준 취소용)
+        self._task_id_by_exec_id: "OrderedDict[str, str]" = OrderedDict()
+        
+        # 콜백 래퍼 함수 정의 (외부 콜백 유무는 생성 시 한 번만 판단)
+        if on_execution_complete is None:
+            execution_callback = self._index_completed_record
+        else:
+            index_completed_record = self._index_completed_record
+            
+            def execution_callback(record: ExecutionRecord):
+                """스케줄러 실행 완료 콜백"""
                 # 외부 콜백 호출
-                self.on_execution_complete({
-                    "execution_id": record.id,
-                    "pipeline_id": record.pipeline_id,
-                    "status": record.status,
-                    "start_time": record.start_time.isoformat(),
-                    "end_time": record.end_time.isoformat() if record.end_time else None,
-                    "error_message": record.error_message
-                })
+                on_execution_complete(index_completed_record(record).copy())
         
         # 스케줄러 초기화
         self.scheduler = Scheduler(
             history_dir=history_dir,
             schedule_dir=schedule_dir,
-            on_execution_complete=execution_callback
+            on_execution_complete=execution_callback,
+            max_workers=max_workers,
+            max_history=max_history
         )
         
-        # Celery 사용 시 작업 관리자 초기화
+        # Celery 사용 시 작업 관리자 초기화 (Celery 모듈은 필요할 때만 임포트)
+        self.task_manager: Optional["CeleryTaskManager"]
         if use_celery:
+            from dteg.orchestration.worker import CeleryTaskManager
             self.task_manager = CeleryTaskManager(result_dir=result_dir, broker_url=broker_url, result_backend=result_backend)
         else:
             self.task_manager = None
@@ -81,6 +162,26 @@ class Orchestrator:
         # 스케줄러 스레드
         self.scheduler_thread = None
         self.scheduler_running = False
+        
+        # 스케줄러 중지 신호 (대기 중인 스레드를 즉시 깨움)
+        self._stop_event = threading.Event()
+    
+    def _index_completed_record(self, record: ExecutionRecord) -> Dict[str, Any]:
+        """
+        완료된 실행 기록의 상태 응답을 인덱스에 등록
+        
+        Args:
+            record: 완료된 실행 기록
+            
+        Returns:
+            실행 상태 정보
+        """
+        payload = _record_to_payload(record)
+        with self._index_lock:
+            _put_bounded(self._payload_by_exec_id, record.id, payload)
+            self._latest_payload_by_pipeline[record.pipeline_id] = payload
+            self._running_payload_by_exec_id.pop(record.id, None)
+        return payload
     
     def add_pipeline(self, 
                      pipeline_config: Union[PipelineConfig, str, Path],
@@ -118,7 +219,7 @@ class Orchestrator:
         else:
             # 스케줄 없이 파이프라인 ID만 반환
             if isinstance(pipeline_config, (str, Path)):
-                config = PipelineConfig.from_yaml(pipeline_config)
+                config = _load_pipeline_config(pipeline_config)
                 return config.pipeline_id
             else:
                 return pipeline_config.pipeline_id
@@ -141,37 +242,10 @@ class Orchestrator:
             실행 결과 정보
         """
         if execution_id is None:
-            execution_id = str(uuid.uuid4())
+            execution_id = _new_execution_id()
             
-        # 스케줄 확인
-        schedule = self.scheduler.get_schedule(pipeline_id)
-        
-        if schedule:
-            # 스케줄이 있는 경우, 스케줄의 파이프라인 설정 사용
-            pipeline_config = schedule.pipeline_config
-        else:
-            # 스케줄이 없는 경우, 파이프라인 ID로 파일 확인
-            try:
-                # 설정에서 파이프라인 디렉토리 가져오기
-                config = get_config()
-                pipeline_file = os.path.join(config.pipelines_dir, f"{pipeline_id}.json")
-                
-                # 파일 존재 확인
-                if os.path.exists(pipeline_file):
-                    # 파이프라인 파일 읽기
-                    with open(pipeline_file, 'r') as f:
-                        pipeline_data = json.load(f)
-                    
-                    # 설정 추출
-                    pipeline_config = pipeline_data.get("config", {})
-                    logger.info(f"파이프라인 ID {pipeline_id}의 설정 파일을 로드했습니다.")
-                else:
-                    # 파일이 없는 경우
-                    logger.error(f"파이프라인 ID {pipeline_id}에 대한 파일을 찾을 수 없습니다: {pipeline_file}")
-                    raise OrchestratorError(f"파이프라인 ID {pipeline_id}에 대한 파일을 찾을 수 없습니다.")
-            except Exception as e:
-                logger.error(f"파이프라인 ID {pipeline_id} 설정 로드 중 오류: {str(e)}")
-                raise OrchestratorError(f"파이프라인 ID {pipeline_id}에 대한 설정을 찾을 수 없습니다: {str(e)}")
+        # 스케줄 또는 파이프라인 파일에서 설정 확인
+        schedule, pipeline_config = self._resolve_pipeline(pipeline_id)
         
         # 실행 방식 결정
         if self.use_celery and async_execution:
@@ -181,6 +255,8 @@ class Orchestrator:
                 execution_id=execution_id,
                 queue=queue
             )
+            with self._index_lock:
+                _put_bounded(self._task_id_by_exec_id, execution_id, task_id)
             
             return {
                 "execution_id": execution_id,
@@ -195,16 +271,9 @@ class Orchestrator:
                 self.scheduler._run_pipeline(schedule)
                 
                 # 가장 최근 실행 기록 조회
-                for record in reversed(self.scheduler.completed_executions):
-                    if record.pipeline_id == pipeline_id:
-                        return {
-                            "execution_id": record.id,
-                            "status": record.status,
-                            "pipeline_id": pipeline_id,
-                            "start_time": record.start_time.isoformat(),
-                            "end_time": record.end_time.isoformat() if record.end_time else None,
-                            "error_message": record.error_message
-                        }
+                payload = self._latest_payload_by_pipeline.get(pipeline_id)
+                if payload is not None:
+                    return payload.copy()
             
             # 실행 기록을 찾지 못한 경우
             return {
@@ -214,6 +283,97 @@ class Orchestrator:
                 "error_message": "실행 결과를 찾을 수 없습니다."
             }
     
+    def run_pipelines(self, 
+                      jobs: List[Tuple[str, Optional[str]]],
+                      queue: str = "default") -> List[Dict[str, Any]]:
+        """
+        여러 파이프라인 일괄 실행
+        
+        Celery 사용 시 모든 작업을 하나의 브로커 연결로 제출하며,
+        그렇지 않으면 run_pipeline을 순차적으로 호출합니다.
+        
+        Args:
+            jobs: (파이프라인 ID 또는 스케줄 ID, 실행 ID 또는 None) 튜플 목록
+            queue: 작업 큐 이름 (Celery 사용 시)
+            
+        Returns:
+            작업 순서와 같은 실행 결과 정보 목록
+        """
+        if not self.use_celery:
+            return [
+                self.run_pipeline(pipeline_id, execution_id, async_execution=False, queue=queue)
+                for pipeline_id, execution_id in jobs
+            ]
+        
+        # 설정 조회 및 실행 ID 할당
+        submissions = []
+        for pipeline_id, execution_id in jobs:
+            _, pipeline_config = self._resolve_pipeline(pipeline_id)
+            submissions.append((pipeline_id, pipeline_config, execution_id or _new_execution_id()))
+        
+        # 한 번에 제출
+        task_ids = self.task_manager.run_pipelines(
+            [(pipeline_config, execution_id) for _, pipeline_config, execution_id in submissions],
+            queue=queue
+        )
+        with self._index_lock:
+            for (_, _, execution_id), task_id in zip(submissions, task_ids):
+                _put_bounded(self._task_id_by_exec_id, execution_id, task_id)
+        
+        return [
+            {
+                "execution_id": execution_id,
+                "task_id": task_id,
+                "status": "submitted",
+                "pipeline_id": pipeline_id
+            }
+            for (pipeline_id, _, execution_id), task_id in zip(submissions, task_ids)
+        ]
+    
+    def _resolve_pipeline(self, pipeline_id: str):
+        """
+        파이프라인 ID 또는 스케줄 ID로 실행할 파이프라인 설정 조회
+        
+        Args:
+            pipeline_id: 파이프라인 ID 또는 스케줄 ID
+            
+        Returns:
+            (스케줄 설정 또는 None, 파이프라인 설정) 튜플
+            
+        Raises:
+            OrchestratorError: 설정을 찾을 수 없는 경우
+        """
+        # 스케줄 확인
+        schedule = self.scheduler.get_schedule(pipeline_id)
+        
+        if schedule:
+            # 스케줄이 있는 경우, 스케줄의 파이프라인 설정 사용
+            pipeline_config = schedule.pipeline_config
+        else:
+            # 스케줄이 없는 경우, 파이프라인 ID로 파일 확인
+            try:
+                # 설정에서 파이프라인 디렉토리 가져오기
+                config = get_config()
+                pipeline_file = os.path.join(config.pipelines_dir, f"{pipeline_id}.json")
+                
+                # 파일 존재 확인
+                if os.path.exists(pipeline_file):
+                    # 파이프라인 파일 읽기
+                    pipeline_data = load_json(pipeline_file)
+                    
+                    # 설정 추출
+                    pipeline_config = pipeline_data.get("config", {})
+                    logger.info(f"파이프라인 ID {pipeline_id}의 설정 파일을 로드했습니다.")
+                else:
+                    # 파일이 없는 경우
+                    logger.error(f"파이프라인 ID {pipeline_id}에 대한 파일을 찾을 수 없습니다: {pipeline_file}")
+                    raise OrchestratorError(f"파이프라인 ID {pipeline_id}에 대한 파일을 찾을 수 없습니다.")
+            except Exception as e:
+                logger.error(f"파이프라인 ID {pipeline_id} 설정 로드 중 오류: {str(e)}")
+                raise OrchestratorError(f"파이프라인 ID {pipeline_id}에 대한 설정을 찾을 수 없습니다: {str(e)}")
+        
+        return schedule, pipeline_config
+    
     def get_pipeline_status(self, 
                           execution_id: Optional[str] = None,
                           task_id: Optional[str] = None) -> Dict[str, Any]:
@@ -232,27 +392,29 @@ class Orchestrator:
             return self.task_manager.get_result(task_id)
             
         elif execution_id:
-            # 실행 ID로 스케줄러 이력에서 조회
-            for record in self.scheduler.completed_executions:
-                if record.id == execution_id:
-                    return {
-                        "execution_id": record.id,
-                        "status": record.status,
-                        "pipeline_id": record.pipeline_id,
-                        "start_time": record.start_time.isoformat(),
-                        "end_time": record.end_time.isoformat() if record.end_time else None,
-                        "error_message": record.error_message
-                    }
+            # 실행 ID로 완료 기록 인덱스에서 조회
+            payload = self._payload_by_exec_id.get(execution_id)
+            if payload is not None:
+                return payload.copy()
             
-            # 실행 중인 작업에서 조회
-            for exec_id, record in self.scheduler.running_executions.items():
-                if exec_id == execution_id:
-                    return {
+            # 실행 중인 작업에서 조회 (응답은 첫 조회 시 한 번만 생성)
+            record = self.scheduler.running_executions.get(execution_id)
+            if record is not None:
+                payload = self._running_payload_by_exec_id.get(execution_id)
+                if payload is None:
+                    payload = {
                         "execution_id": record.id,
                         "status": "RUNNING",
                         "pipeline_id": record.pipeline_id,
                         "start_time": record.start_time.isoformat()
                     }
+                    self._running_payload_by_exec_id[execution_id] = payload
+                return payload.copy()
+            
+            # 인덱스에서 제거된 오래된 실행은 저장된 실행 이력에서 조회
+            payload = self._load_execution_payload(execution_id)
+            if payload is not None:
+                return payload
         
         # 상태를 찾지 못한 경우
         return {
@@ -262,6 +424,41 @@ class Orchestrator:
             "error_message": "실행 상태를 찾을 수 없습니다."
         }
     
+    def _load_execution_payload(self, execution_id: str) -> Optional[Dict[str, Any]]:
+        """
+        웹 DB에 저장된 실행 이력에서 상태 조회
+        
+        Args:
+            execution_id: 실행 ID
+            
+        Returns:
+            실행 상태 정보 (찾지 못하면 None)
+        """
+        web_db = _web_db_modules()
+        if web_db is None:
+            return None
+        SessionLocal, database_models = web_db
+        DBExecution = database_models.Execution
+        
+        db = SessionLocal()
+        try:
+            execution = db.query(DBExecution).filter(DBExecution.id == execution_id).first()
+            if execution is None:
+                return None
+            return {
+                "execution_id": execution.id,
+                "pipeline_id": execution.pipeline_id,
+                "status": execution.status,
+                "start_time": execution.started_at.isoformat() if execution.started_at else None,
+                "end_time": execution.ended_at.isoformat() if execution.ended_at else None,
+                "error_message": execution.error_message
+            }
+        except Exception as e:
+            logger.debug(f"실행 이력 조회 실패: {execution_id} - {e}")
+            return None
+        finally:
+            db.close()
+    
     def start_scheduler(self, interval: int = 60, no_immediate_run: bool = True):
         """
         스케줄러 시작
@@ -275,40 +472,45 @@ class Orchestrator:
             return
             
         self.scheduler_running = True
+        self._stop_event.clear()
         
         # 스케줄러 스레드 생성 및 시작
         def scheduler_loop():
             logger.info("스케줄러 스레드 시작됨")
             
-            # 출력 버퍼 플러시 설정
-            sys.stdout.flush()
+            first_iteration = True
+            
+            # 루프에서 반복 사용하는 메서드는 지역 변수로 한 번만 조회
+            run_once = self.scheduler.run_once
+            wait_for_next_run = self.scheduler.wait_for_next_run
+            stop_wait = self._stop_event.wait
             
             # 스케줄러가 running 상태인 동안 계속 실행
             while self.scheduler_running:
                 try:
                     # no_immediate_run이 True이고 첫 번째 실행인 경우 대기
-                    if no_immediate_run and 'first_run' not in locals():
-                        first_run = False
+                    if no_immediate_run and first_iteration:
+                        first_iteration = False
                         logger.info(f"즉시 실행 모드가 비활성화되었습니다. {interval}초 후 첫 번째 실행이 시작됩니다.")
-                        time.sleep(interval)
+                        if stop_wait(interval):
+                            break
                         continue
                     
                     # 스케줄 실행 (오류 처리는 run_once 내부에서 이미 처리)
-                    self.scheduler.run_once()
-                    
-                    # 로그 출력 후 표준 출력 버퍼 강제 플러시
-                    sys.stdout.flush()
+                    run_once()
                     
-                    # 다음 확인 전 대기
-                    time.sleep(interval)
+                    # 가장 가까운 다음 실행 시간까지 대기 (최대 interval초, 스케줄 변경 또는 중지 신호 시 즉시 깨어남)
+                    wait_for_next_run(interval)
+                    if self._stop_event.is_set():
+                        break
                 except Exception as e:
-                    # 예외 발생 시 스택 트레이스 출력하고 계속 실행
-                    logger.error(f"스케줄러 실행 중 오류 발생: {str(e)}")
-                    logger.error(traceback.format_exc())
+                    # 예외 발생 시 스택 트레이스 출력하고 계속 실행 (포맷은 핸들러에서 필요할 때만 수행)
+                    logger.error("스케줄러 실행 중 오류 발생: %s", e, exc_info=True)
                     # 오류 발생 시에도 계속 실행
                     logger.info("스케줄러가 오류에서 회복을 시도합니다.")
                     # 짧은 시간만 대기 후 재시도
-                    time.sleep(5)
+                    if stop_wait(5):
+                        break
                     
             logger.info("스케줄러 스레드 종료됨")
         
@@ -328,6 +530,8 @@ class Orchestrator:
             
         logger.info("스케줄러 중지 중...")
         self.scheduler_running = False
+        self._stop_event.set()
+        self.scheduler.wake()
         
         # 스레드 종료 대기
         if self.scheduler_thread:
@@ -336,6 +540,9 @@ class Orchestrator:
                 logger.warning("스케줄러 스레드가 10초 동안 종료되지 않았습니다.")
             else:
                 logger.info("스케줄러가 정상적으로 중지되었습니다.")
+        
+        # 저장되지 않은 스케줄 변경 사항 저장
+        self.scheduler._flush_dirty()
     
     def get_all_pipelines(self) -> List[Dict[str, Any]]:
         """
@@ -344,21 +551,41 @@ class Orchestrator:
         Returns:
             파이프라인 정보 목록
         """
-        pipelines = []
+        return list(self._iter_pipelines())
+    
+    def iter_all_pipelines_json(self) -> Iterator[bytes]:
+        """
+        모든 파이프라인 정보를 JSON 배열 조각으로 스트리밍
+        
+        중간 목록을 만들지 않고 파이프라인별로 직렬화하므로 HTTP 응답 등에 바로 전달할 수 있습니다.
+        
+        Returns:
+            JSON 배열을 구성하는 bytes 조각 이터레이터
+        """
+        yield b"["
+        for index, pipeline in enumerate(self._iter_pipelines()):
+            yield (b"," if index else b"") + dump_json(pipeline)
+        yield b"]"
+    
+    def _iter_pipelines(self) -> Iterator[Dict[str, Any]]:
+        """
+        스케줄이 있는 파이프라인 정보 순회
+        
+        Returns:
+            파이프라인 정보 이터레이터
+        """
+        schedules = self.scheduler.get_all_schedules()
+        
+        # 파이프라인 ID 추출 (YAML 파일 로드가 필요한 경우 스레드 풀로 병렬 처리, 순서 유지)
+        if sum(isinstance(schedule.pipeline_config, (str, Path)) for schedule in schedules) > 1:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=min(16, len(schedules))) as executor:
+                pipeline_ids = list(executor.map(self._extract_pipeline_id, schedules))
+        else:
+            pipeline_ids = [self._extract_pipeline_id(schedule) for schedule in schedules]
         
         # 스케줄이 있는 파이프라인 조회
-        for schedule in self.scheduler.get_all_schedules():
-            # 파이프라인 ID 추출
-            if isinstance(schedule.pipeline_config, (str, Path)):
-                try:
-                    config = PipelineConfig.from_yaml(schedule.pipeline_config)
-                    pipeline_id = config.pipeline_id
-                except Exception:
-                    pipeline_id = str(schedule.pipeline_config)
-            else:
-                pipeline_id = schedule.pipeline_config.pipeline_id
-                
-            pipelines.append({
+        for schedule, pipeline_id in zip(schedules, pipeline_ids):
+            yield {
                 "schedule_id": schedule.id,
                 "pipeline_id": pipeline_id,
                 "cron_expression": schedule.cron_expression,
@@ -366,9 +593,25 @@ class Orchestrator:
                 "enabled": schedule.enabled,
                 "dependencies": schedule.dependencies,
                 "max_retries": schedule.max_retries
-            })
+            }
+    
+    @staticmethod
+    def _extract_pipeline_id(schedule: ScheduleConfig) -> str:
+        """
+        스케줄에서 파이프라인 ID 추출
         
-        return pipelines
+        Args:
+            schedule: 스케줄 설정
+            
+        Returns:
+            파이프라인 ID (설정 파일을 읽을 수 없으면 경로 문자열)
+        """
+        if isinstance(schedule.pipeline_config, (str, Path)):
+            try:
+                return _load_pipeline_config(schedule.pipeline_config).pipeline_id
+            except Exception:
+                return str(schedule.pipeline_config)
+        return schedule.pipeline_config.pipeline_id
     
     def update_pipeline(self, 
                       schedule_id: str, 
@@ -389,22 +632,23 @@ class Orchestrator:
         Returns:
             업데이트 성공 여부
         """
-        update_args = {}
+        candidates = {
+            "enabled": enabled,
+            "cron_expression": cron_expression,
+            "dependencies": dependencies,
+            "max_retries": max_retries
+        }
+        update_args = {key: value for key, value in candidates.items() if value is not None}
         
-        if enabled is not None:
-            update_args["enabled"] = enabled
-        if cron_expression is not None:
-            update_args["cron_expression"] = cron_expression
-        if dependencies is not None:
-            update_args["dependencies"] = dependencies
-        if max_retries is not None:
-            update_args["max_retries"] = max_retries
-            
         if not update_args:
             logger.warning("업데이트할 속성이 지정되지 않았습니다.")
             return False
-            
-        return self.scheduler.update_schedule(schedule_id, **update_args)
+        
+        try:
+            return self.scheduler.update_schedule(schedule_id, **update_args)
+        except ValueError as e:
+            logger.warning(f"스케줄 {schedule_id}를 업데이트할 수 없습니다: {e}")
+            return False
     
     def remove_pipeline(self, schedule_id: str) -> bool:
         """
@@ -431,9 +675,40 @@ class Orchestrator:
         Returns:
             취소 성공 여부
         """
-        if task_id and self.use_celery:
-            # Celery 작업 취소
-            return self.task_manager.revoke_task(task_id, terminate=True)
+        if not self.use_celery:
+            logger.warning("Celery를 사용하지 않는 경우 실행 취소를 지원하지 않습니다.")
+            return False
+        
+        # 실행 ID만 주어진 경우 제출 시 기록한 작업 ID 사용
+        if not task_id and execution_id:
+            task_id = self._task_id_by_exec_id.get(execution_id)
+        
+        if not task_id:
+            logger.warning(f"취소할 작업을 찾을 수 없습니다 (실행 ID: {execution_id})")
+            return False
+        
+        # Celery 작업 취소
+        return bool(self.task_manager.revoke_task(task_id, terminate=True))
+    
+    def cancel_executions(self, task_ids: List[str]) -> bool:
+        """
+        여러 실행 일괄 취소
+        
+        Args:
+            task_ids: 작업 ID 목록 (Celery 사용 시)
+            
+        Returns:
+            취소 성공 여부
+        """
+        if not self.use_celery:
+            logger.warning("Celery를 사용하지 않는 경우 실행 취소를 지원하지 않습니다.")
+            return False
+        
+        if not task_ids:
+            return True
+        
+        # 하나의 브로드캐스트 메시지로 모두 취소
+        return bool(self.task_manager.revoke_tasks(task_ids, terminate=True))
     
     def add_pipeline_dependency(self, schedule_id: str, dependency_id: str) -> bool:
         """
@@ -458,17 +733,23 @@ class Orchestrator:
             logger.warning(f"의존 대상 스케줄 ID {dependency_id}를 찾을 수 없습니다.")
             return False
         
+        # 순서를 유지하는 집합으로 O(1) 멤버십 확인
+        dependencies = dict.fromkeys(schedule.dependencies or ())
+        
         # 이미 의존성이 있으면 추가하지 않음
-        if schedule.dependencies and dependency_id in schedule.dependencies:
+        if dependency_id in dependencies:
             logger.info(f"스케줄 {schedule_id}는 이미 {dependency_id}에 의존하고 있습니다.")
             return False
             
         # 의존성 목록에 추가
-        dependencies = list(schedule.dependencies) if schedule.dependencies else []
-        dependencies.append(dependency_id)
+        dependencies[dependency_id] = None
         
-        # 스케줄 업데이트
-        return self.scheduler.update_schedule(schedule_id, dependencies=dependencies)
+        # 스케줄 업데이트 (저장 형식은 리스트 유지)
+        try:
+            return self.scheduler.update_schedule(schedule_id, dependencies=list(dependencies))
+        except ValueError as e:
+            logger.warning(f"스케줄 {schedule_id}에 의존성 {dependency_id}를 추가할 수 없습니다: {e}")
+            return False
     
     def remove_pipeline_dependency(self, schedule_id: str, dependency_id: str) -> bool:
         """
@@ -487,19 +768,21 @@ class Orchestrator:
             logger.warning(f"스케줄 ID {schedule_id}를 찾을 수 없습니다.")
             return False
         
+        # 순서를 유지하는 집합으로 O(1) 멤버십 확인
+        dependencies = dict.fromkeys(schedule.dependencies or ())
+        
         # 의존성이 없으면 제거할 수 없음
-        if not schedule.dependencies or dependency_id not in schedule.dependencies:
+        if dependency_id not in dependencies:
             logger.warning(f"스케줄 {schedule_id}는 {dependency_id}에 의존하고 있지 않습니다.")
             return False
             
         # 의존성 목록에서 제거
-        dependencies = list(schedule.dependencies)
-        dependencies.remove(dependency_id)
+        del dependencies[dependency_id]
         
-        # 스케줄 업데이트
-        return self.scheduler.update_schedule(schedule_id, dependencies=dependencies)
+        # 스케줄 업데이트 (저장 형식은 리스트 유지)
+        return self.scheduler.update_schedule(schedule_id, dependencies=list(dependencies))
     
-    def get_pipeline_dependencies(self, schedule_id: str) -> List[str]:
+    def get_pipeline_dependencies(self, schedule_id: str) -> Tuple[str, ...]:
         """
         파이프라인 의존성 조회
         
@@ -507,7 +790,7 @@ class Orchestrator:
             schedule_id: 스케줄 ID
             
         Returns:
-            의존성 목록
+            의존성 목록 (읽기 전용 튜플, 수정이 필요하면 list()로 변환)
         """
         # 스케줄 확인
         schedule = self.scheduler.get_schedule(schedule_id)
@@ -515,4 +798,4 @@ class Orchestrator:
             raise OrchestratorError(f"스케줄 ID {schedule_id}를 찾을 수 없습니다.")
             
         # 의존성 목록 반환
-        return schedule.dependencies or [] 
\ No newline at end of file
+        return tuple(schedule.dependencies) if schedule.dependencies else _EMPTY_DEPS 
\ No newline at end of file
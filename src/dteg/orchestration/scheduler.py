@@ -3,24 +3,398 @@
 
 파이프라인의 스케줄링 및 실행 관리를 위한 클래스 구현
 """
+import atexit
+import collections
+import concurrent.futures
+import contextlib
+import contextvars
+import copy
+import functools
+import heapq
 import logging
+import threading
 import time
-from datetime import datetime
-from typing import Dict, List, Optional, Callable, Union
+import weakref
+from datetime import datetime, timedelta
+from typing import Deque, Dict, Iterable, List, Optional, Callable, Set, Tuple, Union
 import croniter
 import uuid
 from pathlib import Path
 import os
-import json
 
 from dteg.core.pipeline import Pipeline
 from dteg.core.config import PipelineConfig
+from dteg.utils.fileio import atomic_write, dump_json, load_json, loads_json
 
 logger = logging.getLogger(__name__)
 
+# 메모리에 유지할 최대 완료 실행 기록 수
+MAX_COMPLETED_EXECUTIONS = 1000
+
+# 실행 기록 하나에 유지할 최대 로그 줄 수 (초과 시 오래된 줄부터 제거)
+MAX_LOG_LINES = 10000
+
+# 스케줄러가 동시에 실행할 기본 최대 파이프라인 수 (파이프라인은 커넥터 I/O 위주이므로 ThreadPoolExecutor 기본값과 같은 기준)
+DEFAULT_MAX_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+
+# 다음 실행 시간까지 대기할 때의 최소 대기 시간(초)
+MIN_WAKE_INTERVAL = 0.1
+
+# run_once에서 변경된 스케줄을 모아서 파일에 저장하는 최소 간격(초)
+SCHEDULE_FLUSH_INTERVAL = 1.0
+
+# 이전 버전에서 모든 스케줄을 저장하던 단일 파일 이름
+LEGACY_SCHEDULES_FILE = "schedules.json"
+
+# 완료된 실행 기록 요약을 한 줄씩 추가하는 실행 이력 색인 파일 이름
+HISTORY_INDEX_FILE = "_index.jsonl"
+
+# 웹 UI 데이터베이스에 저장하지 못한 실행 로그 파일 확장자 (실행 이력 디렉토리에 실행 ID별로 저장)
+EXECUTION_LOG_SUFFIX = ".log"
+
+# 실행 이력 색인을 정리(압축)할 기준 줄 수
+HISTORY_INDEX_COMPACT_LINES = 10 * MAX_COMPLETED_EXECUTIONS
+
+# 현재 실행 중인 파이프라인의 로그 수집 버퍼 (실행 컨텍스트별로 분리)
+_run_log_buffer: contextvars.ContextVar[Optional[List[str]]] = contextvars.ContextVar(
+    "dteg_run_log_buffer", default=None
+)
+
+
+class _CollectingHandler(logging.Handler):
+    """파이프라인 실행 중 'dteg' 로거의 로그를 현재 컨텍스트의 버퍼로 수집하는 핸들러"""
+    
+    def emit(self, record):
+        buffer = _run_log_buffer.get()
+        if buffer is not None:
+            buffer.append(self.format(record))
+
+
+_collecting_handler = _CollectingHandler()
+_collecting_handler.setFormatter(logging.Formatter('%(message)s'))
+_collecting_handler_lock = threading.Lock()
+
+
+def _install_collecting_handler():
+    """로그 수집 핸들러를 'dteg' 로거에 한 번만 등록"""
+    dteg_logger = logging.getLogger('dteg')
+    with _collecting_handler_lock:
+        if _collecting_handler not in dteg_logger.handlers:
+            dteg_logger.addHandler(_collecting_handler)
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_cron(cron_expression: str) -> croniter.croniter:
+    """Cron 표현식을 한 번만 파싱하여 캐시된 croniter 템플릿 반환
+    
+    반환된 객체는 공유되므로 직접 진행시키지 말고 next_cron_run을 사용합니다.
+    """
+    return croniter.croniter(cron_expression, datetime(2000, 1, 1))
+
+
+@functools.lru_cache(maxsize=1024)
+def _classify_cron(cron_expression: str) -> Optional[Tuple[str, int, int]]:
+    """자주 쓰이는 단순 Cron 표현식 분류
+    
+    Args:
+        cron_expression: Cron 표현식
+        
+    Returns:
+        (종류, 값1, 값2) - 종류는 every_minute, every_n_minutes, hourly_at, daily_at 중 하나,
+        단순 형태가 아니면 None
+    """
+    fields = cron_expression.split()
+    if len(fields) != 5 or fields[2:] != ["*", "*", "*"]:
+        return None
+    
+    minute, hour = fields[0], fields[1]
+    if hour == "*":
+        if minute == "*":
+            return ("every_minute", 1, 0)
+        if minute.startswith("*/") and minute[2:].isdigit() and 0 < int(minute[2:]) < 60:
+            return ("every_n_minutes", int(minute[2:]), 0)
+        if minute.isdigit() and int(minute) < 60:
+            return ("hourly_at", int(minute), 0)
+    elif hour.isdigit() and int(hour) < 24 and minute.isdigit() and int(minute) < 60:
+        return ("daily_at", int(hour), int(minute))
+    return None
+
+
+def _next_simple(kind: Tuple[str, int, int], base_time: datetime) -> datetime:
+    """단순 Cron 표현식의 다음 실행 시간을 날짜 연산으로 계산 (기준 시각 이후)"""
+    name, first, second = kind
+    start = base_time.replace(second=0, microsecond=0)
+    
+    if name == "every_minute":
+        return start + timedelta(minutes=1)
+    
+    if name == "every_n_minutes":
+        minute = (start.minute // first + 1) * first
+        if minute < 60:
+            return start.replace(minute=minute)
+        return start.replace(minute=0) + timedelta(hours=1)
+    
+    if name == "hourly_at":
+        candidate = start.replace(minute=first)
+        if candidate <= base_time:
+            candidate += timedelta(hours=1)
+        return candidate
+    
+    # daily_at
+    candidate = start.replace(hour=first, minute=second)
+    if candidate <= base_time:
+        candidate += timedelta(days=1)
+    return candidate
+
+
+def next_cron_run(cron_expression: str, base_time: datetime) -> datetime:
+    """캐시된 파싱 결과로 기준 시각 이후의 다음 실행 시간 계산
+    
+    매분/N분마다/매시/매일 같은 단순 표현식은 croniter 없이 직접 계산합니다.
+    
+    Args:
+        cron_expression: Cron 표현식
+        base_time: 기준 시각
+        
+    Returns:
+        다음 실행 시간
+    """
+    kind = _classify_cron(cron_expression)
+    if kind is not None and base_time.tzinfo is None:
+        return _next_simple(kind, base_time)
+    
+    # croniter는 상태를 가지므로 파싱된 템플릿을 복사해서 사용
+    cron = copy.copy(_parse_cron(cron_expression))
+    cron.set_current(base_time)
+    return cron.get_next(ret_type=datetime)
+
+
+@functools.lru_cache(maxsize=256)
+def _load_pipeline_config_cached(path_str: str, mtime_ns: int) -> PipelineConfig:
+    """
+    YAML 파이프라인 설정 로드 (경로와 수정 시각 기준 캐시)
+    
+    파일이 수정되면 mtime이 바뀌어 캐시 키가 달라지므로 자동으로 다시 로드됩니다.
+    
+    Args:
+        path_str: 설정 파일 경로
+        mtime_ns: 설정 파일 수정 시각(ns)
+        
+    Returns:
+        파이프라인 설정 객체
+    """
+    return PipelineConfig.from_yaml(path_str)
+
+
+@functools.lru_cache(maxsize=256)
+def _config_file_has_variables(path_str: str, mtime_ns: int) -> bool:
+    """
+    설정 파일에 로드 시점마다 값이 달라질 수 있는 변수(${ENV}, {{ 변수 }})가 있는지 확인
+    (경로와 수정 시각 기준 캐시)
+    
+    Args:
+        path_str: 설정 파일 경로
+        mtime_ns: 설정 파일 수정 시각(ns)
+        
+    Returns:
+        변수 사용 여부
+    """
+    data = Path(path_str).read_bytes()
+    return b"${" in data or b"{{" in data
+
+
+def _load_pipeline_config_at(path_str: str, mtime_ns: int) -> PipelineConfig:
+    """
+    YAML 파이프라인 설정 로드
+    
+    변수가 없는 설정은 경로와 수정 시각 기준으로 캐시하고, 환경 변수나 날짜 변수를
+    사용하는 설정은 값이 매번 달라질 수 있으므로 로드할 때마다 다시 해석합니다.
+    
+    Args:
+        path_str: 설정 파일 경로
+        mtime_ns: 설정 파일 수정 시각(ns)
+        
+    Returns:
+        파이프라인 설정 객체
+    """
+    if _config_file_has_variables(path_str, mtime_ns):
+        return PipelineConfig.from_yaml(path_str)
+    return _load_pipeline_config_cached(path_str, mtime_ns)
+
+
+def _load_pipeline_config(path: Union[str, Path]) -> PipelineConfig:
+    """
+    캐시를 통해 YAML 파이프라인 설정 로드
+    
+    Args:
+        path: 설정 파일 경로
+        
+    Returns:
+        파이프라인 설정 객체
+    """
+    return _load_pipeline_config_at(str(path), os.stat(path).st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=256)
+def _pipeline_config_dict_cached(path_str: str, mtime_ns: int) -> Dict:
+    """
+    변수가 없는 YAML 파이프라인 설정의 사전 변환 결과 (경로와 수정 시각 기준 캐시)
+    
+    Args:
+        path_str: 설정 파일 경로
+        mtime_ns: 설정 파일 수정 시각(ns)
+        
+    Returns:
+        파이프라인 설정 사전
+    """
+    return _load_pipeline_config_cached(path_str, mtime_ns).dict()
+
+
+def _load_pipeline_config_dict(path: Union[str, Path]) -> Dict:
+    """
+    캐시를 통해 YAML 파이프라인 설정을 사전 형태로 로드
+    
+    변수가 없는 설정은 사전 변환 결과도 캐시하여 공유하므로 반환된 사전을 수정하면 안 됩니다.
+    
+    Args:
+        path: 설정 파일 경로
+        
+    Returns:
+        파이프라인 설정 사전
+    """
+    path_str = str(path)
+    mtime_ns = os.stat(path).st_mtime_ns
+    if _config_file_has_variables(path_str, mtime_ns):
+        return PipelineConfig.from_yaml(path_str).dict()
+    return _pipeline_config_dict_cached(path_str, mtime_ns)
+
+
+@functools.lru_cache(maxsize=None)
+def _web_db_modules():
+    """
+    웹 UI DB 세션 팩토리와 모델 모듈을 한 번만 임포트하여 반환
+    
+    모듈을 사용할 수 없는 경우도 캐시하여 호출마다 임포트를 다시 시도하지 않습니다.
+    
+    Returns:
+        (SessionLocal, database_models 모듈), 웹 UI 데이터베이스 모듈이 없으면 None
+    """
+    try:
+        from dteg.web.database import SessionLocal
+        from dteg.web.models import database_models
+    except ImportError:
+        return None
+    return SessionLocal, database_models
+
+
+def _schedule_pipeline_id(schedule: 'ScheduleConfig') -> str:
+    """
+    스케줄이 실행하는 파이프라인 ID
+    
+    설정 파일 경로이면 실행 기록과 같은 기준이 되도록 파일의 pipeline_id를 사용합니다.
+    (schedule.resolved() 캐시를 사용하므로 파일을 다시 파싱하지 않음)
+    
+    Args:
+        schedule: 스케줄 설정 객체
+        
+    Returns:
+        파이프라인 ID (설정을 확인할 수 없으면 경로/ID 문자열)
+    """
+    try:
+        _, resolved_config = schedule.resolved()
+    except Exception:
+        resolved_config = None
+    if resolved_config is not None:
+        return resolved_config.pipeline_id
+    return getattr(schedule.pipeline_config, 'pipeline_id', str(schedule.pipeline_config))
+
+
+def _pipeline_id_of(pipeline_config: Union[PipelineConfig, str, Path]) -> str:
+    """
+    파이프라인 설정의 파이프라인 ID
+    
+    설정 파일 경로이면 캐시를 통해 로드한 설정의 pipeline_id를 사용합니다.
+    
+    Args:
+        pipeline_config: 파이프라인 설정 객체 또는 설정 파일 경로/파이프라인 ID
+        
+    Returns:
+        파이프라인 ID (설정을 확인할 수 없으면 경로/ID 문자열)
+    """
+    if isinstance(pipeline_config, (str, Path)):
+        try:
+            return _load_pipeline_config(pipeline_config).pipeline_id
+        except Exception:
+            return str(pipeline_config)
+    return getattr(pipeline_config, 'pipeline_id', str(pipeline_config))
+
+
+# 이 프로세스에서 이미 존재를 확인한 디렉토리
+_ensured_dirs: Set[Path] = set()
+
+
+def _ensure_dir(path: Path) -> None:
+    """
+    디렉토리가 없으면 생성 (경로별로 프로세스당 한 번만 확인)
+    
+    Args:
+        path: 디렉토리 경로
+    """
+    if path in _ensured_dirs:
+        return
+    path.mkdir(parents=True, exist_ok=True)
+    _ensured_dirs.add(path)
+
+
+# 프로세스 종료 시 저장되지 않은 스케줄 변경 사항을 저장할 스케줄러 목록
+_live_schedulers: "weakref.WeakSet[Scheduler]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_live_schedulers() -> None:
+    """프로세스 종료 시 살아 있는 모든 스케줄러의 변경된 스케줄 저장"""
+    for scheduler in list(_live_schedulers):
+        try:
+            scheduler._flush_dirty()
+        except Exception as e:
+            logger.error(f"종료 시 스케줄 저장 실패: {e}")
+
+
+def _parse_time(value: Union[str, float]) -> datetime:
+    """
+    저장된 시각 복원
+    
+    Args:
+        value: UNIX 타임스탬프 또는 ISO 8601 문자열
+        
+    Returns:
+        시각 (로컬 시간 기준 naive datetime)
+    """
+    if isinstance(value, (int, float)):
+        return datetime.fromtimestamp(value)
+    return datetime.fromisoformat(value)
+
+
+class _StoredPipeline:
+    """DB 또는 파이프라인 파일에서 읽은 파이프라인 정보 (DB Pipeline 객체와 호환되는 형태)"""
+    
+    __slots__ = ('id', 'config')
+    
+    def __init__(self, id: str, config: Dict):
+        self.id = id
+        self.config = config
+
+
 class ScheduleConfig:
     """파이프라인 스케줄 설정 클래스"""
     
+    __slots__ = (
+        'id', 'pipeline_config', 'cron_expression', 'enabled', '_dependencies', '_has_deps',
+        'max_retries', 'retry_delay', 'last_run_time', 'last_run_status',
+        '_resolved_for', '_resolved_path', '_resolved_config',
+        '_next_run', '_next_run_ts', '_next_run_iso'
+    )
+    
     def __init__(
         self,
         pipeline_config: Union[PipelineConfig, str, Path],
@@ -28,7 +402,8 @@ class ScheduleConfig:
         enabled: bool = True,
         dependencies: List[str] = None,
         max_retries: int = 3,
-        retry_delay: int = 300  # 5분
+        retry_delay: int = 300,  # 5분
+        next_run: Optional[datetime] = None
     ):
         """
         스케줄 설정 초기화
@@ -40,6 +415,7 @@ class ScheduleConfig:
             dependencies: 이 파이프라인의 실행 전에 완료되어야 하는 파이프라인 ID 목록
             max_retries: 실패 시 최대 재시도 횟수
             retry_delay: 재시도 간 지연 시간(초)
+            next_run: 다음 실행 시간 (없으면 현재 시각 기준으로 계산)
         """
         self.id = str(uuid.uuid4())
         self.pipeline_config = pipeline_config
@@ -48,21 +424,99 @@ class ScheduleConfig:
         self.dependencies = dependencies or []
         self.max_retries = max_retries
         self.retry_delay = retry_delay
-        self.next_run = self._get_next_run()
         
-        # 유효성 검사
-        if not croniter.croniter.is_valid(cron_expression):
+        # 마지막 실행 시각과 결과 (SUCCESS, FAILED)
+        self.last_run_time: Optional[datetime] = None
+        self.last_run_status: Optional[str] = None
+        
+        # 설정 파일 확인/로드 결과 캐시 (resolved() 참조)
+        self._resolved_for = None
+        self._resolved_path: Optional[Path] = None
+        self._resolved_config: Optional[PipelineConfig] = None
+        
+        # 유효성 검사 (파싱 결과는 캐시되어 이후 다음 실행 시간 계산에서 재사용)
+        try:
+            _parse_cron(cron_expression)
+        except (ValueError, KeyError, TypeError):
             raise ValueError(f"유효하지 않은 Cron 표현식: {cron_expression}")
+        
+        self.next_run = next_run if next_run is not None else self._get_next_run()
+    
+    def resolved(self) -> Tuple[Optional[Path], Optional[PipelineConfig]]:
+        """설정 파일 경로와 파이프라인 설정 반환
+        
+        설정 파일은 호출마다 stat 한 번으로 수정 여부만 확인하고, 수정된 경우에만 다시 파싱합니다.
+        (환경 변수나 날짜 변수를 사용하는 설정은 호출마다 다시 해석)
+        파이프라인 ID로 확인된 값은 pipeline_config가 바뀔 때까지 다시 확인하지 않습니다.
+        
+        Returns:
+            (설정 파일 경로, 파이프라인 설정) - 설정 객체이면 경로는 None,
+            존재하지 않는 경로(파이프라인 ID)이면 둘 다 None
+        """
+        pipeline_config = self.pipeline_config
+        if isinstance(pipeline_config, PipelineConfig):
+            return None, pipeline_config
+        
+        if self._resolved_for is pipeline_config and self._resolved_path is None:
+            return None, None
+        
+        self._resolved_for = pipeline_config
+        self._resolved_path = None
+        self._resolved_config = None
+        if isinstance(pipeline_config, (str, Path)):
+            try:
+                mtime_ns = os.stat(pipeline_config).st_mtime_ns
+            except OSError:
+                return None, None
+            self._resolved_config = _load_pipeline_config_at(str(pipeline_config), mtime_ns)
+            self._resolved_path = Path(pipeline_config)
+        
+        return self._resolved_path, self._resolved_config
+    
+    @property
+    def dependencies(self) -> List[str]:
+        """이 파이프라인의 실행 전에 완료되어야 하는 파이프라인 ID 목록"""
+        return self._dependencies
+    
+    @dependencies.setter
+    def dependencies(self, value: Optional[List[str]]):
+        # 의존성 유무를 함께 기록하여 실행 루프에서 빠르게 확인
+        self._dependencies = value or []
+        self._has_deps = bool(self._dependencies)
+    
+    @property
+    def next_run(self) -> Optional[datetime]:
+        """다음 실행 시간"""
+        return self._next_run
+    
+    @next_run.setter
+    def next_run(self, value: Optional[datetime]):
+        # 스케줄러 힙 비교용 UNIX 타임스탬프도 함께 갱신 (ISO 문자열은 to_dict에서 필요할 때 생성)
+        self._next_run = value
+        self._next_run_ts = value.timestamp() if value is not None else None
+        self._next_run_iso = None
+    
+    @property
+    def next_run_ts(self) -> Optional[float]:
+        """다음 실행 시간의 UNIX 타임스탬프"""
+        return self._next_run_ts
+    
+    def _next_from(self, base_time: datetime) -> datetime:
+        """기준 시각 이후의 다음 실행 시간 계산"""
+        return next_cron_run(self.cron_expression, base_time)
     
     def _get_next_run(self) -> datetime:
         """다음 실행 시간 계산"""
-        cron = croniter.croniter(self.cron_expression, datetime.now())
-        return cron.get_next(ret_type=datetime)
+        return self._next_from(datetime.now())
     
     def update_next_run(self):
         """다음 실행 시간 업데이트"""
-        cron = croniter.croniter(self.cron_expression, datetime.now())
-        self.next_run = cron.get_next(ret_type=datetime)
+        self.next_run = self._next_from(datetime.now())
+    
+    def schedule_retry(self):
+        """재시도 지연 시간(retry_delay) 후로 다음 실행 시간 설정 (다음 정기 실행 시간이 더 빠르면 정기 실행 시간 사용)"""
+        now = datetime.now()
+        self.next_run = min(self._next_from(now), now + timedelta(seconds=self.retry_delay))
 
     def get_next_run_time(self) -> Optional[datetime]:
         """다음 실행 시간 반환
@@ -73,24 +527,25 @@ class ScheduleConfig:
         if not self.enabled:
             return None
             
-        cron = croniter.croniter(self.cron_expression, datetime.now())
-        return cron.get_next(ret_type=datetime)
+        return self._next_from(datetime.now())
 
     def to_dict(self) -> Dict:
         """사전 형태로 변환"""
-        pipeline_config_str = str(self.pipeline_config)
-        if isinstance(self.pipeline_config, PipelineConfig):
-            pipeline_config_str = self.pipeline_config.pipeline_id
-            
+        # 다음 실행 시간 ISO 문자열은 next_run이 바뀔 때까지 재사용
+        if self._next_run_iso is None and self._next_run is not None:
+            self._next_run_iso = self._next_run.isoformat()
+        
+        pipeline_config = self.pipeline_config
         return {
             "id": self.id,
-            "pipeline_config": pipeline_config_str,
+            "pipeline_config": (pipeline_config.pipeline_id if isinstance(pipeline_config, PipelineConfig)
+                                else str(pipeline_config)),
             "cron_expression": self.cron_expression,
             "enabled": self.enabled,
-            "dependencies": self.dependencies,
+            "dependencies": self._dependencies,
             "max_retries": self.max_retries,
             "retry_delay": self.retry_delay,
-            "next_run": self.next_run.isoformat() if self.next_run else None
+            "next_run": self._next_run_iso
         }
     
     @classmethod
@@ -109,23 +564,21 @@ class ScheduleConfig:
                 if alt_path.exists():
                     pipeline_config = str(alt_path)
         
+        # 저장된 다음 실행 시간이 있으면 그대로 사용 (없으면 생성 시 계산)
+        next_run = data.get("next_run")
+        
         instance = cls(
             pipeline_config=pipeline_config,
             cron_expression=data["cron_expression"],
             enabled=data["enabled"],
             dependencies=data["dependencies"],
             max_retries=data["max_retries"],
-            retry_delay=data["retry_delay"]
+            retry_delay=data["retry_delay"],
+            next_run=datetime.fromisoformat(next_run) if next_run else None
         )
         
         # ID 복원
         instance.id = data["id"]
-        
-        # 다음 실행 시간 복원
-        if data.get("next_run"):
-            instance.next_run = datetime.fromisoformat(data["next_run"])
-        else:
-            instance.update_next_run()
             
         return instance
 
@@ -133,6 +586,11 @@ class ScheduleConfig:
 class ExecutionRecord:
     """파이프라인 실행 기록 클래스"""
     
+    __slots__ = (
+        'id', 'schedule_id', 'pipeline_id', 'start_time', 'end_time',
+        'status', 'retry_count', 'error_message', 'logs'
+    )
+    
     def __init__(self, schedule_id: str, pipeline_id: str):
         """
         실행 기록 초기화
@@ -149,7 +607,16 @@ class ExecutionRecord:
         self.status = "RUNNING"  # RUNNING, SUCCESS, FAILED, RETRYING
         self.retry_count = 0
         self.error_message = None
-        self.logs = []
+        self.logs: Deque[str] = collections.deque(maxlen=MAX_LOG_LINES)
+    
+    def _log(self, message: str):
+        """
+        현재 시각을 접두어로 붙여 실행 로그 추가
+        
+        Args:
+            message: 로그 메시지
+        """
+        self.logs.append(f"[{datetime.now().isoformat()}] {message}")
     
     def complete(self, success: bool, error_message: Optional[str] = None):
         """
@@ -185,8 +652,35 @@ class ExecutionRecord:
             "status": self.status,
             "retry_count": self.retry_count,
             "error_message": self.error_message,
-            "logs": self.logs
+            "logs": list(self.logs)
+        }
+    
+    def to_summary(self) -> Dict:
+        """로그를 제외한 요약 사전으로 변환 (실행 이력 색인용, 시각은 UNIX 타임스탬프)"""
+        return {
+            "id": self.id,
+            "schedule_id": self.schedule_id,
+            "pipeline_id": self.pipeline_id,
+            "start_time": self.start_time.timestamp(),
+            "end_time": self.end_time.timestamp() if self.end_time else None,
+            "status": self.status,
+            "retry_count": self.retry_count,
+            "error_message": self.error_message
         }
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'ExecutionRecord':
+        """사전에서 실행 기록 복원 (간소화 버전, 시각은 ISO 문자열 또는 UNIX 타임스탬프)"""
+        record = cls(data["schedule_id"], data["pipeline_id"])
+        record.id = data["id"]
+        record.start_time = _parse_time(data["start_time"])
+        if data["end_time"]:
+            record.end_time = _parse_time(data["end_time"])
+        record.status = data["status"]
+        record.retry_count = data["retry_count"]
+        record.error_message = data["error_message"]
+        record.logs.extend(data.get("logs") or ())
+        return record
 
 
 class Scheduler:
@@ -195,7 +689,9 @@ class Scheduler:
     def __init__(self, 
                  history_dir: Optional[Union[str, Path]] = None,
                  schedule_dir: Optional[Union[str, Path]] = None,
-                 on_execution_complete: Optional[Callable[[ExecutionRecord], None]] = None):
+                 on_execution_complete: Optional[Callable[[ExecutionRecord], None]] = None,
+                 max_workers: Optional[int] = None,
+                 max_history: Optional[int] = None):
         """
         스케줄러 초기화
         
@@ -203,27 +699,116 @@ class Scheduler:
             history_dir: 실행 이력을 저장할 디렉토리 (기본값: ~/.dteg/history)
             schedule_dir: 스케줄 설정을 저장할 디렉토리 (기본값: ~/.dteg/schedules)
             on_execution_complete: 실행 완료 시 호출될 콜백 함수
+            max_workers: 동시에 실행할 최대 파이프라인 수 (기본값: min(32, CPU 수 + 4))
+            max_history: 메모리에 유지할 최대 완료 실행 기록 수 (기본값: MAX_COMPLETED_EXECUTIONS)
         """
         self.schedules: Dict[str, ScheduleConfig] = {}
         self.running_executions: Dict[str, ExecutionRecord] = {}
-        self.completed_executions: List[ExecutionRecord] = []
+        self._completed_executions: Deque[ExecutionRecord] = collections.deque(
+            maxlen=max_history or MAX_COMPLETED_EXECUTIONS
+        )
         self.on_execution_complete = on_execution_complete
         
+        # 스케줄 변경 및 저장 보호용 잠금
+        self._lock = threading.RLock()
+        
+        # 다음 실행 시간 기준 최소 힙 (실행 대기 스케줄만 꺼내기 위함)
+        # 같은 시각에는 의존 체인이 긴(임계 경로상의) 스케줄이 먼저 나오도록 -bottom level을 보조 키로 사용
+        # 실행 시간은 UNIX 타임스탬프(float)로 비교하며, _heap_next에는 스케줄별로 유효한 힙 항목의 실행 시간을 기록하고, 나머지 항목은 꺼낼 때 무시
+        self._heap: List[Tuple[float, int, str]] = []
+        self._heap_next: Dict[str, float] = {}
+        
+        # 스케줄 의존성 그래프 (스케줄 ID -> 의존하는 스케줄 ID 목록)와 bottom level 캐시
+        # 스케줄 추가/제거 또는 의존성 변경 시에만 무효화
+        self._dag: Optional[Dict[str, List[str]]] = None
+        self._bottom_level: Dict[str, int] = {}
+        
+        # 동시에 실행 시간이 된 독립 스케줄을 병렬 실행할 작업 풀
+        self._pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers or DEFAULT_MAX_WORKERS, thread_name_prefix="dteg-scheduler"
+        )
+        
+        # 스케줄 ID별 연속 실패 후 재시도 횟수 (성공하거나 재시도 횟수를 모두 쓰면 제거)
+        self._retry_counts: Dict[str, int] = {}
+        
+        # 파이프라인 ID별 마지막 성공 실행 기록 (의존성 확인용)
+        self._last_success: Dict[str, ExecutionRecord] = {}
+        
+        # 저장된 실행 이력 로드 여부 (처음 필요할 때 한 번만 로드)
+        self._history_loaded = False
+        
+        # 스케줄 변경 시 실행 루프의 대기를 깨우기 위한 이벤트
+        self._wake = threading.Event()
+        
+        # run_once 동안 실행 기록/스케줄 DB 쓰기를 모아 한 번에 커밋할 세션 (작업 스레드 간 공유 보호용 잠금)
+        self._db_batch = None
+        self._db_lock = threading.Lock()
+        
+        # run_once 동안 모아 두었다가 커밋 직전에 한 번에 반영할 스케줄별 다음 실행 시간
+        self._db_next_runs: Dict[str, datetime] = {}
+        
+        # run_once 동안 배치 세션에 기록한 실행 기록과 기록 성공 여부 (로그는 커밋 결과를 확인한 뒤 해제)
+        self._db_batch_records: List[Tuple[ExecutionRecord, bool]] = []
+        
+        # 실행 이력 색인 파일 추가 쓰기 보호용 잠금
+        self._index_lock = threading.Lock()
+        
+        # 이 프로세스에서 로그 파일로 저장한 실행 ID (완료 목록에서 밀려나면 로그 파일 삭제)
+        self._spilled_logs: Set[str] = set()
+        
+        # 웹 UI DB에서 읽은 파이프라인 정보 캐시 (파이프라인 ID -> ((생성 시각, 수정 시각), 파이프라인 정보))
+        self._db_pipeline_cache: Dict[str, Tuple[Tuple[Optional[datetime], Optional[datetime]], _StoredPipeline]] = {}
+        
+        # 파일 저장이 필요한 스케줄 ID (변경된 스케줄만 모아서 저장)
+        self._dirty: set = set()
+        
+        # 마지막으로 변경된 스케줄을 파일에 저장한 시각 (time.monotonic 기준)
+        self._last_flush = 0.0
+        
+        # 작업 풀에서 진행 중인 run_once 이후 저장 작업 (한 번에 하나만 제출)
+        self._flush_future: Optional[concurrent.futures.Future] = None
+        
+        # 스케줄별로 마지막에 파일에 기록한 내용 (내용이 같으면 다시 쓰지 않음)
+        self._saved_contents: Dict[str, bytes] = {}
+        
+        # 스케줄 파일 쓰기 순서 보장용 잠금 (_lock보다 먼저 획득, 쓰기 중에는 _lock을 보유하지 않음)
+        self._file_lock = threading.Lock()
+        
         # 이력 디렉토리 설정
         if history_dir is None:
             history_dir = Path.home() / ".dteg" / "history"
         self.history_dir = Path(history_dir)
-        self.history_dir.mkdir(parents=True, exist_ok=True)
+        _ensure_dir(self.history_dir)
         
         # 스케줄 디렉토리 설정
         if schedule_dir is None:
             schedule_dir = Path.home() / ".dteg" / "schedules"
         self.schedule_dir = Path(schedule_dir)
-        self.schedule_dir.mkdir(parents=True, exist_ok=True)
+        _ensure_dir(self.schedule_dir)
         
-        # 이전 실행 이력 및 스케줄 로드
-        self._load_history()
+        # 파이프라인 실행 로그 수집 핸들러 등록 (프로세스당 한 번)
+        _install_collecting_handler()
+        
+        # 저장된 스케줄 로드 (실행 이력은 실행 기록/의존성 확인이 처음 필요할 때 로드)
         self._load_schedules()
+        
+        # 프로세스 종료 시 저장되지 않은 변경 사항 저장
+        _live_schedulers.add(self)
+    
+    @property
+    def completed_executions(self) -> Deque[ExecutionRecord]:
+        """최근 완료된 실행 기록 (최대 max_history개)"""
+        self._ensure_history_loaded()
+        return self._completed_executions
+    
+    def _ensure_history_loaded(self):
+        """저장된 실행 이력을 아직 로드하지 않았으면 한 번만 로드"""
+        if self._history_loaded:
+            return
+        with self._lock:
+            if not self._history_loaded:
+                self._history_loaded = True
+                self._load_history()
     
     def add_schedule(self, schedule_config: ScheduleConfig) -> str:
         """
@@ -234,11 +819,21 @@ class Scheduler:
             
         Returns:
             추가된 스케줄의 ID
+            
+        Raises:
+            ValueError: 순환 의존성이 생기는 경우
         """
-        self.schedules[schedule_config.id] = schedule_config
-        logger.info(f"스케줄 추가됨: {schedule_config.id} - 다음 실행: {schedule_config.next_run}")
-        # 스케줄 저장
-        self._save_schedules()
+        with self._lock:
+            self._check_acyclic(self._dependency_graph(exclude=(schedule_config.id,)),
+                                _schedule_pipeline_id(schedule_config), schedule_config.dependencies)
+            self.schedules[schedule_config.id] = schedule_config
+            self._dag = None
+            self._push_schedule(schedule_config)
+            logger.info(f"스케줄 추가됨: {schedule_config.id} - 다음 실행: {schedule_config.next_run}")
+            # 추가된 스케줄만 저장
+            self._dirty.add(schedule_config.id)
+        self._flush_dirty()
+        self._wake.set()
         return schedule_config.id
     
     def remove_schedule(self, schedule_id: str) -> bool:
@@ -251,14 +846,58 @@ class Scheduler:
         Returns:
             제거 성공 여부
         """
-        if schedule_id in self.schedules:
-            del self.schedules[schedule_id]
-            logger.info(f"스케줄 제거됨: {schedule_id}")
-            # 스케줄 저장
-            self._save_schedules()
-            return True
+        with self._lock:
+            if schedule_id in self.schedules:
+                del self.schedules[schedule_id]
+                self._heap_next.pop(schedule_id, None)
+                self._retry_counts.pop(schedule_id, None)
+                self._dag = None
+                logger.info(f"스케줄 제거됨: {schedule_id}")
+                # 제거된 스케줄 파일만 삭제
+                self._delete_schedule_file(schedule_id)
+                self._wake.set()
+                return True
         return False
     
+    def bulk_apply(self, adds: List[ScheduleConfig], removes: List[str]) -> None:
+        """
+        여러 스케줄을 한 번에 추가/제거하고 한 번만 저장
+        
+        Args:
+            adds: 추가할 스케줄 설정 객체 목록
+            removes: 제거할 스케줄 ID 목록
+            
+        Raises:
+            ValueError: 순환 의존성이 생기는 경우 (아무것도 반영하지 않음)
+        """
+        if not adds and not removes:
+            return
+        
+        with self._lock:
+            # 반영 전에 추가할 스케줄의 의존성 순환 여부를 모두 확인
+            graph = self._dependency_graph(exclude=[*removes, *(schedule_config.id for schedule_config in adds)])
+            for schedule_config in adds:
+                self._check_acyclic(graph, _schedule_pipeline_id(schedule_config), schedule_config.dependencies)
+            
+            for schedule_config in adds:
+                self.schedules[schedule_config.id] = schedule_config
+                self._dirty.add(schedule_config.id)
+            for schedule_id in removes:
+                self.schedules.pop(schedule_id, None)
+                self._heap_next.pop(schedule_id, None)
+                self._delete_schedule_file(schedule_id)
+            
+            # 의존성 그래프는 모두 반영한 뒤 한 번만 재구성
+            self._dag = None
+            for schedule_config in adds:
+                self._push_schedule(schedule_config)
+        
+        # 추가된 스케줄 저장 (한 번에)
+        self._flush_dirty()
+        
+        logger.info(f"스케줄 일괄 적용됨: {len(adds)}개 추가, {len(removes)}개 제거")
+        self._wake.set()
+    
     def get_schedule(self, schedule_id: str) -> Optional[ScheduleConfig]:
         """스케줄 ID로 스케줄 조회"""
         return self.schedules.get(schedule_id)
@@ -277,264 +916,566 @@ class Scheduler:
             
         Returns:
             업데이트 성공 여부
+            
+        Raises:
+            ValueError: 순환 의존성이 생기는 경우 (아무것도 반영하지 않음)
         """
         if schedule_id not in self.schedules:
             return False
         
-        schedule = self.schedules[schedule_id]
-        for key, value in kwargs.items():
-            if hasattr(schedule, key):
-                setattr(schedule, key, value)
-        
-        # Cron 표현식이 업데이트되었으면 다음 실행 시간 재계산
-        if "cron_expression" in kwargs:
-            schedule.update_next_run()
-        
-        logger.info(f"스케줄 업데이트됨: {schedule_id}")
-        # 스케줄 저장
-        self._save_schedules()
+        with self._lock:
+            schedule = self.schedules[schedule_id]
+            
+            # 의존성 또는 파이프라인이 바뀌면 반영 전에 순환 여부 확인
+            if "dependencies" in kwargs or "pipeline_config" in kwargs:
+                self._check_acyclic(
+                    self._dependency_graph(exclude=(schedule_id,)),
+                    _pipeline_id_of(kwargs.get("pipeline_config", schedule.pipeline_config)),
+                    kwargs.get("dependencies", schedule.dependencies) or ()
+                )
+            
+            for key, value in kwargs.items():
+                if hasattr(schedule, key):
+                    setattr(schedule, key, value)
+            
+            # Cron 표현식이 업데이트되었으면 다음 실행 시간 재계산
+            if "cron_expression" in kwargs:
+                schedule.update_next_run()
+            
+            # 파이프라인이 바뀌면 설정 캐시 무효화
+            if "pipeline_config" in kwargs:
+                schedule._resolved_for = None
+            
+            # 의존성 또는 파이프라인이 바뀌면 의존성 그래프 재구성
+            if "dependencies" in kwargs or "pipeline_config" in kwargs:
+                self._dag = None
+            
+            # 다음 실행 시간 또는 활성화 여부가 바뀌었을 수 있으므로 힙 항목 갱신
+            self._push_schedule(schedule)
+            
+            logger.info(f"스케줄 업데이트됨: {schedule_id}")
+            # 변경된 스케줄만 저장
+            self._dirty.add(schedule_id)
+        self._flush_dirty()
+        self._wake.set()
         return True
     
     def run_once(self):
         """
         실행 대기 중인 스케줄을 확인하고 실행
         """
-        now = datetime.now()
+        now_ts = time.time()
         
-        logger.debug(f"스케줄 확인 중... (현재 시간: {now.strftime('%Y-%m-%d %H:%M:%S')})")
-        pending_schedule_count = 0
-        executed_count = 0
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"스케줄 확인 중... (현재 시간: {datetime.fromtimestamp(now_ts).strftime('%Y-%m-%d %H:%M:%S')})")
         
-        # 실행 대기 중인 스케줄 확인
-        for schedule_id, schedule in list(self.schedules.items()):
-            try:
-                if not schedule.enabled:
-                    logger.debug(f"스케줄 {schedule_id}는 비활성화 상태입니다")
-                    continue
-                
-                logger.debug(f"스케줄 {schedule_id} 다음 실행 시간: {schedule.next_run.strftime('%Y-%m-%d %H:%M:%S')}")
-                
-                if schedule.next_run <= now:
-                    pending_schedule_count += 1
-                    pipeline_id = getattr(schedule.pipeline_config, 'pipeline_id', str(schedule.pipeline_config))
-                    
-                    logger.info(f"🔔 실행 대기 중인 스케줄 발견: {schedule_id} (파이프라인: {pipeline_id})")
-                    
-                    # 의존성 확인
-                    if self._check_dependencies(schedule):
-                        logger.info(f"▶️ 파이프라인 실행 시작: {schedule_id} → {pipeline_id}")
-                        try:
-                            self._run_pipeline(schedule)
-                        except Exception as e:
-                            logger.error(f"⚠️ 파이프라인 실행 실패: {schedule_id} → {pipeline_id}: {str(e)}")
-                            # 실패해도 다음 실행 시간 업데이트
-                            
-                        # 다음 실행 시간 업데이트는 실행 성공 여부와 관계없이 수행
-                        schedule.update_next_run()
-                        executed_count += 1
-                        logger.info(f"⏭️ 다음 실행 시간 업데이트: {schedule.next_run.strftime('%Y-%m-%d %H:%M:%S')}")
-                        # 스케줄 저장 (다음 실행 시간 업데이트)
-                        self._save_schedules()
-                    else:
-                        logger.warning(f"⚠️ 스케줄 {schedule_id}의 의존성이 충족되지 않았습니다. 다음 기회에 재시도합니다.")
-            except Exception as e:
-                logger.error(f"⚠️ 스케줄 {schedule_id} 처리 중 오류 발생: {str(e)}")
-                continue
+        # 실행 시간이 된 스케줄만 힙에서 꺼냄
+        due_schedules = self._pop_due_schedules(now_ts)
+        pending_schedule_count = len(due_schedules)
+        
+        for schedule in due_schedules:
+            logger.info(f"🔔 실행 대기 중인 스케줄 발견: {schedule.id} (파이프라인: {_schedule_pipeline_id(schedule)})")
+        
+        # 이번 실행에서 발생하는 DB 쓰기는 하나의 세션에 모아 마지막에 한 번만 커밋
+        if due_schedules:
+            self._begin_db_batch()
+        
+        try:
+            executed_count, waiting = self._run_due_waves(due_schedules)
+        finally:
+            if due_schedules:
+                self._commit_db()
+        
+        for schedule in waiting:
+            logger.warning(f"⚠️ 스케줄 {schedule.id}의 의존성이 충족되지 않았습니다. 다음 기회에 재시도합니다.")
+        
+        # 처리한 스케줄을 (갱신된) 다음 실행 시간으로 다시 등록
+        with self._lock:
+            for schedule in due_schedules:
+                if self.schedules.get(schedule.id) is schedule:
+                    self._push_schedule(schedule)
+        
+        # 다음 실행 시간이 변경된 스케줄만 모아서 저장
+        self._maybe_flush()
         
         # 실행 요약 메시지
         if pending_schedule_count > 0:
             logger.info(f"📊 스케줄 실행 요약: 대기 {pending_schedule_count}개 중 {executed_count}개 실행됨")
     
-    def _check_dependencies(self, schedule: ScheduleConfig) -> bool:
+    def _run_due_waves(self, due_schedules: List[ScheduleConfig]) -> Tuple[int, List[ScheduleConfig]]:
         """
-        스케줄의 의존성 충족 여부 확인
+        의존성이 충족된 스케줄을 단계별로 병렬 실행
+        
+        같은 단계에서 성공한 파이프라인에 의존하는 스케줄은 다음 단계에서 실행합니다.
         
         Args:
-            schedule: 스케줄 설정 객체
+            due_schedules: 실행 시간이 된 스케줄 목록
             
         Returns:
-            의존성 충족 여부
+            (실행한 스케줄 수, 의존성이 충족되지 않아 실행하지 못한 스케줄 목록)
         """
-        if not schedule.dependencies:
-            return True
-            
-        # 의존 파이프라인의 최근 실행 상태 확인
-        for dep_id in schedule.dependencies:
-            dep_successful = False
+        executed_count = 0
+        waiting = due_schedules
+        while waiting:
+            ready = []
+            blocked = []
+            ready_pipeline_ids = set()
+            for schedule in waiting:
+                try:
+                    pipeline_id = _schedule_pipeline_id(schedule)
+                    # 같은 파이프라인은 동시에 실행하지 않음 (설정 파일 경로는 파일의 pipeline_id 기준)
+                    if pipeline_id not in ready_pipeline_ids and (
+                        not schedule._has_deps or self._check_dependencies(schedule)
+                    ):
+                        ready_pipeline_ids.add(pipeline_id)
+                        ready.append(schedule)
+                    else:
+                        blocked.append(schedule)
+                except Exception as e:
+                    logger.error(f"⚠️ 스케줄 {schedule.id} 처리 중 오류 발생: {str(e)}")
             
-            # 완료된 실행 목록에서 확인
-            for exec_record in reversed(self.completed_executions):
-                if exec_record.pipeline_id == dep_id and exec_record.status == "SUCCESS":
-                    dep_successful = True
-                    break
+            if not ready:
+                break
             
-            if not dep_successful:
-                return False
-                
-        return True
+            if len(ready) == 1:
+                self._run_due_schedule(ready[0])
+            else:
+                concurrent.futures.wait([self._pool.submit(self._run_due_schedule, schedule) for schedule in ready])
+            executed_count += len(ready)
+            waiting = blocked
+        
+        return executed_count, waiting
     
-    def _run_pipeline(self, schedule):
+    def _run_due_schedule(self, schedule: ScheduleConfig):
         """
-        파이프라인 실행
+        실행 시간이 된 스케줄의 파이프라인을 실행하고 다음 실행 시간 갱신
         
         Args:
             schedule: 스케줄 설정 객체
         """
-        # 파이프라인 ID 또는 설정 파일 경로
-        pipeline_config = schedule.pipeline_config
         schedule_id = schedule.id
-        
-        # 실행 기록 생성
         try:
-            # 파이프라인 ID 추출
-            if isinstance(pipeline_config, (str, Path)):
-                # 파일 경로인 경우 설정 파일에서 ID 추출 시도
-                try:
-                    if Path(pipeline_config).exists():
-                        # 파일이 존재하는 경우 설정 로드
-                        config = PipelineConfig.from_yaml(pipeline_config)
-                        pipeline_id = config.pipeline_id
-                    else:
-                        # 파일이 존재하지 않으면 문자열을 ID로 간주
-                        pipeline_id = str(pipeline_config)
-                except Exception as e:
-                    logger.warning(f"파이프라인 설정 로드 실패, ID로 처리합니다: {e}")
-                    pipeline_id = str(pipeline_config)
-            else:
-                # PipelineConfig 객체인 경우
-                pipeline_id = pipeline_config.pipeline_id
-                
-            record = ExecutionRecord(schedule_id, pipeline_id)
-            self.running_executions[record.id] = record
-            
-            # 시작 로그 추가
-            record.logs.append(f"[{datetime.now().isoformat()}] 🚀 파이프라인 실행 시작: {pipeline_id}")
-            record.logs.append(f"[{datetime.now().isoformat()}] ⏰ 실행 시간: {record.start_time.isoformat()}")
-            
-            # 로그 핸들러 설정 - 파이프라인 실행 중 로그를 수집하기 위한 핸들러
-            log_collector = []
-            
-            class LogHandler(logging.Handler):
-                def emit(self, record):
-                    log_entry = self.format(record)
-                    log_collector.append(log_entry)
-            
-            # 로그 핸들러 등록
-            log_handler = LogHandler()
-            log_handler.setFormatter(logging.Formatter('%(message)s'))
-            logging.getLogger('dteg').addHandler(log_handler)
-            
-            # 여기서 실제 파이프라인 실행
-            success = False
+            pipeline_id = _schedule_pipeline_id(schedule)
+            logger.info(f"▶️ 파이프라인 실행 시작: {schedule_id} → {pipeline_id}")
+            next_run_updated = False
             try:
-                if Path(pipeline_config).exists():
-                    # 실제 파일이 존재하는 경우에만 파일로 로드
-                    pipeline = Pipeline.from_config(pipeline_config)
-                    pipeline.run()
-                    success = True
-                else:
-                    # ID만 있는 경우 (웹 UI에서 등록된 경우) 
-                    # 로그만 남기고 실제 실행하지 않음 - 여기서 DB에서 파이프라인 정보를 가져와서 실행하는 코드가 필요
-                    logger.info(f"파이프라인 ID {pipeline_id}를 사용한 실행 (웹 UI 등록 스케줄)")
-                    record.logs.append(f"[{datetime.now().isoformat()}] 📋 웹 UI에서 등록된 파이프라인 ID: {pipeline_id}")
-                    
-                    # 웹 DB에서 파이프라인 정보 조회 시도
-                    db_pipeline = self._get_pipeline_from_db(pipeline_id)
-                    if db_pipeline:
-                        # 파이프라인 정보가 DB에 있으면 실행
-                        record.logs.append(f"[{datetime.now().isoformat()}] 💾 데이터베이스에서 파이프라인 정보 로드됨")
-                        
-                        try:
-                            # DB에서 가져온 설정에 'pipeline' 필드가 있는지 확인
-                            config_data = db_pipeline.config
-                            
-                            record.logs.append(f"[{datetime.now().isoformat()}] 📦 파이프라인 설정 로드됨")
-                            
-                            # 새로운 설정 형식 지원
-                            if 'pipeline' in config_data:
-                                # 이전 형식: {'pipeline': {...}} 구조
-                                # 필요한 설정 추출
-                                pipeline_config = config_data['pipeline']
-                                # Pipeline 객체 생성
-                                pipeline = Pipeline(pipeline_config)
-                                record.logs.append(f"[{datetime.now().isoformat()}] 🔄 이전 형식의 파이프라인 설정 사용")
-                            else:
-                                # 새로운 형식: 평면적 구조
-                                # Pipeline 객체 생성
-                                pipeline = Pipeline(config_data)
-                                record.logs.append(f"[{datetime.now().isoformat()}] 🔄 새로운 형식의 파이프라인 설정 사용")
-                            
-                            record.logs.append(f"[{datetime.now().isoformat()}] 🏃 파이프라인 실행 중...")
-                            pipeline.run()
-                            record.logs.append(f"[{datetime.now().isoformat()}] 🏁 파이프라인 실행 완료")
-                            success = True
-                        except Exception as e:
-                            error_msg = f"파이프라인 실행 실패: {str(e)}"
-                            record.logs.append(f"[{datetime.now().isoformat()}] ❌ {error_msg}")
-                            logger.error(error_msg)
-                            raise
-                        
-                    else:
-                        record.logs.append(f"[{datetime.now().isoformat()}] ❌ 데이터베이스에서 파이프라인 정보를 찾을 수 없음")
-                        raise ValueError(f"파이프라인 ID {pipeline_id}에 대한 정보를 찾을 수 없습니다")
-                
-                # 로그 수집기에서 로그 가져와서 실행 기록에 추가
-                for log_entry in log_collector:
-                    record.logs.append(f"[{datetime.now().isoformat()}] {log_entry}")
-                
-                # 성공 로그 추가
-                record.logs.append(f"[{datetime.now().isoformat()}] ✅ 파이프라인 실행 완료")
-                record.complete(success=True)
-                
+                next_run_updated = self._run_pipeline(schedule)
             except Exception as e:
-                error_message = f"파이프라인 실행 중 오류 발생: {str(e)}"
+                logger.error(f"⚠️ 파이프라인 실행 실패: {schedule_id} → {pipeline_id}: {str(e)}")
+                # 실패해도 다음 실행 시간 업데이트
+            
+            # 다음 실행 시간은 _run_pipeline에서 갱신하며, 실행 전에 중단되어 갱신되지 않은 경우에만 여기서 갱신
+            # (재시도 지연이 짧으면 재시도 시각이 이미 지났을 수 있으므로 현재 시각과 비교하지 않음)
+            if not next_run_updated:
+                schedule.update_next_run()
+                logger.info(f"⏭️ 다음 실행 시간 업데이트: {schedule.next_run.strftime('%Y-%m-%d %H:%M:%S')}")
+            
+            # 저장 대상으로 표시 (실행 후 한 번에 저장)
+            with self._lock:
+                self._dirty.add(schedule_id)
+        except Exception as e:
+            logger.error(f"⚠️ 스케줄 {schedule_id} 처리 중 오류 발생: {str(e)}")
+    
+    def _push_schedule(self, schedule: ScheduleConfig):
+        """
+        스케줄을 현재 다음 실행 시간으로 힙에 등록 (호출자가 잠금 보유)
+        
+        비활성화된 스케줄은 등록하지 않으며, 이전에 등록된 항목은 무효화됩니다.
+        
+        Args:
+            schedule: 스케줄 설정 객체
+        """
+        next_run_ts = schedule.next_run_ts
+        if not schedule.enabled or next_run_ts is None:
+            self._heap_next.pop(schedule.id, None)
+            return
+        
+        if self._dag is None:
+            self._build_dag()
+        
+        if self._heap_next.get(schedule.id) == next_run_ts:
+            return
+        
+        self._heap_next[schedule.id] = next_run_ts
+        heapq.heappush(self._heap, (next_run_ts, -self._bottom_level.get(schedule.id, 0), schedule.id))
+        
+        # 무효화된 항목이 많이 쌓이면 힙 재구성
+        if len(self._heap) > 2 * len(self._heap_next) + 64:
+            self._rebuild_heap()
+    
+    def _rebuild_heap(self):
+        """유효한 항목만으로 힙 재구성 (호출자가 잠금 보유)"""
+        bottom_level = self._bottom_level
+        self._heap = [
+            (next_run, -bottom_level.get(schedule_id, 0), schedule_id)
+            for schedule_id, next_run in self._heap_next.items()
+        ]
+        heapq.heapify(self._heap)
+    
+    def _dependency_graph(self, exclude: Iterable[str] = ()) -> Dict[str, Set[str]]:
+        """
+        파이프라인 ID별 의존 파이프라인 ID 집합 구성 (호출자가 잠금 보유)
+        
+        Args:
+            exclude: 그래프에서 제외할 스케줄 ID 목록
+            
+        Returns:
+            파이프라인 ID -> 의존하는 파이프라인 ID 집합
+        """
+        excluded = set(exclude)
+        graph: Dict[str, Set[str]] = {}
+        for schedule_id, schedule in self.schedules.items():
+            if schedule._has_deps and schedule_id not in excluded:
+                graph.setdefault(_schedule_pipeline_id(schedule), set()).update(schedule.dependencies)
+        return graph
+    
+    @staticmethod
+    def _check_acyclic(graph: Dict[str, Set[str]], pipeline_id: str, dependencies: Iterable[str]):
+        """
+        의존성을 추가해도 순환이 생기지 않는지 확인한 뒤 그래프에 반영
+        
+        새 의존 대상에서 의존 관계를 따라가 자기 자신에 도달하는지만 확인하므로
+        전체 그래프를 다시 정렬하지 않고 변경된 부분만 검사합니다.
+        
+        Args:
+            graph: 파이프라인 ID -> 의존하는 파이프라인 ID 집합 (검사 후 갱신됨)
+            pipeline_id: 의존성을 추가할 파이프라인 ID
+            dependencies: 추가할 의존 대상 파이프라인 ID 목록
+            
+        Raises:
+            ValueError: 순환 의존성이 생기는 경우
+        """
+        dependencies = list(dependencies)
+        if not dependencies:
+            return
+        
+        # 방문한 파이프라인 -> 그 파이프라인에 도달하기 직전 파이프라인 (순환 경로 복원용)
+        came_from: Dict[str, str] = {}
+        stack = []
+        for dep_id in dependencies:
+            if dep_id not in came_from:
+                came_from[dep_id] = pipeline_id
+                stack.append(dep_id)
+        
+        while stack:
+            node_id = stack.pop()
+            if node_id == pipeline_id:
+                cycle = [pipeline_id]
+                previous = came_from[pipeline_id]
+                while previous != pipeline_id:
+                    cycle.append(previous)
+                    previous = came_from[previous]
+                cycle.append(pipeline_id)
+                cycle.reverse()
+                raise ValueError(f"순환 의존성이 발생합니다: {' -> '.join(cycle)}")
+            for next_id in graph.get(node_id, ()):
+                if next_id not in came_from:
+                    came_from[next_id] = node_id
+                    stack.append(next_id)
+        
+        graph.setdefault(pipeline_id, set()).update(dependencies)
+    
+    def _build_dag(self):
+        """
+        스케줄 의존성 그래프와 bottom level(가장 긴 후속 의존 체인 길이) 계산 (호출자가 잠금 보유)
+        
+        의존성은 파이프라인 ID 기준이므로 해당 파이프라인을 실행하는 스케줄에서
+        그 파이프라인에 의존하는 스케줄로 간선을 연결합니다.
+        (설정 파일 경로로 등록한 스케줄은 파일의 pipeline_id 기준)
+        """
+        schedule_ids_by_pipeline: Dict[str, List[str]] = {}
+        for schedule_id, schedule in self.schedules.items():
+            schedule_ids_by_pipeline.setdefault(_schedule_pipeline_id(schedule), []).append(schedule_id)
+        
+        dag: Dict[str, List[str]] = {schedule_id: [] for schedule_id in self.schedules}
+        for schedule_id, schedule in self.schedules.items():
+            for dep_id in schedule.dependencies or ():
+                for parent_id in schedule_ids_by_pipeline.get(dep_id, ()):
+                    dag[parent_id].append(schedule_id)
+        
+        # 역위상 순서로 bottom level 계산 (메모이제이션 DFS, 순환 의존성은 무시)
+        bottom_level: Dict[str, int] = {}
+        for root_id in dag:
+            if root_id in bottom_level:
+                continue
+            visiting = {root_id}
+            stack = [(root_id, iter(dag[root_id]))]
+            while stack:
+                node_id, children = stack[-1]
+                for child_id in children:
+                    if child_id not in bottom_level and child_id not in visiting:
+                        visiting.add(child_id)
+                        stack.append((child_id, iter(dag[child_id])))
+                        break
+                else:
+                    stack.pop()
+                    visiting.discard(node_id)
+                    bottom_level[node_id] = 1 + max(
+                        (bottom_level.get(child_id, 0) for child_id in dag[node_id]), default=0
+                    )
+        
+        self._dag = dag
+        self._bottom_level = bottom_level
+        
+        # 기존 힙 항목의 우선순위도 새 bottom level로 갱신
+        self._rebuild_heap()
+    
+    def _pop_due_schedules(self, now_ts: float) -> List[ScheduleConfig]:
+        """
+        실행 시간이 된 스케줄을 힙에서 꺼내 반환
+        
+        Args:
+            now_ts: 기준 시각 (UNIX 타임스탬프)
+            
+        Returns:
+            실행 대기 중인 스케줄 목록 (실행 시간, 임계 경로 길이 순)
+        """
+        due = []
+        with self._lock:
+            if self._dag is None:
+                self._build_dag()
+            
+            # 재등록 중 힙이 재구성될 수 있으므로 매번 self._heap을 참조
+            while self._heap and self._heap[0][0] <= now_ts:
+                next_run_ts, _, schedule_id = heapq.heappop(self._heap)
+                
+                # 무효화된 항목 건너뜀
+                if self._heap_next.get(schedule_id) != next_run_ts:
+                    continue
+                del self._heap_next[schedule_id]
+                
+                schedule = self.schedules.get(schedule_id)
+                if schedule is None or not schedule.enabled or schedule.next_run_ts is None:
+                    continue
+                
+                # 힙 등록 이후 다음 실행 시간이 미래로 직접 변경된 경우 새 시간으로 재등록
+                if schedule.next_run_ts != next_run_ts and schedule.next_run_ts > now_ts:
+                    self._push_schedule(schedule)
+                    continue
+                
+                due.append(schedule)
+        return due
+    
+    def _check_dependencies(self, schedule: ScheduleConfig) -> bool:
+        """
+        스케줄의 의존성 충족 여부 확인
+        
+        Args:
+            schedule: 스케줄 설정 객체
+            
+        Returns:
+            의존성 충족 여부
+        """
+        if not schedule.dependencies:
+            return True
+        
+        # 의존 파이프라인별 마지막 성공 기록만 확인
+        self._ensure_history_loaded()
+        last_success = self._last_success
+        return all(dep_id in last_success for dep_id in schedule.dependencies)
+    
+    def _record_completion(self, record: ExecutionRecord):
+        """
+        완료된 실행 기록 등록
+        
+        실행 중 목록에서 제거하고, 성공한 경우 파이프라인별 마지막 성공 기록을 갱신
+        
+        Args:
+            record: 완료된 실행 기록 객체
+        """
+        self._ensure_history_loaded()
+        expired = []
+        with self._lock:
+            self.running_executions.pop(record.id, None)
+            completed = self._completed_executions
+            evicted = completed[0] if completed.maxlen is not None and len(completed) == completed.maxlen else None
+            completed.append(record)
+            
+            if record.status == "SUCCESS":
+                previous = self._last_success.get(record.pipeline_id)
+                if (previous is None or previous.end_time is None or
+                        (record.end_time is not None and record.end_time >= previous.end_time)):
+                    self._last_success[record.pipeline_id] = record
+                    # 완료 목록에서 이미 밀려난 이전 성공 기록은 더 이상 보존하지 않음
+                    if (previous is not None and previous.id in self._spilled_logs
+                            and previous is not evicted and previous not in completed):
+                        expired.append(previous.id)
+            
+            # 완료 목록에서 밀려난 기록의 로그 파일은 삭제 (파이프라인별 마지막 성공 기록은 유지)
+            if (evicted is not None and evicted.id in self._spilled_logs
+                    and self._last_success.get(evicted.pipeline_id) is not evicted):
+                expired.append(evicted.id)
+        
+        if expired:
+            self._delete_execution_logs(expired)
+    
+    def _run_pipeline(self, schedule) -> bool:
+        """
+        파이프라인 실행
+        
+        Args:
+            schedule: 스케줄 설정 객체
+            
+        Returns:
+            다음 실행 시간(정기 실행 또는 재시도)을 갱신했는지 여부 (실행 전에 중단되면 False)
+        """
+        # 파이프라인 ID 또는 설정 파일 경로
+        pipeline_config = schedule.pipeline_config
+        schedule_id = schedule.id
+        next_run_updated = False
+        
+        # 실행 기록 생성
+        try:
+            # 파이프라인 설정 확인 (설정 파일은 스케줄당 한 번만 확인/로드)
+            try:
+                _, resolved_config = schedule.resolved()
+            except Exception as e:
+                logger.warning(f"파이프라인 설정 로드 실패, ID로 처리합니다: {e}")
+                resolved_config = None
+            
+            # 파이프라인 ID 추출 (설정이 없으면 문자열을 ID로 간주)
+            if resolved_config is not None:
+                pipeline_id = resolved_config.pipeline_id
+            else:
+                pipeline_id = str(pipeline_config)
+                
+            record = ExecutionRecord(schedule_id, pipeline_id)
+            record.retry_count = self._retry_counts.get(schedule_id, 0)
+            self.running_executions[record.id] = record
+            
+            # 시작 로그 추가
+            record._log(f"🚀 파이프라인 실행 시작: {pipeline_id}")
+            record._log(f"⏰ 실행 시간: {record.start_time.isoformat()}")
+            
+            # 파이프라인 실행 중 로그를 수집할 버퍼 설정 (핸들러는 스케줄러 생성 시 등록됨)
+            log_collector = []
+            log_buffer_token = _run_log_buffer.set(log_collector)
+            
+            # 여기서 실제 파이프라인 실행
+            success = False
+            try:
+                if resolved_config is not None:
+                    # 설정 객체 또는 실제 파일에서 로드한 설정으로 실행
+                    Pipeline(resolved_config).run()
+                else:
+                    # ID만 있는 경우 (웹 UI에서 등록된 경우)
+                    self._run_stored_pipeline(record, pipeline_id)
+                success = True
+                
+                # 로그 수집기에서 로그 가져와서 실행 기록에 추가 (시각은 한 번만 계산)
+                timestamp = datetime.now().isoformat()
+                record.logs.extend(f"[{timestamp}] {log_entry}" for log_entry in log_collector)
+                
+                # 성공 로그 추가
+                record.logs.append(f"[{timestamp}] ✅ 파이프라인 실행 완료")
+                record.complete(success=True)
+                
+            except Exception as e:
+                error_message = f"파이프라인 실행 중 오류 발생: {str(e)}"
                 logger.error(error_message)
                 
                 # 오류 로그 추가
-                record.logs.append(f"[{datetime.now().isoformat()}] ❌ {error_message}")
+                record._log(f"❌ {error_message}")
                 record.complete(success=False, error_message=error_message)
                 
                 # 예외 전파하지 않고 오류 처리
                 success = False
             finally:
-                # 로그 핸들러 제거
-                logging.getLogger('dteg').removeHandler(log_handler)
+                # 로그 수집 종료
+                _run_log_buffer.reset(log_buffer_token)
             
             # 종료 로그 추가
-            record.logs.append(f"[{datetime.now().isoformat()}] ⏰ 완료 시간: {record.end_time.isoformat() if record.end_time else datetime.now().isoformat()}")
+            record._log(f"⏰ 완료 시간: {record.end_time.isoformat() if record.end_time else datetime.now().isoformat()}")
+            self._record_completion(record)
+            self._append_history_index(record)
             
-            # 실행 기록 저장
-            self._save_execution_record(record)
+            # 실행 기록 및 스케줄 저장에 사용할 DB 세션 (한 번만 연결, run_once 중이면 배치 세션 사용)
+            db = self._open_web_db() if self._db_batch is None else None
             
-            # 콜백 호출
-            if self.on_execution_complete:
-                self.on_execution_complete(record)
+            try:
+                # 실행 기록 저장
+                saved = self._save_execution_record(record, db=db)
                 
-            # 스케줄 업데이트
-            if success:
-                # 다음 실행 시간 업데이트
-                next_run = schedule.get_next_run_time()
-                schedule.last_run_time = datetime.now()
-                schedule.last_run_status = "SUCCESS"
-                schedule.next_run_time = next_run
+                # 콜백 호출
+                if self.on_execution_complete:
+                    self.on_execution_complete(record)
                 
-                logger.info(f"⏭️ 다음 실행 시간 업데이트: {next_run.strftime('%Y-%m-%d %H:%M:%S') if next_run else '없음'}")
-            else:
-                # 실패 시에도 다음 실행 시간 업데이트 (실패해도 계속 실행)
-                next_run = schedule.get_next_run_time()
+                # 데이터베이스 또는 로그 파일에 기록된 로그는 메모리에서 해제 (완료 기록은 상태 조회용으로만 유지)
+                # 배치 세션에 기록한 경우에는 _commit_db에서 커밋 결과를 확인한 뒤 처리
+                if not (db is None and self._defer_log_release(record, saved)) and (
+                    saved or self._write_execution_log(record)
+                ):
+                    record.logs.clear()
+                
+                # 스케줄 업데이트 (실패해도 계속 실행하도록 다음 실행 시간은 항상 한 번만 갱신)
                 schedule.last_run_time = datetime.now()
-                schedule.last_run_status = "FAILED" 
-                schedule.next_run_time = next_run
+                schedule.last_run_status = "SUCCESS" if success else "FAILED"
+                if not success and record.retry_count < schedule.max_retries:
+                    # 재시도 횟수가 남아 있으면 retry_delay 후 다시 실행
+                    self._retry_counts[schedule_id] = record.retry_count + 1
+                    schedule.schedule_retry()
+                    next_run_note = f" (재시도 {record.retry_count + 1}/{schedule.max_retries})"
+                else:
+                    self._retry_counts.pop(schedule_id, None)
+                    schedule.update_next_run()
+                    next_run_note = "" if success else " (실패 후)"
+                next_run_updated = True
                 
-                logger.info(f"⏭️ 다음 실행 시간 업데이트 (실패 후): {next_run.strftime('%Y-%m-%d %H:%M:%S') if next_run else '없음'}")
+                logger.info(f"⏭️ 다음 실행 시간 업데이트{next_run_note}: {schedule.next_run.strftime('%Y-%m-%d %H:%M:%S')}")
+                
+                # 스케줄 저장
+                self._save_schedule(schedule, db=db)
+            finally:
+                if db is not None:
+                    db.close()
+        except Exception as e:
+            logger.error(f"파이프라인 실행 중 예외 발생: {str(e)}")
+        
+        return next_run_updated
+    
+    def _run_stored_pipeline(self, record: ExecutionRecord, pipeline_id: str):
+        """
+        웹 UI에서 등록된 파이프라인을 DB(또는 파이프라인 파일)에 저장된 설정으로 실행
+        
+        Args:
+            record: 실행 기록 객체
+            pipeline_id: 파이프라인 ID
             
-            # 스케줄 저장
-            self._save_schedule(schedule)
+        Raises:
+            ValueError: 파이프라인 정보를 찾을 수 없는 경우
+        """
+        logger.info(f"파이프라인 ID {pipeline_id}를 사용한 실행 (웹 UI 등록 스케줄)")
+        record._log(f"📋 웹 UI에서 등록된 파이프라인 ID: {pipeline_id}")
+        
+        # 웹 DB에서 파이프라인 정보 조회 시도
+        db_pipeline = self._get_pipeline_from_db(pipeline_id)
+        if not db_pipeline:
+            record._log("❌ 데이터베이스에서 파이프라인 정보를 찾을 수 없음")
+            raise ValueError(f"파이프라인 ID {pipeline_id}에 대한 정보를 찾을 수 없습니다")
+        
+        # 파이프라인 정보가 DB에 있으면 실행
+        record._log("💾 데이터베이스에서 파이프라인 정보 로드됨")
+        
+        try:
+            config_data = db_pipeline.config
+            record._log("📦 파이프라인 설정 로드됨")
+            
+            # 이전 형식({'pipeline': {...}} 구조)과 새로운 형식(평면적 구조) 모두 지원
+            if 'pipeline' in config_data:
+                pipeline = Pipeline(config_data['pipeline'])
+                record._log("🔄 이전 형식의 파이프라인 설정 사용")
+            else:
+                pipeline = Pipeline(config_data)
+                record._log("🔄 새로운 형식의 파이프라인 설정 사용")
             
-            return success
+            record._log("🏃 파이프라인 실행 중...")
+            pipeline.run()
+            record._log("🏁 파이프라인 실행 완료")
         except Exception as e:
-            logger.error(f"파이프라인 실행 중 예외 발생: {str(e)}")
-            return False
+            error_msg = f"파이프라인 실행 실패: {str(e)}"
+            record._log(f"❌ {error_msg}")
+            logger.error(error_msg)
+            raise
     
     def run_scheduler(self, interval: int = 60):
         """
@@ -547,80 +1488,267 @@ class Scheduler:
         try:
             while True:
                 self.run_once()
-                time.sleep(interval)
+                # 저장을 미룬 변경 사항이 있으면 저장 간격이 지난 뒤 다시 확인
+                self.wait_for_next_run(min(interval, SCHEDULE_FLUSH_INTERVAL) if self._dirty else interval)
         except KeyboardInterrupt:
             logger.info("스케줄러 중지됨")
+        finally:
+            # 종료 전에 저장되지 않은 스케줄 변경 사항 저장
+            self._flush_dirty()
     
-    def _save_execution_record(self, execution: ExecutionRecord):
+    def seconds_until_next_run(self, max_wait: float) -> float:
         """
-        실행 기록 저장
+        가장 가까운 다음 실행 시간까지 남은 시간 계산
         
         Args:
-            execution: 실행 기록 객체
+            max_wait: 최대 대기 시간(초)
+            
+        Returns:
+            대기할 시간(초), MIN_WAKE_INTERVAL 이상 max_wait 이하
         """
-        try:
-            # 웹 UI용 DB에 저장 시도
-            from dteg.web.database import SessionLocal
-            from dteg.web.models.database_models import Execution as DBExecution
+        with self._lock:
+            if not self._heap:
+                return max_wait
+            delay = self._heap[0][0] - time.time()
+        return max(MIN_WAKE_INTERVAL, min(max_wait, delay))
+    
+    def wait_for_next_run(self, max_wait: float) -> bool:
+        """
+        다음 실행 시간까지 대기 (스케줄이 변경되거나 wake() 호출 시 즉시 반환)
+        
+        Args:
+            max_wait: 최대 대기 시간(초)
             
-            db = SessionLocal()
+        Returns:
+            대기 도중 깨어났는지 여부
+        """
+        woken = self._wake.wait(self.seconds_until_next_run(max_wait))
+        self._wake.clear()
+        return woken
+    
+    def wake(self):
+        """대기 중인 실행 루프를 즉시 깨움"""
+        self._wake.set()
+    
+    def _open_web_db(self):
+        """
+        웹 UI용 DB 세션 생성
+        
+        Returns:
+            DB 세션 (웹 UI 데이터베이스 모듈이 없으면 None)
+        """
+        web_db = _web_db_modules()
+        if web_db is None:
+            logger.debug("웹 UI 데이터베이스 모듈이 로드되지 않았습니다.")
+            return None
+        
+        try:
+            return web_db[0]()
+        except Exception as e:
+            logger.error(f"데이터베이스 연결 실패: {str(e)}")
+            return None
+    
+    def _begin_db_batch(self):
+        """run_once 동안의 DB 쓰기를 모을 세션 시작"""
+        with self._db_lock:
+            if self._db_batch is None:
+                self._db_batch = self._open_web_db()
+    
+    def _commit_db(self):
+        """
+        모아 둔 DB 쓰기를 한 번에 커밋하고 배치 세션 종료
+        
+        커밋된 실행 기록의 로그만 메모리에서 해제합니다. 커밋이 실패하면 롤백된 실행 기록을
+        개별 세션으로 다시 저장하고, 그래도 저장하지 못한 기록의 로그는 로그 파일에 기록합니다.
+        """
+        with self._db_lock:
+            db, self._db_batch = self._db_batch, None
+            next_runs, self._db_next_runs = self._db_next_runs, {}
+            records, self._db_batch_records = self._db_batch_records, []
+        
+        committed = False
+        if db is not None:
             try:
-                # 기존 실행 기록 확인
-                db_execution = db.query(DBExecution).filter(DBExecution.id == execution.id).first()
-                
-                if db_execution:
-                    # 기존 실행 기록 업데이트
-                    db_execution.status = execution.status
-                    db_execution.ended_at = execution.end_time
-                    db_execution.error_message = execution.error_message
-                    db_execution.logs = '\n'.join(execution.logs) if execution.logs else None
-                else:
-                    # 새 실행 기록 생성
-                    db_execution = DBExecution(
-                        id=execution.id,
-                        pipeline_id=execution.pipeline_id,
-                        schedule_id=execution.schedule_id,
-                        status=execution.status,
-                        started_at=execution.start_time,
-                        ended_at=execution.end_time,
-                        error_message=execution.error_message,
-                        logs='\n'.join(execution.logs) if execution.logs else None
-                    )
-                    db.add(db_execution)
-                
+                if next_runs:
+                    self._update_db_next_runs(db, next_runs)
                 db.commit()
-                logger.debug(f"실행 기록 {execution.id}가 데이터베이스에 저장되었습니다.")
+                committed = True
             except Exception as e:
                 db.rollback()
-                logger.error(f"실행 기록 저장 중 데이터베이스 오류: {str(e)}")
+                logger.error(f"데이터베이스 일괄 커밋 실패: {str(e)}")
             finally:
                 db.close()
-        except ImportError:
+        
+        for record, saved in records:
+            if saved and not committed:
+                saved = self._save_execution_record(record)
+            if saved or self._write_execution_log(record):
+                record.logs.clear()
+    
+    def _defer_log_release(self, record: ExecutionRecord, saved: bool) -> bool:
+        """
+        배치 세션에 기록한 실행 기록의 로그 해제를 커밋 시점으로 미룸
+        
+        Args:
+            record: 실행 기록
+            saved: 배치 세션에 기록했는지 여부
+            
+        Returns:
+            미뤘는지 여부 (진행 중인 배치 세션이 없으면 False)
+        """
+        with self._db_lock:
+            if self._db_batch is None:
+                return False
+            self._db_batch_records.append((record, saved))
+            return True
+    
+    def _update_db_next_runs(self, session, next_runs: Dict[str, datetime]):
+        """
+        웹 UI DB 스케줄의 다음 실행 시간을 조회 없이 한 번의 UPDATE(executemany)로 갱신
+        
+        Args:
+            session: DB 세션
+            next_runs: 스케줄 ID별 다음 실행 시간
+        """
+        from sqlalchemy import bindparam
+        
+        table = _web_db_modules()[1].Schedule.__table__
+        stmt = table.update().where(table.c.id == bindparam("b_id")).values(next_run=bindparam("b_next_run"))
+        session.execute(stmt, [{"b_id": schedule_id, "b_next_run": next_run}
+                               for schedule_id, next_run in next_runs.items()])
+    
+    @contextlib.contextmanager
+    def _web_db_session(self, db=None):
+        """
+        실행 기록/스케줄 저장에 사용할 DB 세션 제공
+        
+        넘겨받은 세션은 블록이 끝나면 커밋만 하고, run_once 중에는 배치 세션을
+        커밋 없이 SAVEPOINT 안에서 사용하며, 그 외에는 새 세션을 열어 커밋한 뒤 닫습니다.
+        
+        Args:
+            db: 재사용할 DB 세션
+            
+        Yields:
+            DB 세션 (웹 UI 데이터베이스를 사용할 수 없으면 None)
+        """
+        if db is None and self._db_batch is not None:
+            # 배치 세션은 작업 스레드 간에 공유되므로 잠금 후 사용 (커밋은 _commit_db에서)
+            # 쓰기마다 SAVEPOINT를 두어 실패한 쓰기만 롤백하고 같은 배치의 다른 쓰기는 유지
+            with self._db_lock:
+                with self._db_batch.begin_nested():
+                    yield self._db_batch
+            return
+        
+        owns_session = db is None
+        if owns_session:
+            db = self._open_web_db()
+            if db is None:
+                yield None
+                return
+        
+        try:
+            yield db
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            if owns_session:
+                db.close()
+    
+    def _save_execution_record(self, execution: ExecutionRecord, db=None):
+        """
+        실행 기록 저장
+        
+        Args:
+            execution: 실행 기록 객체
+            db: 재사용할 DB 세션 (없으면 배치 세션 또는 새 세션 사용)
+            
+        Returns:
+            데이터베이스에 기록했는지 여부 (배치 세션이면 커밋은 _commit_db에서 확정)
+        """
+        # 웹 UI용 DB에 저장 시도
+        web_db = _web_db_modules()
+        if web_db is None:
             logger.debug("웹 UI 데이터베이스 모듈이 로드되지 않았습니다. 실행 기록이 로컬에만 저장됩니다.")
+            return False
+        DBExecution = web_db[1].Execution
+        
+        values = {
+            "id": execution.id,
+            "pipeline_id": execution.pipeline_id,
+            "schedule_id": execution.schedule_id,
+            "status": execution.status,
+            "started_at": execution.start_time,
+            "ended_at": execution.end_time,
+            "error_message": execution.error_message,
+            "logs": '\n'.join(execution.logs) if execution.logs else None
+        }
+        
+        try:
+            with self._web_db_session(db) as session:
+                if session is None:
+                    return False
+                
+                if session.get_bind().dialect.name == "sqlite":
+                    # 조회 없이 한 번에 삽입 또는 갱신 (기존 기록은 상태/종료 시간/오류/로그만 갱신)
+                    from sqlalchemy.dialects.sqlite import insert
+                    stmt = insert(DBExecution).values(**values)
+                    stmt = stmt.on_conflict_do_update(
+                        index_elements=[DBExecution.id],
+                        set_={key: stmt.excluded[key] for key in ("status", "ended_at", "error_message", "logs")}
+                    )
+                    session.execute(stmt)
+                else:
+                    session.merge(DBExecution(**values))
+            
+            logger.debug("실행 기록 %s가 데이터베이스에 저장되었습니다.", execution.id)
+            return True
         except Exception as e:
-            logger.error(f"실행 기록 저장 중 오류: {str(e)}")
+            logger.error(f"실행 기록 저장 중 데이터베이스 오류: {str(e)}")
+            return False
             
     def _get_pipeline_from_db(self, pipeline_id: str):
         """
         데이터베이스에서 파이프라인 정보를 조회
         
+        생성/수정 시각만 먼저 조회하고, 이전에 읽은 뒤 변경되지 않았으면
+        설정(JSON)을 다시 읽지 않고 캐시된 정보를 반환합니다.
+        
         Args:
             pipeline_id: 파이프라인 ID
             
         Returns:
             파이프라인 객체 또는 None
         """
+        web_db = _web_db_modules()
+        if web_db is None:
+            logger.warning("웹 UI 데이터베이스 모듈이 로드되지 않았습니다. 파일 시스템을 확인합니다.")
+            return self._get_pipeline_from_file(pipeline_id)
+        SessionLocal, database_models = web_db
+        DBPipeline = database_models.Pipeline
+        
         try:
-            from dteg.web.database import SessionLocal
-            from dteg.web.models.database_models import Pipeline as DBPipeline
-            
             db = SessionLocal()
             try:
-                # DB에서 파이프라인 정보 조회
-                db_pipeline = db.query(DBPipeline).filter(DBPipeline.id == pipeline_id).first()
+                # DB에서 파이프라인 변경 시각 조회
+                version_row = db.query(DBPipeline.created_at, DBPipeline.updated_at).filter(
+                    DBPipeline.id == pipeline_id).first()
+                db_pipeline = None
+                if version_row is not None:
+                    version = tuple(version_row)
+                    cached = self._db_pipeline_cache.get(pipeline_id)
+                    if cached is not None and cached[0] == version:
+                        return cached[1]
+                    
+                    db_pipeline = db.query(DBPipeline).filter(DBPipeline.id == pipeline_id).first()
+                
                 if db_pipeline:
-                    return db_pipeline
+                    pipeline = _StoredPipeline(db_pipeline.id, db_pipeline.config)
+                    self._db_pipeline_cache[pipeline_id] = (version, pipeline)
+                    return pipeline
                 else:
+                    self._db_pipeline_cache.pop(pipeline_id, None)
                     # DB에서 찾지 못한 경우, 파일 시스템에서 로드 시도
                     logger.info(f"DB에서 파이프라인 {pipeline_id}를 찾지 못했습니다. 파일 시스템에서 시도합니다.")
                     return self._get_pipeline_from_file(pipeline_id)
@@ -630,9 +1758,6 @@ class Scheduler:
                 return self._get_pipeline_from_file(pipeline_id)
             finally:
                 db.close()
-        except ImportError:
-            logger.warning("웹 UI 데이터베이스 모듈이 로드되지 않았습니다. 파일 시스템을 확인합니다.")
-            return self._get_pipeline_from_file(pipeline_id)
         except Exception as e:
             logger.error(f"파이프라인 정보 조회 중 오류: {str(e)}")
             # 다른 예외도 파일 시스템에서 시도
@@ -649,8 +1774,6 @@ class Scheduler:
             파이프라인 객체 또는 None (DB Pipeline 객체와 호환되는 형태로 반환)
         """
         try:
-            import os
-            import json
             from dteg.config import get_config
             
             # 설정에서 파이프라인 디렉토리 가져오기
@@ -663,17 +1786,10 @@ class Scheduler:
                 return None
                 
             # 파이프라인 파일 읽기
-            with open(pipeline_file, 'r') as f:
-                pipeline_data = json.load(f)
+            pipeline_data = load_json(pipeline_file)
                 
             # DB Pipeline 객체와 호환되는 형태로 변환
-            # 간단한 임시 객체 생성
-            class PipelineObj:
-                def __init__(self, id, config):
-                    self.id = id
-                    self.config = config
-                    
-            return PipelineObj(
+            return _StoredPipeline(
                 id=pipeline_data.get("id", pipeline_id),
                 config=pipeline_data.get("config", {})
             )
@@ -691,119 +1807,393 @@ class Scheduler:
     def _save_schedules(self):
         """모든 스케줄 설정 저장"""
         # 디렉토리 생성
-        os.makedirs(self.schedule_dir, exist_ok=True)
+        _ensure_dir(self.schedule_dir)
         
         # 개별 스케줄 JSON 파일 저장
         for schedule in self.schedules.values():
-            # 스케줄 ID 기반 파일명
-            filename = f"{schedule.id}.json"
-            filepath = self.schedule_dir / filename
-            
-            # 사전으로 변환 후 JSON 저장
-            schedule_dict = schedule.to_dict()
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(schedule_dict, f, indent=2, ensure_ascii=False)
+            self._write_schedule_file(schedule)
                 
         logger.debug(f"{len(self.schedules)}개의 스케줄 정보가 저장되었습니다.")
+    
+    def _maybe_flush(self):
+        """
+        마지막 저장 후 SCHEDULE_FLUSH_INTERVAL이 지난 경우에만 변경된 스케줄 저장
+        
+        파일 쓰기로 스케줄러 스레드가 멈추지 않도록 작업 풀에서 저장하며,
+        이전 저장 작업이 끝나지 않았으면 다음 기회로 미룹니다.
+        """
+        if not self._dirty or time.monotonic() - self._last_flush < SCHEDULE_FLUSH_INTERVAL:
+            return
+        if self._flush_future is not None and not self._flush_future.done():
+            return
+        self._flush_future = self._pool.submit(self._flush_dirty)
+    
+    def _flush_dirty(self):
+        """
+        변경 표시된 스케줄만 파일로 저장
+        
+        잠금 안에서는 변경 목록을 교체하고 저장할 내용만 직렬화하며, 파일 쓰기는 잠금을
+        놓은 뒤 실행하여 실행 주기(힙 조회, 완료 기록)가 디스크 쓰기를 기다리지 않도록 합니다.
+        """
+        with self._file_lock:
+            with self._lock:
+                if not self._dirty:
+                    return
+                
+                self._last_flush = time.monotonic()
+                dirty, self._dirty = self._dirty, set()
+                pending = []
+                for schedule_id in dirty:
+                    schedule = self.schedules.get(schedule_id)
+                    if schedule is None:
+                        continue
+                    data = dump_json(schedule.to_dict())
+                    if self._saved_contents.get(schedule_id) != data:
+                        pending.append((schedule_id, data))
+            
+            failed = []
+            for schedule_id, data in pending:
+                try:
+                    self._write_schedule_data(schedule_id, data)
+                except Exception as e:
+                    logger.error(f"스케줄 파일 저장 실패: {schedule_id} - {e}")
+                    failed.append(schedule_id)
+            
+            with self._lock:
+                # 저장에 실패한 스케줄은 다음 저장 시 다시 시도
+                self._dirty.update(failed)
+                # 쓰는 동안 제거된 스케줄의 파일은 다시 삭제
+                for schedule_id, _ in pending:
+                    if schedule_id not in self.schedules and schedule_id not in failed:
+                        self._delete_schedule_file(schedule_id)
+        
+        logger.debug("%d개의 스케줄 정보가 저장되었습니다.", len(pending) - len(failed))
+        
+    def _write_schedule_file(self, schedule: ScheduleConfig):
+        """스케줄 설정을 스케줄 ID 기반 JSON 파일로 원자적으로 저장 (들여쓰기 없는 압축 형식)
+        
+        마지막으로 기록한 내용과 같으면 파일을 다시 쓰지 않습니다.
+        
+        Args:
+            schedule: 저장할 스케줄 설정 객체
+        """
+        with self._file_lock:
+            data = dump_json(schedule.to_dict())
+            if self._saved_contents.get(schedule.id) == data:
+                return
+            self._write_schedule_data(schedule.id, data)
+    
+    def _write_schedule_data(self, schedule_id: str, data: bytes):
+        """직렬화된 스케줄 설정을 파일로 원자적으로 저장 (호출자가 파일 쓰기 잠금 보유)
+        
+        Args:
+            schedule_id: 스케줄 ID
+            data: 저장할 JSON 바이트
+        """
+        atomic_write(self.schedule_dir / f"{schedule_id}.json", data)
+        self._saved_contents[schedule_id] = data
+    
+    def _delete_schedule_file(self, schedule_id: str):
+        """제거된 스케줄의 JSON 파일 삭제
         
-    def _save_schedule(self, schedule: ScheduleConfig):
+        Args:
+            schedule_id: 스케줄 ID
+        """
+        self._dirty.discard(schedule_id)
+        self._saved_contents.pop(schedule_id, None)
+        try:
+            (self.schedule_dir / f"{schedule_id}.json").unlink(missing_ok=True)
+        except OSError as e:
+            logger.error(f"스케줄 파일 삭제 실패: {schedule_id} - {e}")
+        
+    def _save_schedule(self, schedule: ScheduleConfig, db=None):
         """특정 스케줄 설정 저장
         
         Args:
             schedule: 저장할 스케줄 설정 객체
+            db: 재사용할 DB 세션 (없으면 배치 세션 또는 새 세션 사용)
         """
         try:
             # 디렉토리 생성
-            os.makedirs(self.schedule_dir, exist_ok=True)
-            
-            # 스케줄 ID 기반 파일명
-            filename = f"{schedule.id}.json"
-            filepath = self.schedule_dir / filename
+            _ensure_dir(self.schedule_dir)
             
-            # 사전으로 변환 후 JSON 저장
-            schedule_dict = schedule.to_dict()
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(schedule_dict, f, indent=2, ensure_ascii=False)
+            # 스케줄 JSON 파일 저장
+            self._write_schedule_file(schedule)
+            self._dirty.discard(schedule.id)
                 
             # 메모리상의 스케줄 갱신
             self.schedules[schedule.id] = schedule
             
-            logger.debug(f"스케줄 {schedule.id}가 저장되었습니다.")
+            logger.debug("스케줄 %s가 저장되었습니다.", schedule.id)
+            
+            # SQLite 데이터베이스 업데이트 (다음 실행 시간만 반영)
+            if schedule.next_run is None:
+                return
+            
+            if _web_db_modules() is None:
+                logger.debug("웹 UI 데이터베이스 모듈이 로드되지 않았습니다.")
+                return
+            
+            if db is None:
+                with self._db_lock:
+                    if self._db_batch is not None:
+                        # run_once 중에는 모아 두었다가 _commit_db에서 한 번에 갱신
+                        self._db_next_runs[schedule.id] = schedule.next_run
+                        return
             
-            # SQLite 데이터베이스 업데이트
             try:
-                from dteg.web.database import SessionLocal
-                from dteg.web.models.database_models import Schedule as DBSchedule
+                with self._web_db_session(db) as session:
+                    if session is None:
+                        return
+                    self._update_db_next_runs(session, {schedule.id: schedule.next_run})
                 
-                db = SessionLocal()
-                try:
-                    db_schedule = db.query(DBSchedule).filter(DBSchedule.id == schedule.id).first()
-                    if db_schedule:
-                        # 다음 실행 시간 업데이트
-                        if hasattr(schedule, 'next_run_time') and schedule.next_run_time:
-                            db_schedule.next_run = schedule.next_run_time
-                        elif hasattr(schedule, 'next_run') and schedule.next_run:
-                            db_schedule.next_run = schedule.next_run
-                            
-                        logger.debug(f"DB 스케줄 {schedule.id}의 다음 실행 시간 업데이트됨")
-                    
-                    # 변경 사항 커밋
-                    db.commit()
-                    logger.debug(f"SQLite 데이터베이스에 스케줄 {schedule.id} 정보가 업데이트되었습니다.")
-                except Exception as e:
-                    db.rollback()
-                    logger.error(f"SQLite 데이터베이스 업데이트 실패: {str(e)}")
-                finally:
-                    db.close()
-            except ImportError:
-                logger.debug("웹 UI 데이터베이스 모듈이 로드되지 않았습니다.")
+                logger.debug("SQLite 데이터베이스에 스케줄 %s 정보가 업데이트되었습니다.", schedule.id)
             except Exception as e:
-                logger.error(f"데이터베이스 연결 실패: {str(e)}")
+                logger.error(f"SQLite 데이터베이스 업데이트 실패: {str(e)}")
         except Exception as e:
             logger.error(f"스케줄 저장 중 오류 발생: {str(e)}")
             
     def _load_schedules(self):
-        """저장된 스케줄 정보 로드"""
-        schedules_path = self.schedule_dir / "schedules.json"
-        if not schedules_path.exists():
+        """
+        저장된 스케줄 정보 로드
+        
+        스케줄별 JSON 파일(``{schedule_id}.json``)을 읽고, 이전 버전의
+        ``schedules.json`` 파일이 있으면 개별 파일에 없는 스케줄만 추가로 로드합니다.
+        """
+        if not self.schedule_dir.exists():
+            logger.info("저장된 스케줄 정보가 없습니다.")
+            return
+        
+        loaded = {}
+        with os.scandir(self.schedule_dir) as it:
+            for entry in it:
+                if (not entry.name.endswith(".json") or entry.name == LEGACY_SCHEDULES_FILE
+                        or not entry.is_file()):
+                    continue
+                try:
+                    schedule = ScheduleConfig.from_dict(load_json(entry.path), self.schedule_dir)
+                    loaded[schedule.id] = schedule
+                except Exception as e:
+                    logger.error(f"스케줄 정보 로드 실패: {entry.path} - {e}")
+        
+        # 이전 버전의 단일 파일 형식 호환
+        legacy_path = self.schedule_dir / LEGACY_SCHEDULES_FILE
+        if legacy_path.exists():
+            try:
+                for schedule_id, schedule_data in load_json(legacy_path).items():
+                    if schedule_id not in loaded:
+                        loaded[schedule_id] = ScheduleConfig.from_dict(schedule_data, self.schedule_dir)
+                        self._dirty.add(schedule_id)
+            except Exception as e:
+                logger.error(f"스케줄 정보 로드 실패: {legacy_path} - {e}")
+        
+        if not loaded:
             logger.info("저장된 스케줄 정보가 없습니다.")
             return
+        
+        with self._lock:
+            self.schedules.update(loaded)
             
+            # 의존성 그래프를 한 번 구성한 뒤 힙에 등록
+            self._dag = None
+            for schedule in self.schedules.values():
+                self._push_schedule(schedule)
+        
+        # 이전 형식에서 읽은 스케줄은 개별 파일로 옮긴 뒤, 삭제된 스케줄이
+        # 다시 로드되지 않도록 이전 파일을 보관용 이름으로 변경
+        if legacy_path.exists():
+            self._flush_dirty()
+            if not self._dirty:
+                try:
+                    legacy_path.replace(legacy_path.with_suffix(".json.bak"))
+                except OSError as e:
+                    logger.error(f"이전 스케줄 파일 정리 실패: {legacy_path} - {e}")
+        
+        logger.info(f"{len(self.schedules)}개의 스케줄 정보를 로드했습니다.")
+    
+    def _append_history_index(self, record: ExecutionRecord):
+        """
+        완료된 실행 기록 요약을 실행 이력 색인 파일에 한 줄 추가
+        
+        Args:
+            record: 완료된 실행 기록 객체
+        """
+        line = dump_json(record.to_summary()) + b"\n"
         try:
-            with open(schedules_path, 'r', encoding='utf-8') as f:
-                schedules_data = json.load(f)
-                
-            for schedule_id, schedule_data in schedules_data.items():
-                schedule = ScheduleConfig.from_dict(schedule_data, self.schedule_dir)
-                self.schedules[schedule_id] = schedule
-                
-            logger.info(f"{len(self.schedules)}개의 스케줄 정보를 로드했습니다.")
-        except Exception as e:
-            logger.error(f"스케줄 정보 로드 실패: {e}")
+            # O_APPEND와 한 번의 write로 기록하여 다른 프로세스의 추가 쓰기와 줄이 섞이지 않도록 함
+            with self._index_lock:
+                fd = os.open(self.history_dir / HISTORY_INDEX_FILE, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+                try:
+                    os.write(fd, line)
+                finally:
+                    os.close(fd)
+        except OSError as e:
+            logger.error(f"실행 이력 색인 저장 실패: {record.id} - {e}")
+    
+    def _write_execution_log(self, record: ExecutionRecord) -> bool:
+        """
+        웹 UI 데이터베이스에 저장하지 못한 실행 로그를 실행 이력 디렉토리의 로그 파일로 저장
+        
+        Args:
+            record: 완료된 실행 기록 객체
+            
+        Returns:
+            저장 성공 여부
+        """
+        if not record.logs:
+            return False
+        try:
+            data = "\n".join(record.logs).encode("utf-8") + b"\n"
+            atomic_write(self.history_dir / f"{record.id}{EXECUTION_LOG_SUFFIX}", data)
+            self._spilled_logs.add(record.id)
+            return True
+        except OSError as e:
+            logger.error(f"실행 로그 저장 실패: {record.id} - {e}")
+            return False
+    
+    def _delete_execution_logs(self, execution_ids: Iterable[str]):
+        """
+        보존 대상에서 제외된 실행 기록의 로그 파일 삭제
+        
+        Args:
+            execution_ids: 로그 파일을 삭제할 실행 ID 목록
+        """
+        for execution_id in execution_ids:
+            self._spilled_logs.discard(execution_id)
+            try:
+                (self.history_dir / f"{execution_id}{EXECUTION_LOG_SUFFIX}").unlink(missing_ok=True)
+            except OSError as e:
+                logger.error(f"실행 로그 삭제 실패: {execution_id} - {e}")
+    
+    def get_execution_logs(self, execution_id: str) -> List[str]:
+        """
+        실행 로그 조회
+        
+        메모리에 남아 있는 로그가 없으면 로그 파일을 필요할 때만 읽습니다.
+        (웹 UI 데이터베이스에 저장된 로그는 웹 UI에서 조회)
+        
+        Args:
+            execution_id: 실행 ID
+            
+        Returns:
+            로그 줄 목록 (없으면 빈 목록)
+        """
+        with self._lock:
+            record = self.running_executions.get(execution_id)
+            if record is None:
+                record = next((r for r in reversed(self.completed_executions) if r.id == execution_id), None)
+            if record is not None and record.logs:
+                return list(record.logs)
+        
+        try:
+            return (self.history_dir / f"{execution_id}{EXECUTION_LOG_SUFFIX}").read_text(encoding="utf-8").splitlines()
+        except OSError:
+            return []
+    
+    def _read_history_index(self, index_path: Path) -> List[Dict]:
+        """
+        실행 이력 색인 파일을 순차적으로 읽어 요약 목록 반환
+        
+        Args:
+            index_path: 색인 파일 경로
+            
+        Returns:
+            기록된 순서(오래된 기록 먼저)의 실행 기록 요약 목록
+        """
+        entries = []
+        with open(index_path, 'rb') as f:
+            for line_no, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    entries.append(loads_json(line))
+                except ValueError as e:
+                    logger.error(f"실행 이력 색인 줄 읽기 실패: {index_path}:{line_no} - {e}")
+        return entries
+    
+    def _scan_history_files(self) -> List[Dict]:
+        """
+        이전 버전의 개별 실행 이력 파일을 읽어 요약 목록 반환
+        
+        Returns:
+            시작 시간 순(오래된 기록 먼저)의 실행 기록 요약 목록
+        """
+        entries = []
+        with os.scandir(self.history_dir) as it:
+            for entry in it:
+                if not entry.name.endswith(".json") or not entry.is_file():
+                    continue
+                try:
+                    entries.append(ExecutionRecord.from_dict(load_json(entry.path)).to_summary())
+                except Exception as e:
+                    logger.error(f"실행 이력 로드 실패: {entry.path} - {e}")
+        entries.sort(key=lambda entry: entry["start_time"])
+        return entries
     
     def _load_history(self):
-        """저장된 실행 이력 로드"""
+        """
+        저장된 실행 이력 로드
+        
+        실행 이력 색인 파일을 한 번 순차적으로 읽어 최근 실행 기록은
+        completed_executions 크기만큼만 메모리에 유지하고, 그 이전 기록에서는
+        파이프라인별 마지막 성공 기록만 남깁니다. 색인 파일이 없으면 이전 버전의
+        개별 이력 파일에서 색인을 만듭니다. 로그를 포함한 전체 기록은 웹 UI
+        데이터베이스에서 조회합니다.
+        """
         if not self.history_dir.exists():
             return
-            
-        for file_path in self.history_dir.glob("*.json"):
+        
+        index_path = self.history_dir / HISTORY_INDEX_FILE
+        rewrite_index = False
+        try:
+            if index_path.exists():
+                entries = self._read_history_index(index_path)
+                rewrite_index = len(entries) > HISTORY_INDEX_COMPACT_LINES
+            else:
+                entries = self._scan_history_files()
+                rewrite_index = bool(entries)
+        except OSError as e:
+            logger.error(f"실행 이력 로드 실패: {e}")
+            return
+        
+        max_recent = self._completed_executions.maxlen
+        split = 0 if max_recent is None else max(len(entries) - max_recent, 0)
+        
+        # 오래된 기록은 파이프라인별 마지막 성공 기록만 유지
+        kept = {}
+        for data in entries[:split]:
+            if data.get("status") != "SUCCESS":
+                continue
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    
-                # 실행 기록 복원 (간소화 버전)
-                record = ExecutionRecord(data["schedule_id"], data["pipeline_id"])
-                record.id = data["id"]
-                record.start_time = datetime.fromisoformat(data["start_time"])
-                if data["end_time"]:
-                    record.end_time = datetime.fromisoformat(data["end_time"])
-                record.status = data["status"]
-                record.retry_count = data["retry_count"]
-                record.error_message = data["error_message"]
-                record.logs = data.get("logs", [])
-                
-                self.completed_executions.append(record)
+                record = ExecutionRecord.from_dict(data)
             except Exception as e:
-                logger.error(f"실행 이력 로드 실패: {file_path} - {e}")
+                logger.error(f"실행 이력 로드 실패: {data.get('id')} - {e}")
+                continue
+            previous = self._last_success.get(record.pipeline_id)
+            if previous is None or (record.end_time and previous.end_time and record.end_time >= previous.end_time):
+                self._last_success[record.pipeline_id] = record
+                kept[record.pipeline_id] = data
+        
+        recent = entries[split:]
+        for data in recent:
+            try:
+                self._record_completion(ExecutionRecord.from_dict(data))
+            except Exception as e:
+                logger.error(f"실행 이력 로드 실패: {data.get('id')} - {e}")
+        
+        # 색인을 새로 만들거나 너무 커진 경우 필요한 기록만 남겨 다시 저장
+        if rewrite_index:
+            retained = (*kept.values(), *recent)
+            lines = [dump_json(data) + b"\n" for data in retained]
+            try:
+                atomic_write(index_path, b"".join(lines))
+            except OSError as e:
+                logger.error(f"실행 이력 색인 저장 실패: {e}")
+            else:
+                # 색인에서 제외된 기록의 로그 파일도 함께 삭제
+                retained_ids = {data.get("id") for data in retained}
+                self._delete_execution_logs(
+                    data["id"] for data in entries[:split] if data.get("id") and data["id"] not in retained_ids
+                )
         
-        logger.info(f"{len(self.completed_executions)}개의 실행 이력을 로드했습니다.") 
\ No newline at end of file
+        logger.info(f"{len(entries)}개의 실행 이력을 확인하고 {len(self._completed_executions)}개를 로드했습니다.")
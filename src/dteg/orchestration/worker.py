@@ -3,17 +3,20 @@ Celery 작업 큐 모듈
 
 파이프라인 작업 분산 처리를 위한 Celery 기반 작업 큐 구현
 """
+import collections
+import functools
+import importlib.util
 import logging
 import os
+import threading
 from datetime import datetime
-from typing import Dict, List, Any, Optional, Union, Callable
+from typing import Dict, List, Any, Optional, Tuple, Union, Callable
 from pathlib import Path
-import json
 import time
 
 from celery import Celery
 from celery.exceptions import MaxRetriesExceededError
-from celery.signals import task_failure, task_success
+from celery.signals import task_failure, task_postrun, task_prerun, task_success
 
 # Redis 모듈을 선택적으로 가져오기 (설치되어 있으면)
 try:
@@ -22,8 +25,13 @@ try:
 except ImportError:
     REDIS_AVAILABLE = False
 
+# msgpack 모듈 설치 여부 (설치되어 있으면 작업 메시지 직렬화에 사용, 직렬화는 kombu가 직접 임포트)
+MSGPACK_AVAILABLE = importlib.util.find_spec("msgpack") is not None
+
 from dteg.core.pipeline import Pipeline
 from dteg.core.config import PipelineConfig
+from dteg.orchestration.scheduler import _load_pipeline_config_dict
+from dteg.utils.fileio import atomic_write, dump_json
 
 logger = logging.getLogger(__name__)
 
@@ -39,6 +47,19 @@ def get_result_backend() -> str:
     """Celery 결과 백엔드 URL 반환"""
     return CELERY_RESULT_BACKEND
 
+# 실행 중인 작업 ID를 기록하는 Redis 정렬 집합 키 (점수는 작업 시작 시각)
+ACTIVE_TASKS_KEY = "dteg:active_tasks"
+
+# 이 시간(초)보다 오래 남아 있는 실행 중 기록은 비정상 종료된 워커의 작업으로 보고 제거
+ACTIVE_TASK_MAX_AGE = 24 * 60 * 60
+
+# 작업 ID별로 재사용할 AsyncResult 최대 개수 (오래 조회하지 않은 작업부터 제거)
+ASYNC_RESULT_CACHE_SIZE = 1024
+
+# setup_celery로 만든 앱의 작업/결과 직렬화 방식 (msgpack이 없으면 json)
+TASK_SERIALIZER = "msgpack" if MSGPACK_AVAILABLE else "json"
+ACCEPT_CONTENT = ["msgpack", "json"] if MSGPACK_AVAILABLE else ["json"]
+
 # Celery 앱 생성
 celery_app = Celery(
     "dteg",
@@ -70,6 +91,53 @@ def handle_task_success(sender=None, result=None, **kwargs):
     logger.info(f"작업 성공 완료: {result}")
 
 
+@functools.lru_cache(maxsize=None)
+def _redis_client(url: str):
+    """
+    Redis 브로커 URL의 클라이언트 반환 (URL별로 한 번만 생성)
+    
+    Args:
+        url: 브로커 URL
+        
+    Returns:
+        Redis 클라이언트, Redis 브로커가 아니거나 redis 모듈이 없으면 None
+    """
+    if not REDIS_AVAILABLE or not url.startswith(("redis://", "rediss://", "unix://")):
+        return None
+    return redis.Redis.from_url(url)
+
+
+def _active_tasks_client(task=None):
+    """실행 중인 작업 목록을 기록할 Redis 클라이언트 반환 (작업이 속한 앱의 브로커 기준)"""
+    app = getattr(task, "app", None)
+    broker_url = app.conf.broker_url if app is not None else CELERY_BROKER_URL
+    return _redis_client(str(broker_url or ""))
+
+
+@task_prerun.connect
+def handle_task_prerun(sender=None, task_id=None, **kwargs):
+    """작업 시작 시 실행 중인 작업 목록에 추가"""
+    client = _active_tasks_client(sender)
+    if client is None:
+        return
+    try:
+        client.zadd(ACTIVE_TASKS_KEY, {task_id: time.time()})
+    except Exception as e:
+        logger.debug(f"실행 중인 작업 기록 실패: {task_id} - {e}")
+
+
+@task_postrun.connect
+def handle_task_postrun(sender=None, task_id=None, **kwargs):
+    """작업 종료(성공/실패) 시 실행 중인 작업 목록에서 제거"""
+    client = _active_tasks_client(sender)
+    if client is None:
+        return
+    try:
+        client.zrem(ACTIVE_TASKS_KEY, task_id)
+    except Exception as e:
+        logger.debug(f"실행 중인 작업 기록 제거 실패: {task_id} - {e}")
+
+
 @celery_app.task(bind=True, max_retries=3, default_retry_delay=300)
 def pipeline_task(self, pipeline_config: Dict[str, Any], execution_id: Optional[str] = None):
     """
@@ -124,11 +192,11 @@ def setup_celery(broker_url: str = None, result_backend: str = None) -> Celery:
         backend=result_backend or CELERY_RESULT_BACKEND
     )
     
-    # 기본 설정
+    # 기본 설정 (pickle은 느리고 임의 코드 실행 위험이 있으므로 msgpack 또는 json 사용)
     app.conf.update(
-        task_serializer="pickle",
-        accept_content=["pickle"],
-        result_serializer="pickle"
+        task_serializer=TASK_SERIALIZER,
+        accept_content=ACCEPT_CONTENT,
+        result_serializer=TASK_SERIALIZER
     )
     
     return app
@@ -146,11 +214,8 @@ def run_pipeline_from_file(self, config_path: Union[str, Path], execution_id: Op
         실행 결과 정보
     """
     try:
-        # 설정 파일 로드
-        config = PipelineConfig.from_yaml(config_path)
-        
-        # 설정을 dict로 변환하여 기본 작업으로 전달
-        config_dict = config.dict()
+        # 설정 파일을 dict로 로드하여 기본 작업으로 전달 (경로와 수정 시각 기준 캐시)
+        config_dict = _load_pipeline_config_dict(config_path)
         return pipeline_task(config_dict, execution_id)
         
     except Exception as e:
@@ -179,6 +244,34 @@ class CeleryTaskQueue:
         self.app = setup_celery(self.broker_url, self.result_backend)
         self.on_task_complete = on_task_complete
         self.celery_app = self.app  # 테스트 호환성을 위해 추가
+        
+        # 최근 조회한 작업의 AsyncResult (완료된 작업은 결과를 내부에 캐시하므로 재사용)
+        self._async_results: "collections.OrderedDict[str, Any]" = collections.OrderedDict()
+        self._async_results_lock = threading.Lock()
+    
+    def _async_result(self, task_id: str):
+        """
+        작업 ID의 AsyncResult 반환 (최근 조회한 작업은 같은 객체 재사용)
+        
+        완료된 작업의 AsyncResult는 결과를 내부에 보관하므로, 같은 객체를 재사용하면
+        반복 조회 시 결과 백엔드에 다시 요청하지 않습니다.
+        
+        Args:
+            task_id: 작업 ID
+            
+        Returns:
+            AsyncResult 객체
+        """
+        with self._async_results_lock:
+            async_result = self._async_results.get(task_id)
+            if async_result is None:
+                async_result = self.app.AsyncResult(task_id)
+                self._async_results[task_id] = async_result
+                if len(self._async_results) > ASYNC_RESULT_CACHE_SIZE:
+                    self._async_results.popitem(last=False)
+            else:
+                self._async_results.move_to_end(task_id)
+        return async_result
     
     def run_pipeline(self, 
                      pipeline_config: Union[PipelineConfig, Dict[str, Any]],
@@ -203,6 +296,34 @@ class CeleryTaskQueue:
         
         return task.id
     
+    def run_pipelines(self, 
+                      jobs: List[Tuple[Union[PipelineConfig, Dict[str, Any]], Optional[str]]]) -> List[str]:
+        """
+        여러 파이프라인 작업을 하나의 브로커 연결로 일괄 제출
+        
+        Args:
+            jobs: (파이프라인 설정, 실행 ID) 튜플 목록
+            
+        Returns:
+            제출 순서와 같은 작업 ID 목록
+        """
+        task_ids = []
+        
+        # 프로듀서(브로커 연결)를 한 번만 획득하여 모든 작업에 재사용
+        with pipeline_task.app.producer_or_acquire() as producer:
+            for pipeline_config, execution_id in jobs:
+                if isinstance(pipeline_config, PipelineConfig):
+                    config_dict = pipeline_config.dict()
+                else:
+                    config_dict = pipeline_config
+                
+                task = pipeline_task.apply_async((config_dict, execution_id), producer=producer)
+                task_ids.append(task.id)
+        
+        logger.info(f"파이프라인 작업 {len(task_ids)}개 일괄 제출됨")
+        
+        return task_ids
+    
     def get_task_status(self, task_id: str) -> str:
         """
         작업 상태 조회
@@ -213,7 +334,7 @@ class CeleryTaskQueue:
         Returns:
             작업 상태 문자열
         """
-        async_result = self.app.AsyncResult(task_id)
+        async_result = self._async_result(task_id)
         return async_result.state
     
     def cancel_task(self, task_id: str, terminate: bool = True) -> bool:
@@ -235,34 +356,6 @@ class CeleryTaskQueue:
             logger.error(f"작업 취소 실패: {task_id} - {e}")
             return False
 
-    @celery_app.task(bind=True)
-    def run_pipeline_from_file(self, config_path: Union[str, Path], execution_id: Optional[str] = None):
-        """
-        파일에서 로드한 설정으로 파이프라인 실행
-        
-        Args:
-            config_path: 파이프라인 설정 파일 경로
-            execution_id: 실행 ID (선택적)
-            
-        Returns:
-            실행 결과 정보
-        """
-        try:
-            # 설정 파일 로드
-            config = PipelineConfig.from_yaml(config_path)
-            
-            # 설정을 dict로 변환하여 기본 작업으로 전달
-            config_dict = config.dict()
-            return pipeline_task(config_dict, execution_id)
-            
-        except Exception as e:
-            logger.error(f"파이프라인 설정 로드 실패: {e}")
-            return {
-                "task_id": self.request.id,
-                "execution_id": execution_id,
-                "status": "failed",
-                "error": f"설정 로드 실패: {str(e)}"
-            }
 
 class CeleryTaskManager:
     """Celery 작업 관리자 클래스"""
@@ -322,15 +415,34 @@ class CeleryTaskManager:
             else:
                 pipeline_id = pipeline_config.get("pipeline_id", "unknown")
                 
-        # task_queue를 사용하여 작업 제출
-        task_id = self.task_queue.run_pipeline(
-            pipeline_config=pipeline_config, 
-            execution_id=execution_id
-        )
+        if isinstance(pipeline_config, (str, Path)):
+            # 설정 파일은 워커에서 로드하도록 경로만 전달
+            task_id = run_pipeline_from_file.delay(str(pipeline_config), execution_id).id
+        else:
+            # task_queue를 사용하여 작업 제출
+            task_id = self.task_queue.run_pipeline(
+                pipeline_config=pipeline_config, 
+                execution_id=execution_id
+            )
         logger.info(f"파이프라인 작업 제출됨 (파이프라인 ID: {pipeline_id}, 작업 ID: {task_id})")
         
         return task_id
     
+    def run_pipelines(self, 
+                      jobs: List[Tuple[Union[PipelineConfig, Dict[str, Any]], Optional[str]]],
+                      queue: str = "default") -> List[str]:
+        """
+        여러 파이프라인 작업 일괄 제출
+        
+        Args:
+            jobs: (파이프라인 설정, 실행 ID) 튜플 목록
+            queue: 사용할 Celery 큐 이름
+            
+        Returns:
+            제출 순서와 같은 작업 ID 목록
+        """
+        return self.task_queue.run_pipelines(jobs)
+    
     def get_result(self, task_id: str, wait: bool = False, timeout: int = 10) -> Dict[str, Any]:
         """
         작업 결과 조회
@@ -343,8 +455,8 @@ class CeleryTaskManager:
         Returns:
             작업 결과 정보
         """
-        # 설정한 task_queue로 AsyncResult 객체 생성
-        async_result = self.task_queue.app.AsyncResult(task_id)
+        # 설정한 task_queue의 AsyncResult 객체 사용 (최근 조회한 작업은 재사용)
+        async_result = self.task_queue._async_result(task_id)
         
         if wait and not async_result.ready():
             try:
@@ -378,8 +490,20 @@ class CeleryTaskManager:
         Returns:
             실행 중인 작업 ID 목록
         """
+        # Redis 브로커를 사용하면 워커가 기록한 실행 중인 작업 목록을 한 번에 조회
+        client = _redis_client(self.broker_url)
+        if client is not None:
+            try:
+                pipe = client.pipeline()
+                pipe.zremrangebyscore(ACTIVE_TASKS_KEY, "-inf", time.time() - ACTIVE_TASK_MAX_AGE)
+                pipe.zrange(ACTIVE_TASKS_KEY, 0, -1)
+                _, task_ids = pipe.execute()
+                return [task_id.decode() for task_id in task_ids]
+            except Exception as e:
+                logger.debug(f"실행 중인 작업 목록 조회 실패, 워커에 직접 조회합니다: {e}")
+        
         try:
-            # Celery Inspect를 사용하여 현재 활성 작업 조회
+            # Celery Inspect를 사용하여 현재 활성 작업 조회 (모든 워커의 응답을 기다림)
             inspector = self.task_queue.app.control.inspect()
             active_tasks = inspector.active()
             
@@ -420,6 +544,25 @@ class CeleryTaskManager:
             logger.error(f"작업 취소 실패: {task_id} - {e}")
             return False
     
+    def revoke_tasks(self, task_ids: List[str], terminate: bool = False) -> bool:
+        """
+        여러 작업을 하나의 브로드캐스트 메시지로 일괄 취소
+        
+        Args:
+            task_ids: 작업 ID 목록
+            terminate: 실행 중인 작업 강제 종료 여부
+            
+        Returns:
+            취소 처리 성공 여부
+        """
+        try:
+            self.task_queue.app.control.revoke(list(task_ids), terminate=terminate)
+            logger.info(f"작업 {len(task_ids)}개 취소됨")
+            return True
+        except Exception as e:
+            logger.error(f"작업 일괄 취소 실패: {e}")
+            return False
+    
     def save_result(self, task_id: str, result: Dict[str, Any]):
         """
         작업 결과를 파일로 저장
@@ -430,8 +573,7 @@ class CeleryTaskManager:
         """
         result_file = self.result_dir / f"{task_id}.json"
         try:
-            with open(result_file, 'w', encoding='utf-8') as f:
-                json.dump(result, f, indent=2, ensure_ascii=False)
+            atomic_write(result_file, dump_json(result, indent=True))
             logger.debug(f"작업 결과 저장됨: {result_file}")
         except Exception as e:
             logger.error(f"작업 결과 저장 실패: {e}") 
\ No newline at end of file
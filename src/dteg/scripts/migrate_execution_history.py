@@ -5,12 +5,13 @@
 JSON 파일로 저장된 실행 이력을 SQLite 데이터베이스로 마이그레이션
 """
 import os
-import json
 import logging
 from datetime import datetime
 from pathlib import Path
 import sys
 
+from dteg.utils.fileio import load_json
+
 # 로깅 설정
 logging.basicConfig(
     level=logging.INFO,
@@ -47,8 +48,7 @@ def migrate_execution_history():
             # 각 이력 파일 처리
             for file_path in execution_files:
                 try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
+                    data = load_json(file_path)
                     
                     # 이미 데이터베이스에 존재하는지 확인
                     execution_id = data.get("id")
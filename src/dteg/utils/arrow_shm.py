@@ -0,0 +1,88 @@
+"""
+공유 메모리 기반 DataFrame 전달 유틸리티
+
+프로세스 간에 DataFrame을 pickle 없이 전달하기 위해 Arrow IPC 스트림을
+multiprocessing.shared_memory 블록에 기록하고 다시 읽어오는 함수 모음
+"""
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+
+import pandas as pd
+
+# pyarrow 모듈을 선택적으로 가져오기 (설치되어 있으면)
+try:
+    import pyarrow as pa
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+
+@dataclass(frozen=True)
+class SharedFrameHandle:
+    """공유 메모리에 기록된 DataFrame을 가리키는 핸들 (프로세스 간 전달용)"""
+    name: str  # 공유 메모리 블록 이름
+    size: int  # Arrow IPC 스트림 크기(바이트)
+
+
+def _require_pyarrow() -> None:
+    if not PYARROW_AVAILABLE:
+        raise ImportError("공유 메모리 DataFrame 전달에는 pyarrow가 필요합니다")
+
+
+def put(df: pd.DataFrame) -> SharedFrameHandle:
+    """
+    DataFrame을 Arrow IPC 스트림으로 공유 메모리에 기록
+    
+    블록은 get(handle)에서 해제(unlink)되므로 핸들은 한 번만 소비해야 합니다.
+    
+    Args:
+        df: 전달할 데이터프레임
+        
+    Returns:
+        공유 메모리 핸들
+    """
+    _require_pyarrow()
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    
+    # 필요한 크기를 먼저 계산한 뒤 공유 메모리에 직접 기록
+    sink = pa.MockOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    size = sink.size()
+    
+    shm = shared_memory.SharedMemory(create=True, size=max(size, 1))
+    try:
+        stream = pa.FixedSizeBufferWriter(pa.py_buffer(shm.buf))
+        with pa.ipc.new_stream(stream, table.schema) as writer:
+            writer.write_table(table)
+        return SharedFrameHandle(name=shm.name, size=size)
+    except BaseException:
+        shm.unlink()
+        raise
+    finally:
+        shm.close()
+
+
+def get(handle: SharedFrameHandle, unlink: bool = True) -> pd.DataFrame:
+    """
+    공유 메모리에 기록된 Arrow IPC 스트림을 DataFrame으로 읽기
+    
+    Args:
+        handle: put()이 반환한 핸들
+        unlink: 읽은 뒤 공유 메모리 블록 해제 여부
+        
+    Returns:
+        데이터프레임
+    """
+    _require_pyarrow()
+    shm = shared_memory.SharedMemory(name=handle.name)
+    try:
+        buffer = pa.py_buffer(shm.buf[:handle.size])
+        df = pa.ipc.open_stream(buffer).read_all().to_pandas()
+        # 공유 메모리를 닫기 전에 버퍼 참조 해제
+        del buffer
+        return df
+    finally:
+        shm.close()
+        if unlink:
+            shm.unlink()
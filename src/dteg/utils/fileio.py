@@ -0,0 +1,98 @@
+"""
+파일 입출력 유틸리티 모듈
+
+원자적 파일 쓰기, JSON 직렬화 등 파일 저장 관련 유틸리티 함수 모음
+"""
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Union
+
+# orjson 모듈을 선택적으로 가져오기 (설치되어 있으면)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# 파일 쓰기 버퍼 크기 (1MB)
+WRITE_BUFFER_SIZE = 1 << 20
+
+
+def dump_json(obj: Any, indent: bool = False) -> bytes:
+    """
+    객체를 UTF-8 JSON 바이트로 직렬화
+    
+    orjson이 설치되어 있으면 사용하고, 없으면 표준 json 모듈로 대체합니다.
+    
+    Args:
+        obj: 직렬화할 객체
+        indent: 2칸 들여쓰기 여부
+        
+    Returns:
+        JSON 바이트
+    """
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False).encode('utf-8')
+
+
+def loads_json(data: Union[bytes, str]) -> Any:
+    """
+    JSON 바이트(또는 문자열)를 역직렬화
+    
+    orjson이 설치되어 있으면 사용하고, 없으면 표준 json 모듈로 대체합니다.
+    
+    Args:
+        data: JSON 바이트 또는 문자열
+        
+    Returns:
+        역직렬화된 객체
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def load_json(path: Union[str, Path]) -> Any:
+    """
+    JSON 파일을 바이트로 한 번에 읽어 역직렬화
+    
+    Args:
+        path: 읽을 파일 경로
+        
+    Returns:
+        역직렬화된 객체
+    """
+    return loads_json(Path(path).read_bytes())
+
+
+def atomic_write(path: Union[str, Path], data: bytes) -> None:
+    """
+    임시 파일에 쓴 뒤 os.replace로 교체하여 파일을 원자적으로 저장
+    
+    쓰기 도중 실패하거나 다른 프로세스가 동시에 읽더라도
+    일부만 기록된 파일이 노출되지 않습니다. 임시 파일 이름에 프로세스/스레드 ID를
+    붙여 같은 파일을 동시에 저장하는 작성자끼리 임시 파일을 공유하지 않도록 합니다.
+    
+    Args:
+        path: 저장할 파일 경로
+        data: 저장할 바이트 데이터
+    """
+    path = os.fspath(path)
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp_path, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        # 실패 시 임시 파일 정리
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
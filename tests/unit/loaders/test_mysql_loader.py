@@ -4,7 +4,9 @@ MySQL Loader 단위 테스트
 import unittest
 from unittest.mock import patch, MagicMock
 import pandas as pd
+from sqlalchemy import create_engine
 
+from dteg.loaders import mysql as mysql_loader
 from dteg.loaders.mysql import MySQLLoader
 from dteg.loaders import IfExists
 
@@ -16,13 +18,17 @@ class TestMySQLLoader(unittest.TestCase):
 
     def setUp(self):
         """테스트 설정"""
+        # 테스트 간 공유 엔진 캐시 초기화
+        mysql_loader._ENGINES.clear()
+
         self.config = {
             "host": "localhost",
             "port": 3306,
             "database": "test_db",
             "user": "test_user",
             "password": "test_password",
-            "table": "test_table"
+            "table": "test_table",
+            "driver": "pymysql"
         }
         
         # 테스트용 데이터프레임
@@ -76,6 +82,23 @@ class TestMySQLLoader(unittest.TestCase):
             })
             loader._validate_config()
 
+    def test_validate_config_invalid_driver(self, mock_create_engine, mock_connect):
+        """driver 필드 검증 테스트"""
+        with self.assertRaises(ValueError):
+            MySQLLoader({**self.config, "driver": "invalid_driver"})
+
+        with patch('dteg.loaders.mysql.MYSQLCLIENT_AVAILABLE', False):
+            with self.assertRaises(ValueError):
+                MySQLLoader({**self.config, "driver": "mysqlclient"})
+
+    def test_setup_auto_driver_fallback(self, mock_create_engine, mock_connect):
+        """mysqlclient가 없으면 pymysql로 대체되는지 테스트"""
+        with patch('dteg.loaders.mysql.MYSQLCLIENT_AVAILABLE', False):
+            loader = MySQLLoader({**self.config, "driver": "auto"})
+
+        self.assertEqual(loader.driver, "pymysql")
+        self.assertTrue(mock_create_engine.call_args[0][0].startswith("mysql+pymysql://"))
+
     def test_setup(self, mock_create_engine, mock_connect):
         """_setup 메서드 테스트"""
         # 호출 횟수 초기화
@@ -92,7 +115,12 @@ class TestMySQLLoader(unittest.TestCase):
         mock_create_engine.assert_called_once_with(
             f"mysql+pymysql://{self.config['user']}:{self.config['password']}"
             f"@{self.config['host']}:{self.config.get('port', 3306)}/{self.config['database']}"
-            f"?charset={self.config.get('charset', 'utf8mb4')}"
+            f"?charset={self.config.get('charset', 'utf8mb4')}",
+            connect_args=loader._connect_args()
+        )
+        self.assertEqual(
+            loader._connect_args()["max_allowed_packet"],
+            MySQLLoader.DEFAULT_MAX_ALLOWED_PACKET
         )
         
         # engine 속성이 설정되었는지 확인
@@ -122,6 +150,21 @@ class TestMySQLLoader(unittest.TestCase):
         # 적재된 행 수 확인
         self.assertEqual(result, 3)
 
+    def test_load_shared_memory_handle(self, mock_create_engine, mock_connect):
+        """공유 메모리 핸들로 데이터 적재 테스트"""
+        mock_to_sql = MagicMock()
+        self.test_data.to_sql = mock_to_sql
+        handle = mysql_loader.arrow_shm.SharedFrameHandle(name="psm_test", size=128)
+
+        with patch('dteg.loaders.mysql.arrow_shm.get', return_value=self.test_data) as mock_get:
+            loader = MySQLLoader(self.config)
+            result = loader.load(handle)
+
+        # 핸들에서 DataFrame을 복원하여 적재
+        mock_get.assert_called_once_with(handle)
+        mock_to_sql.assert_called_once()
+        self.assertEqual(result, 3)
+
     def test_load_truncate(self, mock_create_engine, mock_connect):
         """테이블 truncate 테스트"""
         # SQLAlchemy 엔진과 연결 모킹
@@ -148,6 +191,34 @@ class TestMySQLLoader(unittest.TestCase):
         truncate_call = mock_cursor.execute.call_args[0][0]
         self.assertIn("TRUNCATE TABLE", str(truncate_call))
 
+    def test_load_empty_data(self, mock_create_engine, mock_connect):
+        """빈 데이터 적재 시 아무 작업도 하지 않는지 테스트"""
+        empty_data = pd.DataFrame(columns=["id", "name"])
+        mock_to_sql = MagicMock()
+        empty_data.to_sql = mock_to_sql
+
+        loader = MySQLLoader({**self.config, "if_exists": IfExists.TRUNCATE.value})
+        result = loader.load(empty_data)
+
+        self.assertEqual(result, 0)
+        mock_to_sql.assert_not_called()
+        mock_connect.assert_not_called()
+
+    def test_load_empty_data_truncate_even_if_empty(self, mock_create_engine, mock_connect):
+        """truncate_even_if_empty 설정 시 빈 데이터여도 truncate 수행 테스트"""
+        mock_cursor = MagicMock()
+        mock_connect.return_value.cursor.return_value.__enter__.return_value = mock_cursor
+
+        loader = MySQLLoader({
+            **self.config,
+            "if_exists": IfExists.TRUNCATE.value,
+            "truncate_even_if_empty": True
+        })
+        result = loader.load(pd.DataFrame(columns=["id", "name"]))
+
+        self.assertEqual(result, 0)
+        mock_cursor.execute.assert_called_once_with("TRUNCATE TABLE `test_table`")
+
     def test_load_with_options(self, mock_create_engine, mock_connect):
         """다양한 옵션으로 데이터 적재 테스트"""
         # SQLAlchemy 엔진과 연결 모킹
@@ -176,6 +247,138 @@ class TestMySQLLoader(unittest.TestCase):
         self.assertEqual(call_args["chunksize"], 1000)
         self.assertEqual(call_args["dtype"], {"name": "VARCHAR(100)"})
 
+    def test_load_large_append_defers_checks(self, mock_create_engine, mock_connect):
+        """대량 append 적재 시 검사 지연 테스트"""
+        mock_engine = MagicMock()
+        mock_create_engine.return_value = mock_engine
+        mock_conn = mock_engine.connect.return_value.__enter__.return_value
+
+        mock_to_sql = MagicMock()
+        self.test_data.to_sql = mock_to_sql
+
+        loader = MySQLLoader({
+            **self.config,
+            "if_exists": IfExists.APPEND.value,
+            "batch_size": 2
+        })
+        with patch('dteg.loaders.mysql.inspect') as mock_inspect:
+            mock_inspect.return_value.has_table.return_value = True
+            result = loader.load(self.test_data)
+
+        # 같은 연결로 적재되었는지 확인
+        self.assertEqual(result, 3)
+        self.assertEqual(mock_to_sql.call_args[1]["con"], mock_conn)
+        mock_inspect.assert_called_once_with(mock_conn)
+
+        # 검사 비활성화 후 복원되었는지 확인 (DISABLE KEYS는 설정한 경우에만 실행)
+        statements = [c[0][0] for c in mock_conn.exec_driver_sql.call_args_list]
+        self.assertEqual(statements, [
+            "SET SESSION unique_checks = 0",
+            "SET SESSION foreign_key_checks = 0",
+            "SET SESSION foreign_key_checks = 1",
+            "SET SESSION unique_checks = 1",
+        ])
+
+    def test_load_large_append_missing_table(self, mock_create_engine, mock_connect):
+        """테이블이 없으면 검사 지연 없이 to_sql로 테이블을 생성하며 적재"""
+        mock_engine = MagicMock()
+        mock_create_engine.return_value = mock_engine
+        mock_conn = mock_engine.connect.return_value.__enter__.return_value
+
+        mock_to_sql = MagicMock()
+        self.test_data.to_sql = mock_to_sql
+
+        loader = MySQLLoader({
+            **self.config,
+            "if_exists": IfExists.APPEND.value,
+            "batch_size": 2,
+            "disable_keys": True
+        })
+        with patch('dteg.loaders.mysql.inspect') as mock_inspect:
+            mock_inspect.return_value.has_table.return_value = False
+            result = loader.load(self.test_data)
+
+        self.assertEqual(result, 3)
+        self.assertEqual(mock_to_sql.call_args[1]["con"], mock_conn)
+        self.assertEqual(mock_to_sql.call_args[1]["if_exists"], "append")
+        mock_conn.exec_driver_sql.assert_not_called()
+
+    def test_load_large_append_with_schema_disables_keys(self, mock_create_engine, mock_connect):
+        """스키마가 설정되면 같은 스키마의 테이블 키를 비활성화/복원"""
+        mock_engine = MagicMock()
+        mock_create_engine.return_value = mock_engine
+        mock_conn = mock_engine.connect.return_value.__enter__.return_value
+
+        self.test_data.to_sql = MagicMock()
+
+        loader = MySQLLoader({
+            **self.config,
+            "schema": "other_db",
+            "if_exists": IfExists.APPEND.value,
+            "batch_size": 2,
+            "disable_keys": True
+        })
+        with patch('dteg.loaders.mysql.inspect') as mock_inspect:
+            mock_inspect.return_value.has_table.return_value = True
+            loader.load(self.test_data)
+
+        mock_inspect.return_value.has_table.assert_called_once_with("test_table", schema="other_db")
+        self.assertEqual(self.test_data.to_sql.call_args[1]["schema"], "other_db")
+        statements = [c[0][0] for c in mock_conn.exec_driver_sql.call_args_list]
+        self.assertIn("ALTER TABLE `other_db`.`test_table` DISABLE KEYS", statements)
+        self.assertIn("ALTER TABLE `other_db`.`test_table` ENABLE KEYS", statements)
+        self.assertEqual(statements[-1], "SET SESSION unique_checks = 1")
+
+    def test_load_restores_checks_when_enable_keys_fails(self, mock_create_engine, mock_connect):
+        """ENABLE KEYS가 실패해도 세션 검사 설정은 복원"""
+        mock_engine = MagicMock()
+        mock_create_engine.return_value = mock_engine
+        mock_conn = mock_engine.connect.return_value.__enter__.return_value
+
+        def exec_driver_sql(statement):
+            if statement.endswith("ENABLE KEYS"):
+                raise Exception("enable keys failed")
+        mock_conn.exec_driver_sql.side_effect = exec_driver_sql
+        self.test_data.to_sql = MagicMock()
+
+        loader = MySQLLoader({
+            **self.config,
+            "if_exists": IfExists.APPEND.value,
+            "batch_size": 2,
+            "disable_keys": True
+        })
+        with patch('dteg.loaders.mysql.inspect') as mock_inspect:
+            mock_inspect.return_value.has_table.return_value = True
+            with self.assertRaises(RuntimeError):
+                loader.load(self.test_data)
+
+        statements = [c[0][0] for c in mock_conn.exec_driver_sql.call_args_list]
+        self.assertEqual(statements[-2:], [
+            "SET SESSION foreign_key_checks = 1",
+            "SET SESSION unique_checks = 1",
+        ])
+
+    def test_load_large_append_with_real_engine(self, mock_create_engine, mock_connect):
+        """실제 엔진(SQLite)에서 검사 지연 적재의 트랜잭션 처리 테스트"""
+        engine = create_engine("sqlite://")
+        mock_create_engine.return_value = engine
+
+        loader = MySQLLoader({
+            **self.config,
+            "if_exists": IfExists.APPEND.value,
+            "batch_size": 2
+        })
+        # MySQL 전용 세션 설정 대신 SQLite에서 실행 가능한 문장 사용
+        with patch.object(MySQLLoader, "_DEFER_CHECKS_SQL", ("PRAGMA foreign_keys = OFF",)), \
+                patch.object(MySQLLoader, "_RESTORE_CHECKS_SQL", ("PRAGMA foreign_keys = ON",)):
+            # 테이블이 없으면 생성하며 적재, 있으면 검사를 미루고 추가 적재
+            self.assertEqual(loader.load(self.test_data), 3)
+            self.assertEqual(loader.load(self.test_data), 3)
+
+        with engine.connect() as conn:
+            self.assertEqual(conn.exec_driver_sql("SELECT COUNT(*) FROM test_table").scalar(), 6)
+        engine.dispose()
+
     def test_create_if_not_exists(self, mock_create_engine, mock_connect):
         """테이블 없을 경우 생성 테스트"""
         # SQLAlchemy 엔진과 연결 모킹
@@ -186,19 +389,23 @@ class TestMySQLLoader(unittest.TestCase):
         mock_inspector = MagicMock()
         mock_inspector.has_table.return_value = False
         
-        # pymysql 커서 모킹
-        mock_cursor = MagicMock()
-        mock_connect.return_value.cursor.return_value.__enter__.return_value = mock_cursor
+        # 엔진 연결 모킹
+        mock_conn = mock_engine.begin.return_value.__enter__.return_value
         
-        # to_sql 메서드 모킹 - DataFrame의 인스턴스 메서드를 직접 패치
-        with patch('pandas.DataFrame.to_sql') as mock_to_sql:
-            with patch('dteg.loaders.mysql.inspect', return_value=mock_inspector):
-                loader = MySQLLoader(self.config)
-                result = loader.create_if_not_exists(self.test_data)
-                
-                # 테이블이 없으므로 생성 시도
-                self.assertTrue(result)
-                mock_to_sql.assert_called_once()
+        with patch('dteg.loaders.mysql.inspect', return_value=mock_inspector) as mock_inspect:
+            loader = MySQLLoader(self.config)
+            result = loader.create_if_not_exists(self.test_data)
+
+            # 테이블이 없으므로 같은 연결에서 단일 DDL로 생성
+            self.assertTrue(result)
+            mock_inspect.assert_called_once_with(mock_conn)
+            mock_connect.assert_not_called()
+            mock_conn.exec_driver_sql.assert_called_once()
+            ddl = mock_conn.exec_driver_sql.call_args[0][0]
+            self.assertTrue(ddl.startswith("CREATE TABLE `test_table` ("))
+            self.assertIn("`id` BIGINT", ddl)
+            self.assertIn("`name` TEXT", ddl)
+            self.assertIn("ENGINE=InnoDB DEFAULT CHARSET=utf8mb4", ddl)
 
     def test_create_if_not_exists_already_exists(self, mock_create_engine, mock_connect):
         """테이블이 이미 존재할 경우 테스트"""
@@ -227,25 +434,44 @@ class TestMySQLLoader(unittest.TestCase):
         mock_inspector = MagicMock()
         mock_inspector.has_table.return_value = False
         
-        # pymysql 커서 모킹
-        mock_cursor = MagicMock()
-        mock_connect.return_value.cursor.return_value.__enter__.return_value = mock_cursor
+        # 엔진 연결 모킹
+        mock_conn = mock_engine.begin.return_value.__enter__.return_value
         
-        # to_sql 메서드 모킹 - DataFrame의 인스턴스 메서드를 직접 패치
-        with patch('pandas.DataFrame.to_sql') as mock_to_sql:
-            with patch('dteg.loaders.mysql.inspect', return_value=mock_inspector):
-                loader = MySQLLoader({
-                    **self.config,
-                    "create_table_primary_key": "id"
-                })
-                loader.create_if_not_exists(self.test_data)
-                
-                # to_sql이 호출되었는지 확인
-                mock_to_sql.assert_called_once()
-                # 기본 키가 추가되었는지 확인
-                mock_cursor.execute.assert_called_with(
-                    "ALTER TABLE test_table ADD PRIMARY KEY (id)"
-                )
+        with patch('dteg.loaders.mysql.inspect', return_value=mock_inspector):
+            loader = MySQLLoader({
+                **self.config,
+                "create_table_primary_key": "id",
+                "create_table_indexes": [{"name": "idx_name", "columns": ["name"]}]
+            })
+            loader.create_if_not_exists(self.test_data)
+
+            # 기본 키와 인덱스가 CREATE TABLE 문에 포함되었는지 확인
+            mock_conn.exec_driver_sql.assert_called_once()
+            ddl = mock_conn.exec_driver_sql.call_args[0][0]
+            self.assertIn("PRIMARY KEY (`id`)", ddl)
+            self.assertIn("KEY `idx_name` (`name`)", ddl)
+            # 인덱스 대상 문자열 컬럼은 VARCHAR로 생성
+            self.assertIn("`name` VARCHAR(255)", ddl)
+
+    def test_normalize_indexes(self, mock_create_engine, mock_connect):
+        """인덱스 설정 정규화 테스트"""
+        specs = MySQLLoader._normalize_indexes(
+            [{"name": "idx_ab", "columns": ["a", "b"]}, ["c", "d"], "e", {"columns": "f, g"}],
+            "t"
+        )
+
+        self.assertEqual(specs, [
+            ("idx_ab", ["a", "b"]),
+            ("idx_t_c_d", ["c", "d"]),
+            ("idx_t_e", ["e"]),
+            ("idx_t_f_g", ["f", "g"]),
+        ])
+
+    def test_identifier_quoting(self, mock_create_engine, mock_connect):
+        """식별자 인용 테스트"""
+        self.assertEqual(mysql_loader._q("col"), "`col`")
+        self.assertEqual(mysql_loader._q("we`ird"), "`we``ird`")
+        self.assertEqual(mysql_loader._q_table("db.table"), "`db`.`table`")
 
     def test_get_current_schema(self, mock_create_engine, mock_connect):
         """현재 스키마 조회 테스트"""
@@ -282,8 +508,17 @@ class TestMySQLLoader(unittest.TestCase):
         loader._setup()
         loader.close()
         
-        # dispose가 호출되었는지 확인
-        mock_engine.dispose.assert_called_once()
+        # 공유 엔진은 dispose하지 않고 참조만 해제
+        mock_engine.dispose.assert_not_called()
+        self.assertIsNone(loader.engine)
+
+    def test_engine_shared_between_loaders(self, mock_create_engine, mock_connect):
+        """같은 연결 정보의 Loader 간 엔진 공유 테스트"""
+        loader1 = MySQLLoader(self.config)
+        loader2 = MySQLLoader({**self.config, "table": "other_table"})
+
+        mock_create_engine.assert_called_once()
+        self.assertIs(loader1.engine, loader2.engine)
 
 
 if __name__ == "__main__":
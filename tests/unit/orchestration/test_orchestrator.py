@@ -2,15 +2,17 @@
 오케스트레이터 모듈 단위 테스트
 """
 import unittest
+import concurrent.futures
 from unittest.mock import MagicMock, patch, call
 import tempfile
 import os
+import json
 from pathlib import Path
 import threading
 from datetime import datetime
 
 from dteg.orchestration.orchestrator import Orchestrator
-from dteg.orchestration.scheduler import Scheduler, ScheduleConfig
+from dteg.orchestration.scheduler import Scheduler, ScheduleConfig, ExecutionRecord
 from dteg.orchestration.worker import CeleryTaskQueue
 from dteg.core.config import PipelineConfig
 
@@ -19,7 +21,7 @@ class TestOrchestrator(unittest.TestCase):
     """오케스트레이터 클래스 테스트"""
     
     @patch('dteg.orchestration.orchestrator.Scheduler')
-    @patch('dteg.orchestration.orchestrator.CeleryTaskManager')
+    @patch('dteg.orchestration.worker.CeleryTaskManager')
     def setUp(self, mock_celery_task_manager_class, mock_scheduler_class):
         """테스트 설정"""
         # 스케줄러 모의 객체
@@ -125,6 +127,47 @@ class TestOrchestrator(unittest.TestCase):
         self.assertEqual(result[1]["schedule_id"], "schedule-2")
         self.assertEqual(result[1]["pipeline_id"], "pipeline-2")
     
+    def test_iter_all_pipelines_json(self):
+        """파이프라인 정보 JSON 스트리밍"""
+        mock_schedule = MagicMock()
+        mock_schedule.id = "schedule-1"
+        mock_schedule.cron_expression = "0 0 * * *"
+        mock_schedule.next_run = datetime(2024, 1, 1)
+        mock_schedule.enabled = True
+        mock_schedule.dependencies = []
+        mock_schedule.max_retries = 3
+        mock_schedule.pipeline_config = MagicMock(pipeline_id="pipeline-1")
+        self.mock_scheduler.get_all_schedules.return_value = [mock_schedule, mock_schedule]
+        
+        body = b"".join(self.orchestrator.iter_all_pipelines_json())
+        
+        self.assertEqual(json.loads(body), self.orchestrator.get_all_pipelines())
+        self.assertEqual(json.loads(body)[0]["next_run"], "2024-01-01T00:00:00")
+    
+    @patch('dteg.orchestration.orchestrator.PipelineConfig.from_yaml')
+    def test_get_all_pipelines_caches_yaml(self, mock_from_yaml):
+        """YAML 설정 경로는 수정되지 않으면 한 번만 파싱"""
+        config_path = self.history_dir / "pipeline.yaml"
+        config_path.write_text("pipeline_id: pipeline-yaml\n")
+        
+        mock_config = MagicMock()
+        mock_config.pipeline_id = "pipeline-yaml"
+        mock_from_yaml.return_value = mock_config
+        
+        mock_schedule = MagicMock()
+        mock_schedule.id = "schedule-yaml"
+        mock_schedule.pipeline_config = str(config_path)
+        mock_schedule.next_run = datetime.now()
+        self.mock_scheduler.get_all_schedules.return_value = [mock_schedule]
+        
+        first = self.orchestrator.get_all_pipelines()
+        second = self.orchestrator.get_all_pipelines()
+        
+        # 두 번째 호출은 캐시 사용
+        mock_from_yaml.assert_called_once_with(str(config_path))
+        self.assertEqual(first[0]["pipeline_id"], "pipeline-yaml")
+        self.assertEqual(second[0]["pipeline_id"], "pipeline-yaml")
+    
     def test_remove_pipeline(self):
         """파이프라인 제거"""
         # remove_schedule 호출 결과 모의
@@ -171,6 +214,28 @@ class TestOrchestrator(unittest.TestCase):
         self.assertEqual(result["status"], "submitted")
         self.assertEqual(result["pipeline_id"], schedule_id)
     
+    def test_run_pipelines(self):
+        """여러 파이프라인 일괄 제출"""
+        mock_schedule = MagicMock(spec=ScheduleConfig)
+        mock_schedule.pipeline_config = {"pipeline_id": "pipeline-1"}
+        self.mock_scheduler.get_schedule.return_value = mock_schedule
+        self.mock_task_manager.run_pipelines.return_value = ["task-1", "task-2"]
+        
+        results = self.orchestrator.run_pipelines([("schedule-1", "exec-1"), ("schedule-2", None)])
+        
+        # 한 번의 일괄 제출 호출 확인
+        self.mock_task_manager.run_pipelines.assert_called_once()
+        self.mock_task_manager.run_pipeline.assert_not_called()
+        submitted = self.mock_task_manager.run_pipelines.call_args.args[0]
+        self.assertEqual(len(submitted), 2)
+        self.assertEqual(submitted[0], (mock_schedule.pipeline_config, "exec-1"))
+        
+        # 결과 순서 및 내용 확인
+        self.assertEqual([r["task_id"] for r in results], ["task-1", "task-2"])
+        self.assertEqual(results[0]["execution_id"], "exec-1")
+        self.assertEqual(results[1]["pipeline_id"], "schedule-2")
+        self.assertEqual(results[1]["execution_id"], submitted[1][1])
+    
     def test_run_nonexistent_pipeline(self):
         """존재하지 않는 파이프라인 실행"""
         # 스케줄 조회 결과 모의 (None 반환)
@@ -200,6 +265,52 @@ class TestOrchestrator(unittest.TestCase):
         # 상태 확인
         self.assertEqual(status, result_data)
     
+    def test_get_pipeline_status_by_execution_id(self):
+        """실행 ID로 완료된 실행 상태 조회"""
+        record = ExecutionRecord("schedule-1", "pipeline-1")
+        record.complete(True)
+        
+        # 스케줄러 완료 콜백에서 호출되는 인덱스 갱신
+        self.orchestrator._index_completed_record(record)
+        
+        status = self.orchestrator.get_pipeline_status(execution_id=record.id)
+        
+        self.assertEqual(status["execution_id"], record.id)
+        self.assertEqual(status["status"], "SUCCESS")
+        self.assertEqual(status["pipeline_id"], "pipeline-1")
+        self.assertEqual(status["end_time"], record.end_time.isoformat())
+        
+        # 캐시된 응답은 호출자 변경으로부터 보호됨
+        status["status"] = "FAILED"
+        self.assertEqual(self.orchestrator.get_pipeline_status(execution_id=record.id)["status"], "SUCCESS")
+        
+    @patch('dteg.orchestration.orchestrator.MAX_INDEXED_EXECUTIONS', 2)
+    def test_completed_index_is_bounded(self):
+        """완료 실행 인덱스 크기 제한"""
+        records = [ExecutionRecord("schedule-1", "pipeline-1") for _ in range(3)]
+        for record in records:
+            record.complete(True)
+            self.orchestrator._index_completed_record(record)
+        
+        # 가장 오래된 기록부터 제거
+        self.assertEqual(list(self.orchestrator._payload_by_exec_id), [records[1].id, records[2].id])
+        self.assertEqual(self.orchestrator._latest_payload_by_pipeline["pipeline-1"]["execution_id"], records[2].id)
+    
+    @patch('dteg.orchestration.orchestrator.MAX_INDEXED_EXECUTIONS', 5)
+    def test_completed_index_concurrent_updates(self):
+        """여러 스레드에서 동시에 완료 기록을 등록해도 인덱스 크기 제한 유지"""
+        def index_records():
+            for _ in range(200):
+                record = ExecutionRecord("schedule-1", "pipeline-1")
+                record.complete(True)
+                self.orchestrator._index_completed_record(record)
+        
+        with concurrent.futures.ThreadPoolExecutor(max_workers=4) as pool:
+            for future in [pool.submit(index_records) for _ in range(4)]:
+                future.result()
+        
+        self.assertEqual(len(self.orchestrator._payload_by_exec_id), 5)
+    
     def test_cancel_pipeline(self):
         """파이프라인 실행 취소"""
         # 태스크 취소 결과 모의
@@ -214,6 +325,30 @@ class TestOrchestrator(unittest.TestCase):
         # 결과 확인
         self.assertTrue(result)
     
+    def test_cancel_execution_by_execution_id(self):
+        """실행 ID로 제출된 Celery 작업 취소"""
+        self.mock_scheduler.get_schedule.return_value = MagicMock(spec=ScheduleConfig)
+        self.mock_task_manager.run_pipeline.return_value = "task-123"
+        self.mock_task_manager.revoke_task.return_value = True
+        
+        self.orchestrator.run_pipeline("schedule-123", execution_id="exec-123")
+        result = self.orchestrator.cancel_execution(execution_id="exec-123")
+        
+        self.mock_task_manager.revoke_task.assert_called_once_with("task-123", terminate=True)
+        self.assertTrue(result)
+        
+        # 알 수 없는 실행 ID는 실패
+        self.assertFalse(self.orchestrator.cancel_execution(execution_id="unknown"))
+    
+    def test_cancel_executions(self):
+        """여러 실행 일괄 취소"""
+        self.mock_task_manager.revoke_tasks.return_value = True
+        
+        result = self.orchestrator.cancel_executions(["task-1", "task-2"])
+        
+        self.mock_task_manager.revoke_tasks.assert_called_once_with(["task-1", "task-2"], terminate=True)
+        self.assertTrue(result)
+    
     @patch('dteg.orchestration.orchestrator.threading.Thread')
     def test_start_scheduler(self, mock_thread_class):
         """스케줄러 시작"""
@@ -263,6 +398,11 @@ class TestOrchestrator(unittest.TestCase):
         # 상태 변수 확인
         self.assertFalse(self.orchestrator.scheduler_running)
         
+        # 대기 중인 스케줄러 스레드를 깨우는 중지 신호 확인
+        self.assertTrue(self.orchestrator._stop_event.is_set())
+        self.mock_scheduler.wake.assert_called_once()
+        self.mock_scheduler._flush_dirty.assert_called_once()
+        
         # 스레드 종료 대기 메서드 호출 확인
         self.orchestrator.scheduler_thread.join.assert_called_once()
     
@@ -278,7 +418,7 @@ class TestOrchestrator(unittest.TestCase):
         # 결과 확인 (실패)
         self.assertFalse(result)
     
-    @patch('dteg.orchestration.orchestrator.time.sleep')
+    @patch('time.sleep')
     def test_scheduler_loop(self, mock_sleep):
         """스케줄러 루프"""
         # 스케줄러 상태 설정
@@ -368,6 +508,17 @@ class TestOrchestrator(unittest.TestCase):
         # 결과 확인
         self.assertTrue(result)
     
+    def test_add_pipeline_dependency_cycle(self):
+        """순환 의존성이 생기는 파이프라인 의존성 추가는 실패"""
+        mock_schedule = MagicMock(spec=ScheduleConfig)
+        mock_schedule.dependencies = []
+        self.mock_scheduler.get_schedule.return_value = mock_schedule
+        self.mock_scheduler.update_schedule.side_effect = ValueError("순환 의존성이 발생합니다")
+        
+        result = self.orchestrator.add_pipeline_dependency("schedule-123", "schedule-456")
+        
+        self.assertFalse(result)
+    
     def test_add_duplicate_pipeline_dependency(self):
         """중복된 파이프라인 의존성 추가"""
         # 테스트 데이터
@@ -456,7 +607,7 @@ class TestOrchestrator(unittest.TestCase):
         self.mock_scheduler.get_schedule.assert_called_once_with(schedule_id)
         
         # 결과 확인
-        self.assertEqual(result, dependencies)
+        self.assertEqual(result, tuple(dependencies))
     
     def test_get_pipeline_dependencies_nonexistent_pipeline(self):
         """존재하지 않는 파이프라인의 의존성 조회"""
@@ -62,7 +62,7 @@ pipeline:
         )
         
         # 스케줄 파일이 생성되었는지 확인
-        schedule_file = self.test_schedule_dir / "schedules.json"
+        schedule_file = self.test_schedule_dir / f"{pipeline_id}.json"
         self.assertTrue(schedule_file.exists())
         
         # 새 오케스트레이터 인스턴스 생성하여 로드 테스트
@@ -5,13 +5,20 @@ import unittest
 from unittest.mock import MagicMock, patch, Mock
 import tempfile
 import os
+import json
 from pathlib import Path
 from datetime import datetime, timedelta
 import time
+import threading
 from freezegun import freeze_time
 import shutil
 
-from dteg.orchestration.scheduler import Scheduler, ScheduleConfig, ExecutionRecord
+import croniter
+
+from dteg.orchestration.scheduler import (
+    Scheduler, ScheduleConfig, ExecutionRecord, next_cron_run, _classify_cron, DEFAULT_MAX_WORKERS,
+    SCHEDULE_FLUSH_INTERVAL, _load_pipeline_config_dict
+)
 from dteg.core.config import PipelineConfig
 
 
@@ -72,6 +79,113 @@ class TestScheduleConfig(unittest.TestCase):
                 expected_updated = datetime(2023, 1, 1, 12, 0, 0)
                 self.assertEqual(updated_next_run, expected_updated)
 
+    
+    def test_schedule_retry(self):
+        """재시도 실행 시간은 retry_delay 후이며 다음 정기 실행 시간을 넘지 않음"""
+        mock_config = MagicMock(spec=PipelineConfig)
+        
+        with freeze_time("2023-01-01 10:00:00"):
+            schedule = ScheduleConfig(pipeline_config=mock_config, cron_expression="0 * * * *", retry_delay=300)
+            schedule.schedule_retry()
+            self.assertEqual(schedule.next_run, datetime(2023, 1, 1, 10, 5, 0))
+            
+            schedule.retry_delay = 7200
+            schedule.schedule_retry()
+            self.assertEqual(schedule.next_run, datetime(2023, 1, 1, 11, 0, 0))
+    
+    @patch('dteg.orchestration.scheduler.PipelineConfig.from_yaml')
+    def test_load_pipeline_config_dict_is_cached(self, mock_from_yaml):
+        """변수가 없는 설정 파일은 사전 변환 결과를 재사용"""
+        mock_from_yaml.return_value.dict.return_value = {"name": "test"}
+        
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml") as config_file:
+            config_file.write("name: test\n")
+            config_file.flush()
+            
+            first = _load_pipeline_config_dict(config_file.name)
+            second = _load_pipeline_config_dict(config_file.name)
+        
+        self.assertIs(first, second)
+        mock_from_yaml.assert_called_once()
+        mock_from_yaml.return_value.dict.assert_called_once()
+    
+    def test_next_run_ts_follows_next_run(self):
+        """다음 실행 시간 변경 시 타임스탬프도 함께 갱신"""
+        mock_config = MagicMock(spec=PipelineConfig)
+        schedule = ScheduleConfig(pipeline_config=mock_config, cron_expression="0 * * * *")
+        self.assertEqual(schedule.next_run_ts, schedule.next_run.timestamp())
+        
+        next_run = datetime(2023, 1, 1, 12, 0, 0)
+        schedule.next_run = next_run
+        self.assertEqual(schedule.next_run_ts, next_run.timestamp())
+        
+        schedule.next_run = None
+        self.assertIsNone(schedule.next_run_ts)
+    
+    @patch('dteg.orchestration.scheduler.PipelineConfig.from_yaml')
+    def test_resolved_loads_config_file_once(self, mock_from_yaml):
+        """설정 파일은 수정되지 않으면 한 번만 로드하고, 수정되거나 경로가 바뀌면 다시 확인"""
+        loaded_config = MagicMock(spec=PipelineConfig)
+        mock_from_yaml.return_value = loaded_config
+        
+        with tempfile.NamedTemporaryFile(suffix=".yaml") as config_file:
+            schedule = ScheduleConfig(pipeline_config=config_file.name, cron_expression="0 * * * *")
+            
+            self.assertEqual(schedule.resolved(), (Path(config_file.name), loaded_config))
+            self.assertEqual(schedule.resolved(), (Path(config_file.name), loaded_config))
+            mock_from_yaml.assert_called_once()
+            
+            # 파일이 수정되면 다시 로드
+            mtime = os.stat(config_file.name).st_mtime + 10
+            os.utime(config_file.name, (mtime, mtime))
+            schedule.resolved()
+            self.assertEqual(mock_from_yaml.call_count, 2)
+            
+            # 존재하지 않는 경로(파이프라인 ID)로 변경
+            schedule.pipeline_config = "pipeline-id"
+            self.assertEqual(schedule.resolved(), (None, None))
+            self.assertEqual(mock_from_yaml.call_count, 2)
+    
+    @patch('dteg.orchestration.scheduler.PipelineConfig.from_yaml')
+    def test_resolved_reloads_config_with_variables(self, mock_from_yaml):
+        """환경 변수나 날짜 변수를 사용하는 설정 파일은 호출마다 다시 로드"""
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml") as config_file:
+            config_file.write("name: ${PIPELINE_NAME}\noutput: data_{{ datetime.date }}.csv\n")
+            config_file.flush()
+            schedule = ScheduleConfig(pipeline_config=config_file.name, cron_expression="0 * * * *")
+            
+            schedule.resolved()
+            schedule.resolved()
+            self.assertEqual(mock_from_yaml.call_count, 2)
+
+
+
+class TestNextCronRun(unittest.TestCase):
+    """다음 실행 시간 계산 함수 테스트"""
+    
+    def test_simple_expressions_match_croniter(self):
+        """단순 표현식 계산 결과가 croniter와 일치"""
+        expressions = ["* * * * *", "*/5 * * * *", "*/7 * * * *", "0 * * * *", "45 * * * *", "30 8 * * *", "0 0 * * *"]
+        base_times = [
+            datetime(2023, 1, 1, 10, 0, 0),
+            datetime(2023, 1, 1, 10, 57, 3),
+            datetime(2023, 1, 1, 8, 30, 0, 1),
+            datetime(2023, 12, 31, 23, 59, 59),
+        ]
+        
+        for expression in expressions:
+            self.assertIsNotNone(_classify_cron(expression))
+            for base_time in base_times:
+                expected = croniter.croniter(expression, base_time).get_next(datetime)
+                self.assertEqual(next_cron_run(expression, base_time), expected, (expression, base_time))
+    
+    def test_complex_expression_uses_croniter(self):
+        """단순 형태가 아닌 표현식은 croniter로 계산"""
+        expression = "0 0 1 * *"
+        base_time = datetime(2023, 1, 15, 10, 0, 0)
+        
+        self.assertIsNone(_classify_cron(expression))
+        self.assertEqual(next_cron_run(expression, base_time), datetime(2023, 2, 1, 0, 0, 0))
 
 class TestExecutionRecord(unittest.TestCase):
     """실행 기록 클래스 테스트"""
@@ -130,6 +244,30 @@ class TestExecutionRecord(unittest.TestCase):
         self.assertIsNone(record_dict["error_message"])
         self.assertIsNotNone(record_dict["start_time"])
         self.assertIsNone(record_dict["end_time"])
+    
+    def test_summary_round_trip(self):
+        """요약 사전은 시각을 UNIX 타임스탬프로 저장하고 두 형식 모두 복원"""
+        record = ExecutionRecord("schedule-123", "pipeline-123")
+        record.complete(success=True)
+        
+        summary = record.to_summary()
+        self.assertIsInstance(summary["start_time"], float)
+        self.assertNotIn("logs", summary)
+        
+        for data in (summary, record.to_dict()):
+            restored = ExecutionRecord.from_dict(data)
+            self.assertEqual(restored.start_time, record.start_time)
+            self.assertEqual(restored.end_time, record.end_time)
+            self.assertEqual(restored.status, "SUCCESS")
+    
+    @patch('dteg.orchestration.scheduler.MAX_LOG_LINES', 2)
+    def test_logs_are_bounded(self):
+        """로그는 최근 줄만 유지하고 사전 변환 시 목록으로 반환"""
+        record = ExecutionRecord("schedule-123", "pipeline-123")
+        for message in ("first", "second", "third"):
+            record.logs.append(message)
+        
+        self.assertEqual(record.to_dict()["logs"], ["second", "third"])
 
 
 class TestScheduler(unittest.TestCase):
@@ -198,6 +336,92 @@ class TestScheduler(unittest.TestCase):
         
         self.assertFalse(result)
     
+    def test_bulk_apply(self):
+        """스케줄 일괄 추가/제거"""
+        # 기존 스케줄 추가
+        schedule_id = self.scheduler.add_schedule(self.schedule)
+        
+        new_schedule = ScheduleConfig(
+            pipeline_config=self.mock_config,
+            cron_expression="0 0 * * *"
+        )
+        
+        with patch.object(self.scheduler, '_write_schedule_data') as mock_write:
+            self.scheduler.bulk_apply([new_schedule], [schedule_id])
+            
+            # 추가된 스케줄 파일만 저장
+            mock_write.assert_called_once()
+            self.assertEqual(mock_write.call_args[0][0], new_schedule.id)
+        
+        self.assertEqual(list(self.scheduler.schedules), [new_schedule.id])
+    
+    def test_maybe_flush_defers_writes_within_interval(self):
+        """저장 간격 안에서는 변경된 스케줄 저장을 미루는지 테스트"""
+        self.scheduler._dirty.add("test_schedule")
+        
+        with patch.object(self.scheduler._pool, 'submit') as mock_submit:
+            self.scheduler._last_flush = time.monotonic()
+            self.scheduler._maybe_flush()
+            mock_submit.assert_not_called()
+            
+            # 저장은 작업 풀에서 실행하며, 진행 중인 저장이 있으면 다시 제출하지 않음
+            mock_submit.return_value.done.return_value = False
+            self.scheduler._last_flush = time.monotonic() - SCHEDULE_FLUSH_INTERVAL
+            self.scheduler._maybe_flush()
+            self.scheduler._maybe_flush()
+            mock_submit.assert_called_once_with(self.scheduler._flush_dirty)
+    
+    def test_write_schedule_file_skips_unchanged_content(self):
+        """내용이 바뀌지 않은 스케줄 파일은 다시 쓰지 않음"""
+        schedule = ScheduleConfig(pipeline_config="test_pipeline", cron_expression="0 8 * * *")
+        
+        with patch('dteg.orchestration.scheduler.atomic_write') as mock_atomic_write:
+            self.scheduler._write_schedule_file(schedule)
+            self.scheduler._write_schedule_file(schedule)
+            self.assertEqual(mock_atomic_write.call_count, 1)
+            
+            schedule.enabled = False
+            self.scheduler._write_schedule_file(schedule)
+            self.assertEqual(mock_atomic_write.call_count, 2)
+    
+    def test_flush_dirty_retries_failed_writes(self):
+        """저장에 실패한 스케줄은 다음 저장 시 다시 시도"""
+        self.scheduler.add_schedule(self.schedule)
+        
+        self.schedule.enabled = False
+        with patch.object(self.scheduler, '_write_schedule_data', side_effect=OSError("disk full")):
+            self.scheduler._dirty.add(self.schedule.id)
+            self.scheduler._flush_dirty()
+        self.assertIn(self.schedule.id, self.scheduler._dirty)
+        
+        with patch.object(self.scheduler, '_write_schedule_data') as mock_write:
+            self.scheduler._flush_dirty()
+        mock_write.assert_called_once()
+        self.assertEqual(mock_write.call_args[0][0], self.schedule.id)
+        self.assertFalse(self.scheduler._dirty)
+    
+    def test_flush_dirty_writes_without_holding_lock(self):
+        """스케줄 파일을 쓰는 동안 스케줄러 잠금을 보유하지 않음"""
+        self.scheduler.add_schedule(self.schedule)
+        self.schedule.enabled = False
+        self.scheduler._dirty.add(self.schedule.id)
+        lock_acquired = []
+        
+        def write_schedule_data(schedule_id, data):
+            # 다른 스레드(스케줄러 스레드)가 잠금을 바로 얻을 수 있는지 확인
+            def acquire():
+                if self.scheduler._lock.acquire(timeout=1):
+                    lock_acquired.append(True)
+                    self.scheduler._lock.release()
+            thread = threading.Thread(target=acquire)
+            thread.start()
+            thread.join()
+        
+        with patch.object(self.scheduler, '_write_schedule_data', side_effect=write_schedule_data):
+            self.scheduler._flush_dirty()
+        
+        self.assertEqual(lock_acquired, [True])
+    
     def test_get_schedule(self):
         """스케줄 조회"""
         # 스케줄 추가
@@ -297,6 +521,343 @@ class TestScheduler(unittest.TestCase):
         # 파이프라인 실행 함수가 호출되지 않음
         mock_run_pipeline.assert_not_called()
     
+    @patch('dteg.orchestration.scheduler.Scheduler._run_pipeline', return_value=False)
+    def test_run_once_skips_future_schedule_until_updated(self, mock_run_pipeline):
+        """실행 시간이 되지 않은 스케줄은 건너뛰고, 갱신된 실행 시간은 반영"""
+        # 미래 시간으로 다음 실행 시간 설정
+        self.schedule.next_run = datetime.now() + timedelta(hours=1)
+        self.scheduler.add_schedule(self.schedule)
+        
+        self.scheduler.run_once()
+        mock_run_pipeline.assert_not_called()
+        
+        # 다음 실행 시간을 과거로 갱신하면 실행됨
+        self.scheduler.update_schedule(self.schedule.id, next_run=datetime.now() - timedelta(minutes=1))
+        self.scheduler.run_once()
+        mock_run_pipeline.assert_called_once_with(self.schedule)
+        
+        # 실행 후 다음 실행 시간으로 재등록되어 바로 다시 실행되지 않음
+        self.scheduler.run_once()
+        mock_run_pipeline.assert_called_once_with(self.schedule)
+    
+    def test_run_once_runs_dependent_schedule_after_dependency(self):
+        """같은 시각에 실행되는 스케줄은 의존 파이프라인이 성공한 뒤 실행"""
+        upstream_config = Mock(spec=PipelineConfig)
+        upstream_config.pipeline_id = "upstream"
+        downstream_config = Mock(spec=PipelineConfig)
+        downstream_config.pipeline_id = "downstream"
+        other_config = Mock(spec=PipelineConfig)
+        other_config.pipeline_id = "other"
+        
+        upstream = ScheduleConfig(pipeline_config=upstream_config, cron_expression="0 8 * * *")
+        downstream = ScheduleConfig(pipeline_config=downstream_config, cron_expression="0 8 * * *",
+                                    dependencies=["upstream"])
+        other = ScheduleConfig(pipeline_config=other_config, cron_expression="0 8 * * *")
+        for schedule in (downstream, upstream, other):
+            schedule.next_run = datetime.now() - timedelta(minutes=1)
+            self.scheduler.add_schedule(schedule)
+        
+        executed = []
+        
+        def fake_run_pipeline(schedule):
+            executed.append(schedule.pipeline_config.pipeline_id)
+            record = ExecutionRecord(schedule.id, schedule.pipeline_config.pipeline_id)
+            record.complete(success=True)
+            self.scheduler._record_completion(record)
+            return False
+        
+        with patch.object(self.scheduler, '_run_pipeline', side_effect=fake_run_pipeline):
+            self.scheduler.run_once()
+        
+        self.assertCountEqual(executed, ["upstream", "downstream", "other"])
+        self.assertEqual(executed[-1], "downstream")
+    
+    def test_wait_for_next_run_uses_nearest_schedule(self):
+        """가장 가까운 다음 실행 시간까지만 대기하고 스케줄 변경 시 깨어남"""
+        self.assertEqual(self.scheduler.seconds_until_next_run(60), 60)
+        
+        self.schedule.next_run = datetime.now() + timedelta(seconds=5)
+        self.scheduler.add_schedule(self.schedule)
+        self.assertLessEqual(self.scheduler.seconds_until_next_run(60), 5)
+        
+        self.schedule.next_run = datetime.now() - timedelta(minutes=1)
+        self.scheduler.update_schedule(self.schedule.id, next_run=self.schedule.next_run)
+        self.assertEqual(self.scheduler.seconds_until_next_run(60), 0.1)
+        
+        # 스케줄 변경으로 설정된 이벤트 때문에 즉시 반환
+        self.assertTrue(self.scheduler.wait_for_next_run(60))
+    
+    def test_run_once_commits_db_writes_once(self):
+        """한 번의 실행 주기 동안의 DB 쓰기는 하나의 세션에서 한 번만 커밋"""
+        mock_session = MagicMock()
+        
+        for pipeline_id in ("first", "second"):
+            config = Mock(spec=PipelineConfig)
+            config.pipeline_id = pipeline_id
+            schedule = ScheduleConfig(pipeline_config=config, cron_expression="0 8 * * *")
+            schedule.next_run = datetime.now() - timedelta(minutes=1)
+            self.scheduler.add_schedule(schedule)
+        
+        def fake_run_pipeline(schedule):
+            with self.scheduler._web_db_session() as session:
+                session.add(schedule.id)
+            return False
+        
+        with patch.object(self.scheduler, '_open_web_db', return_value=mock_session) as mock_open_web_db, \
+                patch.object(self.scheduler, '_run_pipeline', side_effect=fake_run_pipeline):
+            self.scheduler.run_once()
+        
+        mock_open_web_db.assert_called_once()
+        self.assertEqual(mock_session.add.call_count, 2)
+        mock_session.commit.assert_called_once()
+        mock_session.close.assert_called_once()
+        self.assertIsNone(self.scheduler._db_batch)
+    
+    def test_commit_db_updates_next_runs_once(self):
+        """실행 주기 동안의 스케줄 다음 실행 시간은 커밋 직전에 한 번에 갱신"""
+        mock_session = MagicMock()
+        schedules = [ScheduleConfig(pipeline_config=self.mock_config, cron_expression="0 8 * * *")
+                     for _ in range(2)]
+        
+        with patch.object(self.scheduler, '_open_web_db', return_value=mock_session):
+            self.scheduler._begin_db_batch()
+        
+        with patch.object(self.scheduler, '_update_db_next_runs') as mock_update:
+            for schedule in schedules:
+                self.scheduler._save_schedule(schedule)
+            mock_update.assert_not_called()
+            
+            self.scheduler._commit_db()
+        
+        mock_update.assert_called_once_with(
+            mock_session, {schedule.id: schedule.next_run for schedule in schedules})
+        mock_session.commit.assert_called_once()
+    
+    def test_batch_write_failure_rolls_back_only_that_write(self):
+        """배치 세션에서 실패한 쓰기만 롤백되고 같은 실행 주기의 다른 쓰기는 커밋"""
+        from sqlalchemy import create_engine, text
+        from sqlalchemy.orm import sessionmaker
+        from sqlalchemy.pool import StaticPool
+        from dteg.web.models import database_models
+        
+        engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+        database_models.Base.metadata.create_all(engine)
+        session_local = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+        records = [ExecutionRecord("schedule-1", "test-pipeline") for _ in range(2)]
+        for record in records:
+            record.complete(success=True)
+        
+        with patch('dteg.orchestration.scheduler._web_db_modules', return_value=(session_local, database_models)):
+            self.scheduler._begin_db_batch()
+            self.assertTrue(self.scheduler._save_execution_record(records[0]))
+            # 중복 기본 키로 flush가 실패하는 쓰기
+            with self.assertRaises(Exception):
+                with self.scheduler._web_db_session() as session:
+                    session.add(database_models.Execution(id=records[0].id, pipeline_id="test-pipeline",
+                                                          status="FAILED"))
+                    session.flush()
+            self.assertTrue(self.scheduler._save_execution_record(records[1]))
+            self.scheduler._commit_db()
+        
+        with engine.connect() as conn:
+            saved_ids = {row[0] for row in conn.execute(text("SELECT id FROM executions"))}
+        self.assertEqual(saved_ids, {record.id for record in records})
+        engine.dispose()
+    
+    @patch('dteg.orchestration.scheduler.Pipeline')
+    def test_run_pipeline_keeps_logs_until_batch_commit(self, mock_pipeline_class):
+        """배치 세션에 기록한 실행 로그는 커밋 전까지 유지하고, 커밋이 실패하면 로그 파일로 저장"""
+        mock_session = MagicMock()
+        mock_session.commit.side_effect = Exception("commit failed")
+        self.scheduler.add_schedule(self.schedule)
+        
+        with patch('dteg.orchestration.scheduler._web_db_modules', return_value=(MagicMock(), MagicMock())), \
+                patch.object(self.scheduler, '_open_web_db', return_value=mock_session):
+            self.scheduler._begin_db_batch()
+            self.scheduler._run_pipeline(self.schedule)
+            
+            record = self.scheduler.completed_executions[-1]
+            self.assertTrue(record.logs)
+            self.assertFalse((self.scheduler.history_dir / f"{record.id}.log").exists())
+            
+            self.scheduler._commit_db()
+        
+        self.assertEqual(len(record.logs), 0)
+        self.assertTrue((self.scheduler.history_dir / f"{record.id}.log").exists())
+    
+    def test_get_pipeline_from_db_reuses_unchanged_config(self):
+        """DB 파이프라인이 변경되지 않았으면 설정을 다시 읽지 않고 캐시 사용"""
+        mock_session = MagicMock()
+        mock_first = mock_session.query.return_value.filter.return_value.first
+        version = (datetime(2024, 1, 1), None)
+        mock_first.side_effect = [version, Mock(id="db_pipeline", config={"pipeline": {}}), version]
+        
+        mock_session_local = MagicMock(return_value=mock_session)
+        with patch('dteg.orchestration.scheduler._web_db_modules',
+                   return_value=(mock_session_local, MagicMock())):
+            first = self.scheduler._get_pipeline_from_db("db_pipeline")
+            second = self.scheduler._get_pipeline_from_db("db_pipeline")
+        
+        self.assertIs(first, second)
+        self.assertEqual(first.config, {"pipeline": {}})
+        self.assertEqual(mock_first.call_count, 3)
+        self.assertEqual(mock_session_local.call_count, 2)
+    
+    def test_get_pipeline_from_db_falls_back_to_file_without_web_db(self):
+        """웹 UI 데이터베이스 모듈이 없으면 파일 시스템에서 파이프라인을 조회하는지 테스트"""
+        with patch('dteg.orchestration.scheduler._web_db_modules', return_value=None), \
+             patch.object(self.scheduler, '_get_pipeline_from_file', return_value="file_pipeline") as mock_file:
+            result = self.scheduler._get_pipeline_from_db("db_pipeline")
+        
+        self.assertEqual(result, "file_pipeline")
+        mock_file.assert_called_once_with("db_pipeline")
+    
+    def test_history_is_loaded_lazily(self):
+        """실행 이력은 생성 시가 아니라 처음 필요할 때 한 번만 로드"""
+        with patch.object(Scheduler, '_load_history') as mock_load_history:
+            scheduler = Scheduler(history_dir=self.scheduler.history_dir, schedule_dir=self.scheduler.schedule_dir)
+            mock_load_history.assert_not_called()
+            
+            scheduler.completed_executions
+            scheduler.completed_executions
+        
+        mock_load_history.assert_called_once()
+    
+    def test_max_workers(self):
+        """동시 실행 파이프라인 수 설정 (미지정 시 기본값 사용)"""
+        scheduler = Scheduler(history_dir=self.scheduler.history_dir, schedule_dir=self.scheduler.schedule_dir,
+                              max_workers=2)
+        self.assertEqual(scheduler._pool._max_workers, 2)
+        self.assertEqual(self.scheduler._pool._max_workers, DEFAULT_MAX_WORKERS)
+    
+    def test_max_history(self):
+        """메모리에 유지할 완료 실행 기록 수 설정 테스트"""
+        scheduler = Scheduler(history_dir=self.scheduler.history_dir, schedule_dir=self.scheduler.schedule_dir,
+                              max_history=2)
+        for i in range(3):
+            record = ExecutionRecord("test_schedule", f"pipeline_{i}")
+            record.complete(success=True)
+            scheduler._record_completion(record)
+        
+        self.assertEqual([record.pipeline_id for record in scheduler.completed_executions],
+                         ["pipeline_1", "pipeline_2"])
+        self.assertIn("pipeline_0", scheduler._last_success)
+    
+    def test_add_schedule_rejects_dependency_cycle(self):
+        """순환 의존성이 생기는 스케줄은 추가하지 않음"""
+        schedules = {}
+        for pipeline_id, dependencies in (("first", ["second"]), ("second", ["third"]), ("third", ["first"])):
+            config = Mock(spec=PipelineConfig)
+            config.pipeline_id = pipeline_id
+            schedules[pipeline_id] = ScheduleConfig(pipeline_config=config, cron_expression="0 8 * * *",
+                                                    dependencies=dependencies)
+        
+        self.scheduler.add_schedule(schedules["first"])
+        self.scheduler.add_schedule(schedules["second"])
+        
+        with self.assertRaisesRegex(ValueError, "third -> first -> second -> third"):
+            self.scheduler.add_schedule(schedules["third"])
+        self.assertNotIn(schedules["third"].id, self.scheduler.schedules)
+    
+    def test_update_schedule_rejects_dependency_cycle(self):
+        """순환 의존성이 생기는 의존성 변경은 반영하지 않음"""
+        self.scheduler.add_schedule(self.schedule)
+        
+        with self.assertRaises(ValueError):
+            self.scheduler.update_schedule(self.schedule.id, dependencies=["test-pipeline"])
+        self.assertEqual(self.schedule.dependencies, [])
+        
+        self.assertTrue(self.scheduler.update_schedule(self.schedule.id, dependencies=["other_pipeline"]))
+    
+    @patch('dteg.orchestration.scheduler.PipelineConfig.from_yaml')
+    def test_add_schedule_rejects_dependency_cycle_between_config_files(self, mock_from_yaml):
+        """설정 파일 경로로 등록한 스케줄도 파일의 pipeline_id 기준으로 순환 의존성 검사"""
+        config_paths = self._write_config_files("pa", "pb")
+        mock_from_yaml.side_effect = self._config_from_path
+        
+        first = ScheduleConfig(pipeline_config=config_paths["pa"], cron_expression="0 8 * * *",
+                               dependencies=["pb"])
+        second = ScheduleConfig(pipeline_config=config_paths["pb"], cron_expression="0 8 * * *",
+                                dependencies=["pa"])
+        self.scheduler.add_schedule(first)
+        
+        with self.assertRaisesRegex(ValueError, "pb -> pa -> pb"):
+            self.scheduler.add_schedule(second)
+        self.assertNotIn(second.id, self.scheduler.schedules)
+    
+    def _write_config_files(self, *pipeline_ids):
+        """파이프라인 ID별 설정 파일을 만들고 파이프라인 ID -> 경로 반환"""
+        config_dir = Path(self.temp_dir) / "configs"
+        config_dir.mkdir(exist_ok=True)
+        config_paths = {}
+        for pipeline_id in pipeline_ids:
+            config_path = config_dir / f"{pipeline_id}.yaml"
+            config_path.write_text(f"pipeline_id: {pipeline_id}\n")
+            config_paths[pipeline_id] = str(config_path)
+        return config_paths
+    
+    @staticmethod
+    def _config_from_path(path):
+        """설정 파일 이름을 pipeline_id로 갖는 설정 객체 (PipelineConfig.from_yaml 대체)"""
+        config = Mock(spec=PipelineConfig)
+        config.pipeline_id = Path(path).stem
+        return config
+    
+    def test_pop_due_schedules_prefers_critical_path(self):
+        """같은 시각에 실행되는 스케줄은 의존 체인이 긴 스케줄부터 꺼냄"""
+        next_run = datetime.now() - timedelta(minutes=1)
+        schedules = {}
+        for pipeline_id, dependencies in (("leaf", []), ("root", []), ("middle", ["root"]), ("last", ["middle"])):
+            config = Mock(spec=PipelineConfig)
+            config.pipeline_id = pipeline_id
+            schedule = ScheduleConfig(pipeline_config=config, cron_expression="0 8 * * *",
+                                      dependencies=dependencies)
+            schedule.next_run = next_run
+            schedules[pipeline_id] = schedule
+        
+        self.scheduler.bulk_apply(list(schedules.values()), [])
+        
+        due = self.scheduler._pop_due_schedules(time.time())
+        self.assertEqual(due[0], schedules["root"])
+        self.assertEqual(due[1], schedules["middle"])
+        self.assertEqual(self.scheduler._bottom_level[schedules["root"].id], 3)
+        self.assertEqual(self.scheduler._bottom_level[schedules["leaf"].id], 1)
+    
+    @patch('dteg.orchestration.scheduler.PipelineConfig.from_yaml')
+    def test_build_dag_links_config_files_by_pipeline_id(self, mock_from_yaml):
+        """설정 파일 경로로 등록한 스케줄도 파일의 pipeline_id로 의존 관계를 연결"""
+        config_paths = self._write_config_files("root", "middle", "last")
+        mock_from_yaml.side_effect = self._config_from_path
+        
+        schedules = {}
+        for pipeline_id, dependencies in (("root", []), ("middle", ["root"]), ("last", ["middle"])):
+            schedules[pipeline_id] = ScheduleConfig(pipeline_config=config_paths[pipeline_id],
+                                                    cron_expression="0 8 * * *", dependencies=dependencies)
+        
+        self.scheduler.bulk_apply(list(schedules.values()), [])
+        self.scheduler._build_dag()
+        
+        self.assertEqual(self.scheduler._dag[schedules["root"].id], [schedules["middle"].id])
+        self.assertEqual(self.scheduler._bottom_level[schedules["root"].id], 3)
+        self.assertEqual(self.scheduler._bottom_level[schedules["last"].id], 1)
+    
+    @patch('dteg.orchestration.scheduler.PipelineConfig.from_yaml')
+    def test_run_due_waves_serializes_same_config_file_pipeline(self, mock_from_yaml):
+        """설정 파일 경로와 설정 객체가 같은 pipeline_id이면 같은 단계에서 함께 실행하지 않음"""
+        config_paths = self._write_config_files("test-pipeline")
+        mock_from_yaml.side_effect = self._config_from_path
+        file_schedule = ScheduleConfig(pipeline_config=config_paths["test-pipeline"], cron_expression="0 8 * * *")
+        
+        with patch.object(self.scheduler, '_run_due_schedule') as mock_run, \
+                patch.object(self.scheduler._pool, 'submit') as mock_submit:
+            executed_count, waiting = self.scheduler._run_due_waves([file_schedule, self.schedule])
+        
+        self.assertEqual(executed_count, 2)
+        self.assertEqual(waiting, [])
+        # 단계마다 한 스케줄씩 직접 실행 (풀에 동시 제출하지 않음)
+        mock_submit.assert_not_called()
+        self.assertEqual([args[0] for args, _ in mock_run.call_args_list], [file_schedule, self.schedule])
+    
     @patch('dteg.orchestration.scheduler.Pipeline')
     def test_run_pipeline(self, mock_pipeline_class):
         """파이프라인 실행"""
@@ -323,6 +884,61 @@ class TestScheduler(unittest.TestCase):
         self.assertEqual(len(self.scheduler.completed_executions), 1)
         record = self.scheduler.completed_executions[0]
         self.assertEqual(record.status, "SUCCESS")
+        
+        # 실행 결과와 다음 실행 시간 갱신 확인
+        self.assertEqual(self.schedule.last_run_status, "SUCCESS")
+        self.assertGreater(self.schedule.next_run, datetime.now())
+    
+    @patch('dteg.orchestration.scheduler.Pipeline')
+    def test_run_pipeline_retries_failure(self, mock_pipeline_class):
+        """실패한 파이프라인은 max_retries까지 retry_delay 후 다시 실행하도록 예약"""
+        mock_pipeline_class.return_value.run.side_effect = Exception("Pipeline error")
+        self.schedule.max_retries = 1
+        self.scheduler.add_schedule(self.schedule)
+        
+        with freeze_time("2023-01-01 10:00:00"):
+            self.scheduler._run_pipeline(self.schedule)
+            self.assertEqual(self.schedule.next_run, datetime(2023, 1, 1, 10, 0, 0) + timedelta(seconds=300))
+            
+            self.scheduler._run_pipeline(self.schedule)
+            self.assertEqual(self.schedule.next_run, datetime(2023, 1, 2, 8, 0, 0))
+        
+        self.assertEqual([record.retry_count for record in self.scheduler.completed_executions], [0, 1])
+        self.assertEqual(self.schedule.last_run_status, "FAILED")
+        self.assertNotIn(self.schedule.id, self.scheduler._retry_counts)
+    
+    @patch('dteg.orchestration.scheduler.Pipeline')
+    def test_run_once_keeps_immediate_retry(self, mock_pipeline_class):
+        """재시도 지연이 0이어도 run_once가 재시도 시각을 다음 정기 실행 시간으로 덮어쓰지 않음"""
+        mock_pipeline_class.return_value.run.side_effect = Exception("Pipeline error")
+        self.schedule.max_retries = 2
+        self.schedule.retry_delay = 0
+        self.schedule.next_run = datetime.now() - timedelta(minutes=1)
+        self.scheduler.add_schedule(self.schedule)
+        
+        self.scheduler.run_once()
+        self.assertLessEqual(self.schedule.next_run, datetime.now())
+        self.assertEqual(self.scheduler._retry_counts[self.schedule.id], 1)
+        
+        self.scheduler.run_once()
+        self.assertEqual([record.retry_count for record in self.scheduler.completed_executions], [0, 1])
+        self.assertEqual(self.scheduler._retry_counts[self.schedule.id], 2)
+    
+    @patch('dteg.orchestration.scheduler.Pipeline')
+    def test_run_pipeline_writes_logs_without_web_db(self, mock_pipeline_class):
+        """웹 UI 데이터베이스가 없으면 실행 로그를 파일로 저장하고 메모리에서 해제"""
+        self.scheduler.add_schedule(self.schedule)
+        
+        with patch('dteg.orchestration.scheduler._web_db_modules', return_value=None):
+            self.scheduler._run_pipeline(self.schedule)
+        
+        record = self.scheduler.completed_executions[-1]
+        self.assertEqual(len(record.logs), 0)
+        self.assertTrue((self.scheduler.history_dir / f"{record.id}.log").exists())
+        
+        logs = self.scheduler.get_execution_logs(record.id)
+        self.assertTrue(any("파이프라인 실행 완료" in line for line in logs))
+        self.assertEqual(self.scheduler.get_execution_logs("missing-id"), [])
     
     def test_check_dependencies_with_no_dependencies(self):
         """의존성이 없는 경우"""
@@ -344,8 +960,8 @@ class TestScheduler(unittest.TestCase):
         successful_record = ExecutionRecord("some_schedule", dependency_id)
         successful_record.complete(success=True)
         
-        # 실행 기록 목록에 추가
-        self.scheduler.completed_executions.append(successful_record)
+        # 완료된 실행 기록으로 등록
+        self.scheduler._record_completion(successful_record)
         
         # 의존성 확인
         result = self.scheduler._check_dependencies(self.schedule)
@@ -364,13 +980,109 @@ class TestScheduler(unittest.TestCase):
         failed_record = ExecutionRecord("some_schedule", dependency_id)
         failed_record.complete(success=False, error_message="Error")
         
-        # 실행 기록 목록에 추가
-        self.scheduler.completed_executions.append(failed_record)
+        # 완료된 실행 기록으로 등록
+        self.scheduler._record_completion(failed_record)
         
         # 의존성 확인
         result = self.scheduler._check_dependencies(self.schedule)
         
         self.assertFalse(result)
+    
+    @patch('dteg.orchestration.scheduler.MAX_COMPLETED_EXECUTIONS', 1)
+    def test_load_history_keeps_recent_records_and_last_success(self):
+        """이력 로드 시 최근 기록만 유지하고 오래된 기록은 마지막 성공 기록만 반영"""
+        history_dir = self.scheduler.history_dir
+        old_success = ExecutionRecord("some_schedule", "dependency_pipeline")
+        old_success.complete(success=True)
+        recent_failure = ExecutionRecord("other_schedule", "other_pipeline")
+        recent_failure.complete(success=False, error_message="Error")
+        
+        for mtime, record in ((1000, old_success), (2000, recent_failure)):
+            file_path = history_dir / f"{record.id}.json"
+            file_path.write_text(json.dumps(record.to_dict()), encoding="utf-8")
+            os.utime(file_path, (mtime, mtime))
+        
+        scheduler = Scheduler(history_dir=history_dir, schedule_dir=self.scheduler.schedule_dir)
+        
+        self.assertEqual([record.id for record in scheduler.completed_executions], [recent_failure.id])
+        self.assertEqual(scheduler._last_success["dependency_pipeline"].id, old_success.id)
+        
+        # 이전 형식의 이력 파일에서 색인 파일이 생성됨
+        self.assertTrue((history_dir / "_index.jsonl").exists())
+    
+    @patch('dteg.orchestration.scheduler.MAX_COMPLETED_EXECUTIONS', 1)
+    def test_load_history_reads_index(self):
+        """이력 로드 시 개별 이력 파일 대신 색인 파일만 읽음"""
+        history_dir = self.scheduler.history_dir
+        old_success = ExecutionRecord("some_schedule", "dependency_pipeline")
+        old_success.complete(success=True)
+        recent_failure = ExecutionRecord("other_schedule", "other_pipeline")
+        recent_failure.complete(success=False, error_message="Error")
+        
+        self.scheduler._append_history_index(old_success)
+        self.scheduler._append_history_index(recent_failure)
+        
+        with patch.object(Scheduler, '_scan_history_files') as mock_scan:
+            scheduler = Scheduler(history_dir=history_dir, schedule_dir=self.scheduler.schedule_dir)
+            completed_ids = [record.id for record in scheduler.completed_executions]
+        
+        mock_scan.assert_not_called()
+        self.assertEqual(completed_ids, [recent_failure.id])
+        self.assertEqual(scheduler._last_success["dependency_pipeline"].id, old_success.id)
+    
+    @patch('dteg.orchestration.scheduler.HISTORY_INDEX_COMPACT_LINES', 1)
+    @patch('dteg.orchestration.scheduler.MAX_COMPLETED_EXECUTIONS', 1)
+    def test_load_history_compaction_deletes_execution_logs(self):
+        """색인 정리로 제외된 실행 기록의 로그 파일은 삭제하고 남은 기록의 로그 파일은 유지"""
+        history_dir = self.scheduler.history_dir
+        old_failure = ExecutionRecord("some_schedule", "some_pipeline")
+        old_failure.complete(success=False, error_message="Error")
+        recent_failure = ExecutionRecord("other_schedule", "other_pipeline")
+        recent_failure.complete(success=False, error_message="Error")
+        
+        for record in (old_failure, recent_failure):
+            self.scheduler._append_history_index(record)
+            (history_dir / f"{record.id}.log").write_text("log\n", encoding="utf-8")
+        
+        scheduler = Scheduler(history_dir=history_dir, schedule_dir=self.scheduler.schedule_dir)
+        self.assertEqual([record.id for record in scheduler.completed_executions], [recent_failure.id])
+        
+        self.assertFalse((history_dir / f"{old_failure.id}.log").exists())
+        self.assertTrue((history_dir / f"{recent_failure.id}.log").exists())
+    
+    def test_evicted_execution_log_is_deleted(self):
+        """완료 목록에서 밀려난 실행 기록의 로그 파일은 삭제"""
+        scheduler = Scheduler(history_dir=self.scheduler.history_dir, schedule_dir=self.scheduler.schedule_dir,
+                              max_history=1)
+        records = [ExecutionRecord("test_schedule", "test-pipeline") for _ in range(2)]
+        for record in records:
+            record._log("failed")
+            record.complete(success=False, error_message="Error")
+            scheduler._record_completion(record)
+            self.assertTrue(scheduler._write_execution_log(record))
+        
+        self.assertFalse((scheduler.history_dir / f"{records[0].id}.log").exists())
+        self.assertTrue((scheduler.history_dir / f"{records[1].id}.log").exists())
+    
+    @patch('dteg.orchestration.scheduler.MAX_COMPLETED_EXECUTIONS', 2)
+    def test_completed_executions_are_bounded(self):
+        """완료 실행 기록은 최근 기록만 유지하고 마지막 성공 기록은 보존"""
+        scheduler = Scheduler(history_dir=self.scheduler.history_dir, schedule_dir=self.scheduler.schedule_dir)
+        
+        successful_record = ExecutionRecord("some_schedule", "dependency_pipeline")
+        successful_record.complete(success=True)
+        scheduler._record_completion(successful_record)
+        
+        for _ in range(3):
+            record = ExecutionRecord("other_schedule", "other_pipeline")
+            record.complete(success=False, error_message="Error")
+            scheduler._record_completion(record)
+        
+        self.assertEqual(len(scheduler.completed_executions), 2)
+        self.assertNotIn(successful_record, scheduler.completed_executions)
+        
+        self.schedule.dependencies = ["dependency_pipeline"]
+        self.assertTrue(scheduler._check_dependencies(self.schedule))
 
 
 if __name__ == "__main__":
@@ -61,16 +61,16 @@ pipeline:
         schedule_id = scheduler.add_schedule(schedule_config)
         
         # 스케줄 파일이 생성되었는지 확인
-        schedule_file = self.test_schedule_dir / "schedules.json"
+        schedule_file = self.test_schedule_dir / f"{schedule_id}.json"
         self.assertTrue(schedule_file.exists())
         
         # 파일 내용 확인
         with open(schedule_file, 'r') as f:
-            schedules_data = json.load(f)
+            schedule_data = json.load(f)
         
-        self.assertIn(schedule_id, schedules_data)
-        self.assertEqual(schedules_data[schedule_id]["cron_expression"], "0 8 * * *")
-        self.assertEqual(schedules_data[schedule_id]["enabled"], True)
+        self.assertEqual(schedule_data["id"], schedule_id)
+        self.assertEqual(schedule_data["cron_expression"], "0 8 * * *")
+        self.assertEqual(schedule_data["enabled"], True)
         
         # 새 스케줄러 인스턴스 생성하여 로드 테스트
         scheduler2 = Scheduler(
@@ -112,12 +112,12 @@ pipeline:
         self.assertTrue(updated)
         
         # 파일 내용 확인
-        schedule_file = self.test_schedule_dir / "schedules.json"
+        schedule_file = self.test_schedule_dir / f"{schedule_id}.json"
         with open(schedule_file, 'r') as f:
-            schedules_data = json.load(f)
+            schedule_data = json.load(f)
         
-        self.assertEqual(schedules_data[schedule_id]["cron_expression"], "0 12 * * *")
-        self.assertEqual(schedules_data[schedule_id]["enabled"], False)
+        self.assertEqual(schedule_data["cron_expression"], "0 12 * * *")
+        self.assertEqual(schedule_data["enabled"], False)
         
         # 새 스케줄러 인스턴스 생성하여 로드 테스트
         scheduler2 = Scheduler(
@@ -159,13 +159,9 @@ pipeline:
         deleted = scheduler.remove_schedule(schedule_id1)
         self.assertTrue(deleted)
         
-        # 파일 내용 확인
-        schedule_file = self.test_schedule_dir / "schedules.json"
-        with open(schedule_file, 'r') as f:
-            schedules_data = json.load(f)
-        
-        self.assertNotIn(schedule_id1, schedules_data)
-        self.assertIn(schedule_id2, schedules_data)
+        # 삭제된 스케줄의 파일만 제거되었는지 확인
+        self.assertFalse((self.test_schedule_dir / f"{schedule_id1}.json").exists())
+        self.assertTrue((self.test_schedule_dir / f"{schedule_id2}.json").exists())
         
         # 새 스케줄러 인스턴스 생성하여 로드 테스트
         scheduler2 = Scheduler(
@@ -216,8 +212,9 @@ pipeline:
     def test_load_invalid_schedule_file(self):
         """잘못된 형식의 스케줄 파일 로드 테스트"""
         # 잘못된 형식의 스케줄 파일 생성
-        schedule_file = self.test_schedule_dir / "schedules.json"
-        with open(schedule_file, 'w') as f:
+        with open(self.test_schedule_dir / "broken.json", 'w') as f:
+            f.write("invalid json")
+        with open(self.test_schedule_dir / "schedules.json", 'w') as f:
             f.write("invalid json")
         
         # 스케줄러 생성 - 잘못된 파일이더라도 예외 없이 빈 스케줄로 초기화되어야 함
@@ -249,15 +246,8 @@ pipeline:
             schedule_id = scheduler.add_schedule(schedule_config)
             schedule_ids.append(schedule_id)
         
-        # 스케줄 파일이 생성되었는지 확인
-        schedule_file = self.test_schedule_dir / "schedules.json"
-        self.assertTrue(schedule_file.exists())
-        
-        # 파일 내용 확인
-        with open(schedule_file, 'r') as f:
-            schedules_data = json.load(f)
-        
-        self.assertEqual(len(schedules_data), 5)
+        # 스케줄별 파일이 생성되었는지 확인
+        self.assertEqual(len(list(self.test_schedule_dir.glob("*.json"))), 5)
         
         # 새 스케줄러 인스턴스 생성하여 로드 테스트
         scheduler2 = Scheduler(
@@ -274,4 +264,33 @@ pipeline:
             loaded_schedule = next((s for s in loaded_schedules if s.id == schedule_id), None)
             self.assertIsNotNone(loaded_schedule)
             self.assertEqual(loaded_schedule.cron_expression, f"0 {i+8} * * *")
-            self.assertEqual(loaded_schedule.enabled, i % 2 == 0) 
\ No newline at end of file
+            self.assertEqual(loaded_schedule.enabled, i % 2 == 0) 
+    
+    def test_load_legacy_schedules_file(self):
+        """이전 버전의 schedules.json 파일이 개별 파일로 옮겨지는지 테스트"""
+        schedule_config = ScheduleConfig(
+            pipeline_config=str(self.test_pipeline_file),
+            cron_expression="0 8 * * *",
+            enabled=True
+        )
+        legacy_file = self.test_schedule_dir / "schedules.json"
+        with open(legacy_file, 'w') as f:
+            json.dump({schedule_config.id: schedule_config.to_dict()}, f)
+        
+        scheduler = Scheduler(
+            history_dir=self.test_history_dir,
+            schedule_dir=self.test_schedule_dir
+        )
+        
+        # 스케줄이 로드되고 개별 파일로 저장되었는지 확인
+        self.assertIsNotNone(scheduler.get_schedule(schedule_config.id))
+        self.assertTrue((self.test_schedule_dir / f"{schedule_config.id}.json").exists())
+        self.assertFalse(legacy_file.exists())
+        
+        # 삭제한 스케줄이 이전 파일에서 다시 로드되지 않는지 확인
+        scheduler.remove_schedule(schedule_config.id)
+        scheduler2 = Scheduler(
+            history_dir=self.test_history_dir,
+            schedule_dir=self.test_schedule_dir
+        )
+        self.assertEqual(len(scheduler2.get_all_schedules()), 0)
@@ -7,7 +7,10 @@ import tempfile
 import os
 from pathlib import Path
 
-from dteg.orchestration.worker import CeleryTaskQueue, setup_celery, pipeline_task
+from dteg.orchestration.worker import (
+    CeleryTaskQueue, CeleryTaskManager, setup_celery, pipeline_task, TASK_SERIALIZER, ACCEPT_CONTENT,
+    ACTIVE_TASKS_KEY, handle_task_prerun, handle_task_postrun
+)
 
 
 class TestCeleryTaskQueue(unittest.TestCase):
@@ -104,6 +107,15 @@ class TestCeleryTaskQueue(unittest.TestCase):
         # 상태 확인
         self.assertEqual(status, "FAILURE")
     
+    def test_get_task_status_reuses_async_result(self):
+        """같은 태스크를 다시 조회하면 AsyncResult 객체를 재사용"""
+        self.mock_app.AsyncResult.return_value.state = "SUCCESS"
+        
+        self.task_queue.get_task_status("task-123")
+        self.task_queue.get_task_status("task-123")
+        
+        self.mock_app.AsyncResult.assert_called_once_with("task-123")
+    
     def test_cancel_task(self):
         """태스크 취소"""
         # AsyncResult 모의 객체
@@ -158,10 +170,11 @@ def test_setup_celery(mock_celery_class):
     
     # 설정 적용 확인
     mock_app.conf.update.assert_called_once_with(
-        task_serializer="pickle",
-        accept_content=["pickle"],
-        result_serializer="pickle"
+        task_serializer=TASK_SERIALIZER,
+        accept_content=ACCEPT_CONTENT,
+        result_serializer=TASK_SERIALIZER
     )
+    assert "pickle" not in ACCEPT_CONTENT
     
     # 반환값 확인
     assert app == mock_app
@@ -221,5 +234,49 @@ def test_pipeline_task_failure(mock_pipeline_class):
     }
 
 
+@patch('dteg.orchestration.worker.CeleryTaskQueue')
+@patch('dteg.orchestration.worker.run_pipeline_from_file')
+def test_task_manager_runs_config_file(mock_file_task, mock_queue_class):
+    """설정 파일 경로는 파일 로드 작업으로 제출"""
+    mock_file_task.delay.return_value.id = "task-123"
+    
+    with tempfile.TemporaryDirectory() as result_dir:
+        manager = CeleryTaskManager(result_dir=result_dir)
+        task_id = manager.run_pipeline(Path("pipeline.yaml"), "execution-123")
+    
+    assert task_id == "task-123"
+    mock_file_task.delay.assert_called_once_with("pipeline.yaml", "execution-123")
+    mock_queue_class.return_value.run_pipeline.assert_not_called()
+
+
+
+@patch('dteg.orchestration.worker.CeleryTaskQueue')
+@patch('dteg.orchestration.worker._redis_client')
+def test_task_manager_reads_active_tasks_from_redis(mock_redis_client, mock_queue_class):
+    """Redis 브로커를 사용하면 워커 조회 없이 기록된 실행 중인 작업 목록 반환"""
+    mock_redis_client.return_value.pipeline.return_value.execute.return_value = [0, [b"task-1", b"task-2"]]
+    
+    with tempfile.TemporaryDirectory() as result_dir:
+        manager = CeleryTaskManager(result_dir=result_dir, broker_url="redis://localhost:6379/0")
+        active_tasks = manager.get_active_tasks()
+    
+    assert active_tasks == ["task-1", "task-2"]
+    mock_redis_client.assert_called_once_with("redis://localhost:6379/0")
+    mock_queue_class.return_value.app.control.inspect.assert_not_called()
+
+
+@patch('dteg.orchestration.worker._active_tasks_client')
+def test_active_task_signals_update_redis(mock_active_tasks_client):
+    """작업 시작/종료 시그널에서 실행 중인 작업 목록 갱신"""
+    client = mock_active_tasks_client.return_value
+    
+    handle_task_prerun(sender=pipeline_task, task_id="task-123")
+    handle_task_postrun(sender=pipeline_task, task_id="task-123")
+    
+    assert client.zadd.call_args[0][0] == ACTIVE_TASKS_KEY
+    assert list(client.zadd.call_args[0][1]) == ["task-123"]
+    client.zrem.assert_called_once_with(ACTIVE_TASKS_KEY, "task-123")
+
+
 if __name__ == "__main__":
     unittest.main() 
\ No newline at end of file
@@ -312,16 +312,16 @@ pipeline:
         schedule_id = scheduler.add_schedule(schedule_config)
         
         # 스케줄 파일이 생성되었는지 확인
-        schedule_file = self.test_schedule_dir / "schedules.json"
+        schedule_file = self.test_schedule_dir / f"{schedule_id}.json"
         assert schedule_file.exists()
         
         # 파일 내용 확인
         with open(schedule_file, 'r') as f:
-            schedules_data = json.load(f)
+            schedule_data = json.load(f)
         
-        assert schedule_id in schedules_data
-        assert schedules_data[schedule_id]["cron_expression"] == "0 8 * * *"
-        assert schedules_data[schedule_id]["enabled"] == True
+        assert schedule_data["id"] == schedule_id
+        assert schedule_data["cron_expression"] == "0 8 * * *"
+        assert schedule_data["enabled"] == True
         
         # 새 스케줄러 인스턴스 생성하여 로드 테스트
         scheduler2 = Scheduler(